@@ -2,8 +2,14 @@
 
 import json
 import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import UTC, datetime
+from itertools import repeat
 from pathlib import Path
+from pickle import PicklingError
 from typing import Any
 
 from rpax import __version__
@@ -14,9 +20,20 @@ from rpax.models.project import UiPathProject
 from rpax.models.workflow import WorkflowIndex
 from rpax.parser.enhanced_xaml_analyzer import EnhancedXamlAnalyzer
 from rpax.parser.xaml_analyzer import XamlAnalyzer
+from rpax.utils.jsonio import load_json_file
+from rpax.utils.xmlio import parse_xml
 
 logger = logging.getLogger(__name__)
 
+# Projects with fewer workflows are not worth the process pool start-up cost
+_MIN_PARALLEL_WORKFLOWS = 16
+
+# Positional counters at the end of each nodeId component, e.g. "Sequence_2_7"
+_COUNTER_SUFFIX_PATTERN = re.compile(r"(?:_\d+)+(?=/|$)")
+
+# Substrings marking an invocation target as an expression rather than a path
+_DYNAMIC_TARGET_INDICATORS = ("{", "}", "[", "]", "Path.Combine", "+")
+
 
 def _snake_to_camel(name: str) -> str:
     """Convert a single snake_case identifier to camelCase."""
@@ -49,12 +66,9 @@ def _node_id_to_activity_path(node_id: str) -> str:
         "Activity/Sequence/InvokeWorkflowFile_7"  → "Activity/Sequence/InvokeWorkflowFile"
         "Activity/Sequence_2/If_5"                → "Activity/Sequence/If"
     """
-    import re
-
-    parts = node_id.split("/")
     # Strip ALL trailing _N suffixes (sibling index + global counter may stack)
-    cleaned = [re.sub(r"(_\d+)+$", "", part) for part in parts]
-    return "/".join(cleaned)
+    # from every component in one pass over the whole id
+    return _COUNTER_SUFFIX_PATTERN.sub("", node_id)
 
 
 class ArtifactGenerator:
@@ -349,10 +363,7 @@ class ArtifactGenerator:
         """Resolve target workflow path to workflow ID using proper workflow lookup."""
         try:
             # For dynamic invocations, return the expression as-is
-            if any(
-                indicator in target_path
-                for indicator in ["{", "}", "[", "]", "Path.Combine", "+"]
-            ):
+            if any(indicator in target_path for indicator in _DYNAMIC_TARGET_INDICATORS):
                 return f"dynamic:{target_path}"
 
             # Normalize the target path to forward slashes for consistent comparison
@@ -429,12 +440,10 @@ class ArtifactGenerator:
         summary_file = self.output_dir / "summary.md"
 
         # Read manifest for summary data
-        with open(artifacts["manifest"], encoding="utf-8") as f:
-            manifest_data = json.load(f)
+        manifest_data = load_json_file(artifacts["manifest"])
 
         # Read workflow index for details
-        with open(artifacts["workflow_index"], encoding="utf-8") as f:
-            index_data = json.load(f)
+        index_data = load_json_file(artifacts["workflow_index"])
 
         summary_content = self._build_summary_markdown(manifest_data, index_data)
 
@@ -547,164 +556,219 @@ class ArtifactGenerator:
         metrics_dir.mkdir(parents=True, exist_ok=True)
         paths_dir.mkdir(parents=True, exist_ok=True)
 
-        # Choose analyzer based on configuration
+        workflows = workflow_index.workflows
+        workers = min(os.cpu_count() or 1, len(workflows))
         if self.config.parser.use_enhanced:
-            analyzer = EnhancedXamlAnalyzer(
-                expression_language=getattr(self, "_expression_language", "VisualBasic")
-            )
             logger.debug(
                 f"Using enhanced XAML parser for {workflow_index.total_workflows} workflows"
             )
         else:
-            analyzer = XamlAnalyzer()
             logger.debug(
                 f"Using legacy XAML parser for {workflow_index.total_workflows} workflows"
             )
 
-        for workflow in workflow_index.workflows:
+        # Workflows are independent and extraction is CPU-bound, so large projects are
+        # spread across processes; each worker builds its own analyzer
+        if len(workflows) >= _MIN_PARALLEL_WORKFLOWS and workers > 1:
             try:
-                workflow_path = project_root / workflow.relative_path
-                workflow_id = workflow.workflow_id.replace("\\", "/")
-
-                logger.debug(f"Processing activities for {workflow_id}")
-
-                # Parse ONCE — share the root element across all analyzers and activity instances
-                import time as _time
-
-                from defusedxml.ElementTree import fromstring as defused_fromstring
-
-                _t0 = _time.perf_counter_ns()
-                xml_bytes = workflow_path.read_bytes()
-                xml_str = xml_bytes.decode("utf-8-sig", errors="replace")
-                xml_root = defused_fromstring(xml_str)
-                _parse_ms = (_time.perf_counter_ns() - _t0) / 1e6
-                logger.trace(  # type: ignore[attr-defined]
-                    "[%s] parsed %.1f KB in %.1fms",
-                    workflow_id,
-                    len(xml_bytes) / 1024,
-                    _parse_ms,
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for artifacts in executor.map(
+                        self._generate_workflow_activities,
+                        workflows,
+                        repeat(project_root),
+                        chunksize=max(1, len(workflows) // (workers * 4)),
+                    ):
+                        activities_artifacts.update(artifacts)
+                workflows = []
+            except (OSError, BrokenProcessPool, PicklingError) as e:
+                logger.warning(
+                    f"Parallel activity extraction unavailable, continuing serially: {e}"
                 )
+                activities_artifacts.clear()
 
-                # Extract activity tree
-                _t1 = _time.perf_counter_ns()
-                activity_tree = analyzer.extract_activity_tree(
-                    workflow_path, root=xml_root
-                )
-                logger.trace(  # type: ignore[attr-defined]
-                    "[%s] extract_activity_tree %.1fms",
-                    workflow_id,
-                    (_time.perf_counter_ns() - _t1) / 1e6,
+        if workflows:
+            analyzer = self._create_activity_analyzer()
+            for workflow in workflows:
+                activities_artifacts.update(
+                    self._generate_workflow_activities(workflow, project_root, analyzer)
                 )
-                if activity_tree:
-                    # Generate activities.tree/<wfId>.json
-                    tree_file = activities_tree_dir / f"{workflow_id}.json"
-                    # Ensure parent directory exists for nested workflows
-                    tree_file.parent.mkdir(parents=True, exist_ok=True)
-                    tree_data = self._serialize_activity_tree(activity_tree)
 
-                    with open(tree_file, "w", encoding="utf-8") as f:
-                        json.dump(tree_data, f, indent=2)
+        logger.debug(f"Generated {len(activities_artifacts)} activities artifacts")
+        return activities_artifacts
 
-                    activities_artifacts[f"activities_tree_{workflow_id}"] = tree_file
+    def _create_activity_analyzer(self) -> EnhancedXamlAnalyzer | XamlAnalyzer:
+        """Create the XAML analyzer selected by the parser configuration."""
+        if self.config.parser.use_enhanced:
+            return EnhancedXamlAnalyzer(
+                expression_language=getattr(self, "_expression_language", "VisualBasic")
+            )
+        return XamlAnalyzer()
 
-                # NEW: Generate activities.instances/<wfId>.json (ADR-009 ActivityInstance)
-                instances_artifact = self._generate_activity_instances(
-                    workflow, xml_str, xml_root, workflow_id
-                )
-                if instances_artifact:
-                    activities_artifacts[f"activities_instances_{workflow_id}"] = (
-                        instances_artifact
-                    )
+    def _generate_workflow_activities(
+        self,
+        workflow,
+        project_root: Path,
+        analyzer: EnhancedXamlAnalyzer | XamlAnalyzer | None = None,
+    ) -> dict[str, Path]:
+        """Generate the activities artifacts of a single workflow.
 
-                # Extract control flow
-                _t2 = _time.perf_counter_ns()
-                control_flow = analyzer.extract_control_flow(
-                    workflow_path, root=xml_root
-                )
-                logger.trace(  # type: ignore[attr-defined]
-                    "[%s] extract_control_flow %.1fms",
-                    workflow_id,
-                    (_time.perf_counter_ns() - _t2) / 1e6,
-                )
-                if control_flow:
-                    # Generate activities.cfg/<wfId>.jsonl
-                    cfg_file = activities_cfg_dir / f"{workflow_id}.jsonl"
-                    cfg_file.parent.mkdir(parents=True, exist_ok=True)
-
-                    with open(cfg_file, "w", encoding="utf-8") as f:
-                        for edge in control_flow.edges:
-                            edge_data = {
-                                "from": edge.from_node_id,
-                                "to": edge.to_node_id,
-                                "type": edge.edge_type,
-                                "condition": edge.condition,
-                            }
-                            f.write(json.dumps(edge_data) + "\n")
+        Args:
+            workflow: Workflow object from workflow index
+            project_root: Root directory of project
+            analyzer: Analyzer to reuse; a new one is created when omitted
 
-                    activities_artifacts[f"activities_cfg_{workflow_id}"] = cfg_file
+        Returns:
+            Dict mapping artifact names to file paths
+        """
+        if analyzer is None:
+            analyzer = self._create_activity_analyzer()
 
-                # Extract resource references
-                _t3 = _time.perf_counter_ns()
-                resources = analyzer.extract_resources(workflow_path, root=xml_root)
-                logger.trace(  # type: ignore[attr-defined]
-                    "[%s] extract_resources %.1fms",
-                    workflow_id,
-                    (_time.perf_counter_ns() - _t3) / 1e6,
-                )
-                if resources:
-                    # Generate activities.refs/<wfId>.json
-                    refs_file = activities_refs_dir / f"{workflow_id}.json"
-                    refs_file.parent.mkdir(parents=True, exist_ok=True)
-                    refs_data = {
-                        "workflowId": workflow_id,
-                        "references": [
-                            {
-                                "type": ref.resource_type,
-                                "name": ref.resource_name,
-                                "value": ref.resource_value,
-                                "nodeId": ref.node_id,
-                                "property": ref.property_name,
-                                "isDynamic": ref.is_dynamic,
-                                "rawValue": ref.raw_value,
-                            }
-                            for ref in resources.references
-                        ],
-                    }
+        activities_artifacts = {}
+        activities_tree_dir = self.output_dir / "activities.tree"
+        activities_cfg_dir = self.output_dir / "activities.cfg"
+        activities_refs_dir = self.output_dir / "activities.refs"
+        metrics_dir = self.output_dir / "metrics"
 
-                    with open(refs_file, "w", encoding="utf-8") as f:
-                        json.dump(refs_data, f, indent=2)
+        try:
+            workflow_path = project_root / workflow.relative_path
+            workflow_id = workflow.workflow_id.replace("\\", "/")
 
-                    activities_artifacts[f"activities_refs_{workflow_id}"] = refs_file
+            logger.debug(f"Processing activities for {workflow_id}")
 
-                # Calculate and generate metrics
-                if activity_tree:
-                    metrics = analyzer.calculate_metrics(activity_tree)
-                    metrics_file = metrics_dir / f"{workflow_id}.json"
-                    metrics_file.parent.mkdir(parents=True, exist_ok=True)
-                    metrics_data = {
-                        "workflowId": workflow_id,
-                        "totalNodes": metrics.total_nodes,
-                        "maxDepth": metrics.max_depth,
-                        "loopCount": metrics.loop_count,
-                        "invokeCount": metrics.invoke_count,
-                        "logCount": metrics.log_count,
-                        "tryCatchCount": metrics.try_catch_count,
-                        "selectorCount": metrics.selector_count,
-                        "annotatedActivityCount": metrics.annotated_activity_count,
-                        "activityTypes": metrics.activity_types,
-                    }
+            # Parse ONCE — share the root element across all analyzers and activity instances
+            import time as _time
+
+            _t0 = _time.perf_counter_ns()
+            xml_bytes = workflow_path.read_bytes()
+            xml_str = xml_bytes.decode("utf-8-sig", errors="replace")
+            xml_root = parse_xml(xml_str)
+            _parse_ms = (_time.perf_counter_ns() - _t0) / 1e6
+            logger.trace(  # type: ignore[attr-defined]
+                "[%s] parsed %.1f KB in %.1fms",
+                workflow_id,
+                len(xml_bytes) / 1024,
+                _parse_ms,
+            )
+
+            # Extract activity tree
+            _t1 = _time.perf_counter_ns()
+            activity_tree = analyzer.extract_activity_tree(
+                workflow_path, root=xml_root, content=xml_bytes
+            )
+            logger.trace(  # type: ignore[attr-defined]
+                "[%s] extract_activity_tree %.1fms",
+                workflow_id,
+                (_time.perf_counter_ns() - _t1) / 1e6,
+            )
+            if activity_tree:
+                # Generate activities.tree/<wfId>.json
+                tree_file = activities_tree_dir / f"{workflow_id}.json"
+                # Ensure parent directory exists for nested workflows
+                tree_file.parent.mkdir(parents=True, exist_ok=True)
+                tree_data = self._serialize_activity_tree(activity_tree)
 
-                    with open(metrics_file, "w", encoding="utf-8") as f:
-                        json.dump(metrics_data, f, indent=2)
+                with open(tree_file, "w", encoding="utf-8") as f:
+                    json.dump(tree_data, f, indent=2)
 
-                    activities_artifacts[f"metrics_{workflow_id}"] = metrics_file
+                activities_artifacts[f"activities_tree_{workflow_id}"] = tree_file
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to generate activities for {workflow.relative_path}: {e}"
+            # NEW: Generate activities.instances/<wfId>.json (ADR-009 ActivityInstance)
+            instances_artifact = self._generate_activity_instances(
+                workflow, xml_str, xml_root, workflow_id
+            )
+            if instances_artifact:
+                activities_artifacts[f"activities_instances_{workflow_id}"] = (
+                    instances_artifact
                 )
 
-        logger.debug(f"Generated {len(activities_artifacts)} activities artifacts")
+            # Extract control flow
+            _t2 = _time.perf_counter_ns()
+            control_flow = analyzer.extract_control_flow(
+                workflow_path, root=xml_root
+            )
+            logger.trace(  # type: ignore[attr-defined]
+                "[%s] extract_control_flow %.1fms",
+                workflow_id,
+                (_time.perf_counter_ns() - _t2) / 1e6,
+            )
+            if control_flow:
+                # Generate activities.cfg/<wfId>.jsonl
+                cfg_file = activities_cfg_dir / f"{workflow_id}.jsonl"
+                cfg_file.parent.mkdir(parents=True, exist_ok=True)
+
+                with open(cfg_file, "w", encoding="utf-8") as f:
+                    for edge in control_flow.edges:
+                        edge_data = {
+                            "from": edge.from_node_id,
+                            "to": edge.to_node_id,
+                            "type": edge.edge_type,
+                            "condition": edge.condition,
+                        }
+                        f.write(json.dumps(edge_data) + "\n")
+
+                activities_artifacts[f"activities_cfg_{workflow_id}"] = cfg_file
+
+            # Extract resource references
+            _t3 = _time.perf_counter_ns()
+            resources = analyzer.extract_resources(workflow_path, root=xml_root)
+            logger.trace(  # type: ignore[attr-defined]
+                "[%s] extract_resources %.1fms",
+                workflow_id,
+                (_time.perf_counter_ns() - _t3) / 1e6,
+            )
+            if resources:
+                # Generate activities.refs/<wfId>.json
+                refs_file = activities_refs_dir / f"{workflow_id}.json"
+                refs_file.parent.mkdir(parents=True, exist_ok=True)
+                refs_data = {
+                    "workflowId": workflow_id,
+                    "references": [
+                        {
+                            "type": ref.resource_type,
+                            "name": ref.resource_name,
+                            "value": ref.resource_value,
+                            "nodeId": ref.node_id,
+                            "property": ref.property_name,
+                            "isDynamic": ref.is_dynamic,
+                            "rawValue": ref.raw_value,
+                        }
+                        for ref in resources.references
+                    ],
+                }
+
+                with open(refs_file, "w", encoding="utf-8") as f:
+                    json.dump(refs_data, f, indent=2)
+
+                activities_artifacts[f"activities_refs_{workflow_id}"] = refs_file
+
+            # Calculate and generate metrics
+            if activity_tree:
+                metrics = analyzer.calculate_metrics(activity_tree)
+                metrics_file = metrics_dir / f"{workflow_id}.json"
+                metrics_file.parent.mkdir(parents=True, exist_ok=True)
+                metrics_data = {
+                    "workflowId": workflow_id,
+                    "totalNodes": metrics.total_nodes,
+                    "maxDepth": metrics.max_depth,
+                    "loopCount": metrics.loop_count,
+                    "invokeCount": metrics.invoke_count,
+                    "logCount": metrics.log_count,
+                    "tryCatchCount": metrics.try_catch_count,
+                    "selectorCount": metrics.selector_count,
+                    "annotatedActivityCount": metrics.annotated_activity_count,
+                    "activityTypes": metrics.activity_types,
+                }
+
+                with open(metrics_file, "w", encoding="utf-8") as f:
+                    json.dump(metrics_data, f, indent=2)
+
+                activities_artifacts[f"metrics_{workflow_id}"] = metrics_file
+
+        except Exception as e:
+            logger.warning(
+                f"Failed to generate activities for {workflow.relative_path}: {e}"
+            )
+
         return activities_artifacts
 
     def _serialize_activity_tree(self, activity_tree) -> dict[str, Any]:
@@ -1099,8 +1163,7 @@ class ArtifactGenerator:
         """Load manifest data for call graph generation."""
         from rpax.models.manifest import ProjectManifest
 
-        with open(manifest_file, encoding="utf-8") as f:
-            manifest_data = json.load(f)
+        manifest_data = load_json_file(manifest_file)
 
         return ProjectManifest(**manifest_data)
 
@@ -1432,7 +1432,7 @@ def validate(
 
         # Output results
         if format == "json":
-            console.print(jsonlib.dumps(result.to_dict(), indent=2))
+            console.print(result.to_json_bytes(indent=True).decode("utf-8"))
         elif format == "markdown":
             console.print("# Validation Report")
             console.print(f"**Status:** {result.status.value}")
@@ -1943,7 +1943,7 @@ def schema(
             schemas = generator.generate_all_schemas()
 
             # Create validator
-            validator = ArtifactValidator(schemas)
+            validator = ArtifactValidator(schemas, model_fast_path=True)
 
             # Determine artifacts directory
             artifacts_dir = None
@@ -3494,7 +3494,7 @@ def review(
         result = framework.validate(artifacts_dir)
 
         if format == "json":
-            console.print(jsonlib.dumps(result.to_dict(), indent=2))
+            console.print(result.to_json_bytes(indent=True).decode("utf-8"))
         elif format == "summary":
             _review_output_summary(result)
         else:
@@ -160,6 +160,9 @@ class CallGraphGenerator:
         """Process invocations into workflow dependencies."""
         KIND_MAP = {"invoke": "static", "invoke-missing": "missing", "invoke-dynamic": "dynamic"}
 
+        # Callers per target as insertion-ordered dicts, so repeated calls dedupe in O(1)
+        dependents: Dict[str, Dict[str, None]] = {}
+
         for invocation in invocations:
             # Read actual invocations.jsonl schema
             from_composite = invocation.get("from", "")
@@ -200,8 +203,13 @@ class CallGraphGenerator:
 
                 # Add to target workflow's dependents (if target exists)
                 if target_id and target_id in workflows:
-                    if source_id not in workflows[target_id].dependents:
-                        workflows[target_id].dependents.append(source_id)
+                    callers = dependents.get(target_id)
+                    if callers is None:
+                        callers = dependents[target_id] = dict.fromkeys(workflows[target_id].dependents)
+                    callers[source_id] = None
+
+        for target_id, callers in dependents.items():
+            workflows[target_id].dependents = list(callers)
 
     def _find_target_workflow_id(
         self, workflows: Dict[str, WorkflowNode], target_path: str
@@ -123,25 +123,32 @@ class GraphSpec:
         rec_stack = set()
         cycles = []
 
-        def has_cycle_util(node: str, path: list[str]):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, set()):
-                if neighbor not in visited:
-                    has_cycle_util(neighbor, path.copy())
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles.append(cycle)
-
-            rec_stack.remove(node)
-
-        for node in graph:
-            if node not in visited:
-                has_cycle_util(node, [])
+        # Iterative DFS sharing one path list; avoids recursion limits and
+        # per-edge path copies on deep call chains
+        path: list[str] = []
+        for root in graph:
+            if root in visited:
+                continue
+            visited.add(root)
+            rec_stack.add(root)
+            path.append(root)
+            stack = [iter(graph[root])]
+
+            while stack:
+                for neighbor in stack[-1]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        rec_stack.add(neighbor)
+                        path.append(neighbor)
+                        stack.append(iter(graph.get(neighbor, ())))
+                        break
+                    if neighbor in rec_stack:
+                        # Found cycle
+                        cycle_start = path.index(neighbor)
+                        cycles.append(path[cycle_start:] + [neighbor])
+                else:
+                    stack.pop()
+                    rec_stack.remove(path.pop())
 
         return cycles
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityNode:
     """Represents a single activity node in a workflow."""
     node_id: str  # Stable path-like locator (sibling indices)
@@ -44,7 +44,7 @@ class ActivityNode:
         return descendants
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlFlowEdge:
     """Represents a control flow edge between activities."""
     from_node_id: str  # Source node ID
@@ -58,7 +58,7 @@ class ControlFlowEdge:
         return f"{self.from_node_id} --{self.edge_type}{condition_str}--> {self.to_node_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceReference:
     """Represents a reference to an external resource."""
     resource_type: str  # selector, asset, queue, file, url, etc.
@@ -4,6 +4,8 @@ import json
 from datetime import UTC, datetime
 from pathlib import Path
 
+from rpax.utils.jsonio import load_json_file
+
 
 class LakeIndexGenerator:
     """Generates a top-level index of all projects in a lake directory."""
@@ -16,8 +18,7 @@ class LakeIndexGenerator:
         projects = []
         for manifest_path in sorted(self.lake_root.glob("*/manifest.json")):
             try:
-                with manifest_path.open() as f:
-                    manifest = json.load(f)
+                manifest = load_json_file(manifest_path)
                 projects.append({
                     "projectSlug": manifest_path.parent.name,
                     "projectName": manifest.get("projectName"),
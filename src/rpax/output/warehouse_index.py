@@ -4,6 +4,8 @@ import json
 from datetime import UTC, datetime
 from pathlib import Path
 
+from rpax.utils.jsonio import load_json_file
+
 
 class WarehouseIndexGenerator:
     """Generates a top-level index of all records in an archive directory."""
@@ -16,8 +18,7 @@ class WarehouseIndexGenerator:
         records = []
         for manifest_path in sorted(self.warehouse_root.glob("*/manifest.json")):
             try:
-                with manifest_path.open() as f:
-                    manifest = json.load(f)
+                manifest = load_json_file(manifest_path)
                 records.append({
                     "recordId": manifest_path.parent.name,
                     "projectName": manifest.get("projectName"),
@@ -259,7 +259,7 @@ class CodedWorkflowParser:
         
         # If no Execute method, look for constructor
         for method in methods:
-            if method.name in ['Constructor', '__init__']:
+            if method.name in {'Constructor', '__init__'}:
                 return method.parameters
         
         # Return parameters from first public method
@@ -281,7 +281,7 @@ class CodedWorkflowParser:
                 if len(parts) >= 2:
                     package = f"{parts[0]}.{parts[1]}"
                     dependencies.add(package)
-            elif using in ['System', 'System.Collections.Generic', 'System.Linq', 'System.Threading.Tasks']:
+            elif using in {'System', 'System.Collections.Generic', 'System.Linq', 'System.Threading.Tasks'}:
                 # Standard .NET dependencies
                 dependencies.add('System')
         
@@ -6,6 +6,7 @@ to identify container types, branches (Then/Else/Catch), and hierarchies.
 """
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
@@ -25,16 +26,16 @@ class ContainerInfoParser:
     """Parse container information from activity paths and parent relationships."""
     
     # Container activity types that can contain other activities
-    CONTAINER_TYPES = {
+    CONTAINER_TYPES = frozenset({
         "Sequence", "If", "TryCatch", "Parallel", "Pick", "Switch", 
         "ForEach", "While", "DoWhile", "Flowchart", "State", "StateMachine"
-    }
+    })
     
     # Branch identifiers in container paths
-    CONTAINER_BRANCHES = {
+    CONTAINER_BRANCHES = frozenset({
         "Then", "Else", "Catch", "Finally", "Body", "Default", 
         "Cases", "Activities", "Triggers", "Actions"
-    }
+    })
     
     def parse_container_info(self, activity: EnhancedActivityNode, 
                            all_activities: List[EnhancedActivityNode]) -> ContainerInfo:
@@ -93,19 +94,17 @@ class ContainerInfoParser:
     def build_container_hierarchy(self, all_activities: List[EnhancedActivityNode]) -> Dict[str, List[str]]:
         """Build container hierarchy mapping container_id -> child_activity_ids."""
         hierarchy = {}
-        
+
+        # Index direct children once instead of scanning all activities per container
+        children_by_parent: Dict[str, List[str]] = defaultdict(list)
         for activity in all_activities:
-            container_info = self.parse_container_info(activity, all_activities)
-            
-            if container_info.is_container:
-                # Find all direct children of this container
-                children = []
-                for potential_child in all_activities:
-                    if potential_child.parent_id == activity.node_id:
-                        children.append(potential_child.node_id)
-                
-                hierarchy[activity.node_id] = children
-        
+            if activity.parent_id:
+                children_by_parent[activity.parent_id].append(activity.node_id)
+
+        for activity in all_activities:
+            if activity.tag in self.CONTAINER_TYPES:
+                hierarchy[activity.node_id] = list(children_by_parent.get(activity.node_id, ()))
+
         return hierarchy
     
     def get_container_statistics(self, container_id: str, 
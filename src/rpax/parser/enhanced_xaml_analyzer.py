@@ -12,12 +12,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from defusedxml.ElementTree import parse as defused_parse
+from rpax.utils.xmlio import parse_xml_file
 
 logger = logging.getLogger(__name__)
 
 # Enhanced blacklist based on gist learnings - metadata/structural elements not shown in visual designer
-BLACKLIST_TAGS = {
+BLACKLIST_TAGS = frozenset({
     # Original gist blacklist
     "Members", "HintSize", "Property", "TypeArguments", "WorkflowFileInfo", 
     "Annotation", "ViewState", "Collection", "Dictionary", "ActivityAction",
@@ -32,18 +32,28 @@ BLACKLIST_TAGS = {
     # Container edge elements (not activities themselves)
     "Then", "Else", "Catches", "Catch", "Finally", "States", "Transitions",
     "Body", "Handler", "Condition", "Default"
-}
+})
 
 # Whitelist of core visual activities that should always be included
-VISUAL_ACTIVITY_WHITELIST = {
+VISUAL_ACTIVITY_WHITELIST = frozenset({
     "Sequence", "Flowchart", "StateMachine", "TryCatch", "Parallel", 
     "ParallelForEach", "ForEach", "While", "DoWhile", "If", "Switch",
     "InvokeWorkflowFile", "Assign", "Delay", "LogMessage", "RetryScope",
     "Pick", "PickBranch", "WriteLine", "InputDialog", "MessageBox",
     "Click", "Type", "GetText", "SetText", "OpenBrowser", "NavigateTo"
-}
+})
 
-@dataclass
+# Containers shown in the designer even without a DisplayName
+VISUAL_CONTAINER_TAGS = frozenset({
+    "Sequence", "TryCatch", "Flowchart", "Parallel", "StateMachine"
+})
+
+XMLNS_ATTRIBUTE_PREFIXES = ("xmlns", "{http://www.w3.org/2000/xmlns/}")
+
+# Local name of the sap2010:Annotation.AnnotationText attribute
+ANNOTATION_KEY = "Annotation.AnnotationText"
+
+@dataclass(slots=True)
 class EnhancedActivityNode:
     """Enhanced activity node with stable IDs and visual classification."""
     node_id: str  # Stable indexed path like /Sequence[0]/If[1]/Then/Click[0]
@@ -64,6 +74,33 @@ class EnhancedActivityNode:
     annotation: str | None = None  # sap2010:Annotation.AnnotationText
 
 
+class EnhancedActivityTree:
+    """Serialized enhanced activity tree exposing the legacy ActivityTree interface."""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.root_node = data.get("rootNode")
+        self.workflow_id = data.get("workflowId", "")
+
+
+def _collect_tree_nodes(root_node: dict | None) -> tuple[list[dict], int]:
+    """Collect serialized tree nodes in pre-order along with the tree depth."""
+    nodes = []
+    max_depth = 0
+    stack = [(root_node, 1)]
+    while stack:
+        node_data, depth = stack.pop()
+        if depth > max_depth:
+            max_depth = depth
+        if not node_data:
+            continue
+        nodes.append(node_data)
+        children = node_data.get("children")
+        if children:
+            stack.extend((child, depth + 1) for child in reversed(children))
+    return nodes, max_depth
+
+
 class EnhancedXamlAnalyzer:
     """Enhanced XAML analyzer with visual/structural distinction."""
     
@@ -80,10 +117,8 @@ class EnhancedXamlAnalyzer:
         """
         try:
             self.current_workflow_id = xaml_path.stem
-            self.sibling_counters = {}
             
-            tree = defused_parse(str(xaml_path))
-            root = tree.getroot()
+            root = parse_xml_file(xaml_path)
             
             # Extract workflow-level metadata
             workflow_metadata = self._extract_workflow_metadata(root)
@@ -109,8 +144,8 @@ class EnhancedXamlAnalyzer:
         
         # Extract variables
         for var_elem in root.iter():
-            tag = self._get_local_tag(var_elem)
-            if tag == "Variable":
+            tag = var_elem.tag
+            if tag == "Variable" or tag.endswith("}Variable"):
                 var_data = {
                     "name": var_elem.get("Name", ""),
                     "type": var_elem.get("x:TypeArguments", ""),
@@ -127,43 +162,49 @@ class EnhancedXamlAnalyzer:
     def _extract_visual_activities(self, elem: ET.Element, parent_path: str = "", 
                                  depth: int = 0, parent_id: str | None = None, 
                                  parent_elem: ET.Element | None = None) -> list[EnhancedActivityNode]:
-        """Recursively extract visual activities using proven gist approach with stable indexed paths."""
-        tag = self._get_local_tag(elem)
-        
+        """Extract visual activities in document order using proven gist approach with stable indexed paths.
+
+        Walks the tree with an explicit stack rather than recursion, so deeply
+        nested workflows cannot hit the recursion limit. Sibling counters are
+        keyed by element identity, so they are only valid for one walk and are
+        dropped once it finishes.
+        """
         results = []
-        
-        # Determine if this element should be treated as a visual activity (using gist logic)
-        is_visual = self._is_visual_activity(elem, tag)
-        
-        # Build hierarchical path (all elements contribute to path, like original gist)
-        current_path = f"{parent_path}/{tag}" if parent_path else tag
-        
-        if is_visual:
-            # Generate stable indexed node ID like /Sequence[0]/If[1]/Then/Click[0]
-            node_id = self._generate_stable_node_id(elem, parent_path, tag, parent_elem)
-            
-            # Create enhanced activity node
-            activity_node = self._create_activity_node(
-                elem, tag, node_id, current_path, depth, parent_id
-            )
-            results.append(activity_node)
-            
-            # Set parent for children - use node_id for visual parent
-            parent_for_children = node_id
-        else:
-            # Non-visual element - pass through parent ID
-            parent_for_children = parent_id
-        
-        # All elements contribute to path (like original gist)
-        path_for_children = current_path
-        
-        # Process children (simple recursion like in gist)
-        for child_elem in elem:
-            child_activities = self._extract_visual_activities(
-                child_elem, path_for_children, depth + 1, parent_for_children, elem
+        self.sibling_counters = {}
+
+        # Frames: (element, parent path, depth, visual parent id, parent element)
+        stack = [(elem, parent_path, depth, parent_id, parent_elem)]
+        while stack:
+            elem, parent_path, depth, parent_id, parent_elem = stack.pop()
+            tag = self._get_local_tag(elem)
+
+            # Determine if this element should be treated as a visual activity (using gist logic)
+            is_visual = self._is_visual_activity(elem, tag)
+            if not is_visual and not len(elem):
+                # Structural leaf: yields no node and has no children to pass a path to
+                continue
+
+            # Build hierarchical path (all elements contribute to path, like original gist)
+            current_path = f"{parent_path}/{tag}" if parent_path else tag
+
+            if is_visual:
+                # Generate stable indexed node ID like /Sequence[0]/If[1]/Then/Click[0]
+                node_id = self._generate_stable_node_id(elem, parent_path, tag, parent_elem)
+
+                # Create enhanced activity node
+                results.append(self._create_activity_node(
+                    elem, tag, node_id, current_path, depth, parent_id
+                ))
+
+                # Children hang off this node; non-visual elements pass their parent through
+                parent_id = node_id
+
+            # Push children reversed so they are visited in document order
+            stack.extend(
+                (child, current_path, depth + 1, parent_id, elem) for child in reversed(elem)
             )
-            results.extend(child_activities)
-        
+
+        self.sibling_counters = {}
         return results
     
     def _generate_stable_node_id(self, elem: ET.Element, parent_path: str, tag: str,
@@ -189,9 +230,7 @@ class EnhancedXamlAnalyzer:
     def _is_visual_activity(self, elem: ET.Element, tag: str) -> bool:
         """Visual activity detection using exact gist logic."""
         return tag not in BLACKLIST_TAGS and (
-            "DisplayName" in elem.attrib or tag in {
-                "Sequence", "TryCatch", "Flowchart", "Parallel", "StateMachine"
-            }
+            "DisplayName" in elem.attrib or tag in VISUAL_CONTAINER_TAGS
         )
     
     def _create_activity_node(self, elem: ET.Element, tag: str, node_id: str, 
@@ -205,10 +244,10 @@ class EnhancedXamlAnalyzer:
         attributes = {}
         
         for attr_name, attr_value in elem.attrib.items():
-            attr_local = attr_name.split('}')[-1] if '}' in attr_name else attr_name
+            attr_local = attr_name.rpartition('}')[2]
             
             # Skip xmlns declarations
-            if attr_name.startswith(('xmlns', '{http://www.w3.org/2000/xmlns/}')):
+            if attr_name.startswith(XMLNS_ATTRIBUTE_PREFIXES):
                 continue
                 
             attributes[attr_local] = attr_value
@@ -221,7 +260,6 @@ class EnhancedXamlAnalyzer:
             }
         
         # Lift annotation into dedicated field and remove from generic dicts
-        ANNOTATION_KEY = "Annotation.AnnotationText"
         annotation_text = attributes.pop(ANNOTATION_KEY, None)
         properties.pop(ANNOTATION_KEY, None)
 
@@ -251,7 +289,7 @@ class EnhancedXamlAnalyzer:
     
     def _get_local_tag(self, elem: ET.Element) -> str:
         """Extract local tag name without namespace."""
-        return elem.tag.rsplit('}', 1)[-1]
+        return elem.tag.rpartition('}')[2]
     
     def _is_expression_value(self, value: str) -> bool:
         """Detect if attribute value is VB.NET/C# expression."""
@@ -299,12 +337,13 @@ class EnhancedXamlAnalyzer:
         # For now, assume literal paths are valid
         return "invoke"
     
-    def extract_activity_tree(self, xaml_path: Path, root: ET.Element | None = None):
+    def extract_activity_tree(self, xaml_path: Path, root: ET.Element | None = None, content: bytes | None = None):
         """Bridge method to provide compatibility with legacy analyzer interface.
 
         Args:
             xaml_path: Path to XAML workflow file
             root: Optional pre-parsed XML root element (skips file read when provided)
+            content: Raw file bytes, accepted for parity with the legacy analyzer
 
         Returns ActivityTree-like structure compatible with existing artifact generation.
         """
@@ -314,7 +353,6 @@ class EnhancedXamlAnalyzer:
 
         if root is not None:
             self.current_workflow_id = xaml_path.stem
-            self.sibling_counters = {}
             metadata = self._extract_workflow_metadata(root)
             visual_activities = self._extract_visual_activities(root)
         else:
@@ -329,13 +367,6 @@ class EnhancedXamlAnalyzer:
         tree_json = self.generate_activity_tree_json(visual_activities, metadata)
         logger.debug("generate_activity_tree_json completed")
         
-        # Create a simple object with the expected interface
-        class EnhancedActivityTree:
-            def __init__(self, data):
-                self.data = data
-                self.root_node = data.get("rootNode")
-                self.workflow_id = data.get("workflowId", "")
-        
         return EnhancedActivityTree(tree_json)
         
     def extract_control_flow(self, xaml_path: Path, root: ET.Element | None = None):
@@ -357,44 +388,15 @@ class EnhancedXamlAnalyzer:
         if not activity_tree or not hasattr(activity_tree, 'data'):
             return metrics
             
-        # Get all nodes from the enhanced activity tree structure
+        # Get all nodes and the depth of the enhanced activity tree structure
         tree_data = activity_tree.data
-        all_nodes = []
-        
-        def collect_nodes(node_data):
-            """Recursively collect all nodes from tree structure."""
-            if not node_data:
-                return
-                
-            all_nodes.append(node_data)
-            
-            # Process children if they exist
-            if "children" in node_data:
-                for child in node_data["children"]:
-                    collect_nodes(child)
-        
-        # Start collection from root
+        all_nodes, max_depth = [], 0
         if "rootNode" in tree_data:
-            collect_nodes(tree_data["rootNode"])
-        
+            all_nodes, max_depth = _collect_tree_nodes(tree_data["rootNode"])
+
         # Calculate basic metrics
         metrics.total_nodes = len(all_nodes)
-        
-        # Calculate max depth
-        def calculate_depth(node_data):
-            """Calculate maximum depth of tree."""
-            if not node_data or "children" not in node_data:
-                return 1
-            
-            max_child_depth = 0
-            for child in node_data["children"]:
-                child_depth = calculate_depth(child)
-                max_child_depth = max(max_child_depth, child_depth)
-            
-            return 1 + max_child_depth
-        
-        if "rootNode" in tree_data:
-            metrics.max_depth = calculate_depth(tree_data["rootNode"])
+        metrics.max_depth = max_depth
         
         # Count activity types and specific patterns
         for node in all_nodes:
@@ -403,11 +405,11 @@ class EnhancedXamlAnalyzer:
             
             # Count specific activity patterns based on tag
             tag_lower = activity_type.lower()
-            if any(loop_type in tag_lower for loop_type in ["loop", "while", "foreach"]):
+            if "loop" in tag_lower or "while" in tag_lower or "foreach" in tag_lower:
                 metrics.loop_count += 1
             elif "invokeworkflowfile" in tag_lower:
                 metrics.invoke_count += 1
-            elif any(log_type in tag_lower for log_type in ["writeline", "logmessage"]):
+            elif "writeline" in tag_lower or "logmessage" in tag_lower:
                 metrics.log_count += 1
             elif "trycatch" in tag_lower:
                 metrics.try_catch_count += 1
@@ -435,7 +437,7 @@ class EnhancedXamlAnalyzer:
 
         def serialize_node(node: EnhancedActivityNode) -> dict:
             # O(1) lookup via pre-built index
-            children = children_by_parent.get(node.node_id, [])
+            children = children_by_parent.get(node.node_id, ())
 
             return {
                 "nodeId": node.node_id,
@@ -483,7 +485,7 @@ class EnhancedXamlAnalyzer:
             "rootNode": root_node,
 
             # Enhanced metadata
-            "totalVisualActivities": len([a for a in visual_activities if a.is_visual]),
+            "totalVisualActivities": sum(1 for a in visual_activities if a.is_visual),
             "parseMethod": "enhanced-visual-detection"
         }
 
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Dict, List, Set
 from xml.etree.ElementTree import Element, parse as xml_parse
 
-from defusedxml.ElementTree import parse as defused_parse
+from rpax.utils.xmlio import parse_xml_file
 
 
 class NamespaceAnalyzer:
@@ -20,7 +20,7 @@ class NamespaceAnalyzer:
     }
     
     # Standard .NET/XAML namespaces that should be ignored
-    SYSTEM_NAMESPACES = {
+    SYSTEM_NAMESPACES = frozenset({
         "http://schemas.microsoft.com/winfx/2006/xaml",
         "http://schemas.microsoft.com/netfx/2009/xaml/activities", 
         "http://schemas.microsoft.com/winfx/2006/xaml/presentation",
@@ -32,7 +32,7 @@ class NamespaceAnalyzer:
         "clr-namespace:System.Collections",
         "clr-namespace:System.Collections.Generic",
         "clr-namespace:Microsoft.VisualBasic",
-    }
+    })
 
     def __init__(self):
         """Initialize namespace analyzer."""
@@ -56,8 +56,7 @@ class NamespaceAnalyzer:
             
             try:
                 # Use defused XML for security
-                tree = defused_parse(xaml_path)
-                root = tree.getroot()
+                root = parse_xml_file(xaml_path)
                 
                 # Extract namespace declarations from root element
                 for attr_name, attr_value in root.attrib.items():
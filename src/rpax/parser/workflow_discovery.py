@@ -156,8 +156,7 @@ class EnhancedWorkflowDiscovery(XamlDiscovery):
         """Generate content hash for a file."""
         try:
             with open(file_path, "rb") as f:
-                content = f.read()
-            return hashlib.sha256(content).hexdigest()[:12]
+                return hashlib.file_digest(f, "sha256").hexdigest()[:12]
         except Exception as e:
             logger.warning(f"Failed to generate content hash for {file_path}: {e}")
             return "unknown-hash"
@@ -4,15 +4,14 @@ This module implements actual XAML parsing to extract workflow invocations,
 arguments, and activity details according to ADR-001 pattern-matching approach.
 """
 
+import hashlib
 import logging
 import re
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
-from defusedxml.ElementTree import parse as defused_parse
-
 from rpax.models.activity import (
     ActivityNode,
     ActivityTree,
@@ -21,11 +20,39 @@ from rpax.models.activity import (
     WorkflowResources,
 )
 from rpax.utils.paths import normalize_path
+from rpax.utils.xmlio import parse_xml_file
 
 logger = logging.getLogger(__name__)
 
+# Known activity types recognised even without a DisplayName
+ACTIVITY_TYPES = frozenset({
+    "Sequence", "Flowchart", "If", "While", "ForEach", "DoWhile",
+    "TryCatch", "Assign", "WriteLine", "InvokeWorkflowFile",
+    "Click", "Type", "GetText", "Delay", "LogMessage"
+})
+
+LOOP_ACTIVITY_TYPES = frozenset({"While", "DoWhile", "ForEach"})
+
+# Characters and calls that mark a WorkflowFileName as a runtime expression
+DYNAMIC_PATH_PATTERN = re.compile(r"[{}\[\]+]|Path\.Combine")
+
+# Operators that distinguish a bracketed expression from a static reference
+DYNAMIC_EXPRESSION_PATTERN = re.compile(r"""[+&"']|Path\.|IO\.|System\.""")
+
+# Dynamic invocations found in element text
+PATH_COMBINE_PATTERN = re.compile(r"Path\.Combine\([^)]+\.xaml[^)]*\)", re.IGNORECASE)
+BRACKET_EXPRESSION_PATTERN = re.compile(r"\[([^]]*\.xaml[^]]*)\]", re.IGNORECASE)
 
-@dataclass
+# File extensions that make element text a file reference
+FILE_REFERENCE_PATTERN = re.compile(r"\.(?:xaml|json|txt|csv)")
+
+# Clark-notation name of the sap2010:WorkflowViewState.IdRef attribute
+VIEW_STATE_ID_ATTRIBUTE = (
+    "{http://schemas.microsoft.com/netfx/2010/xaml/activities/presentation}WorkflowViewState.IdRef"
+)
+
+
+@dataclass(slots=True)
 class InvocationData:
     """Data about a workflow invocation found in XAML."""
     target_path: str
@@ -35,7 +62,7 @@ class InvocationData:
     activity_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArgumentData:
     """Data about workflow arguments."""
     name: str
@@ -48,7 +75,7 @@ class XamlAnalyzer:
     """Analyzes XAML workflow files to extract invocations and structure."""
 
     def __init__(self):
-        self.namespace_patterns = self._build_namespace_patterns()
+        self._project_roots: dict[Path, Path] = {}
 
     def analyze_workflow(self, xaml_path: Path) -> tuple[list[InvocationData], list[ArgumentData]]:
         """Analyze XAML file and extract invocations and arguments.
@@ -63,14 +90,14 @@ class XamlAnalyzer:
 
         try:
             # Parse XAML safely using defusedxml
-            tree = defused_parse(xaml_path)
-            root = tree.getroot()
+            root = parse_xml_file(xaml_path)
+            found = self._collect_elements_by_local_name(root, ("InvokeWorkflowFile", "Members"))
 
             # Extract invocations
-            invocations = self._extract_invocations(root, xaml_path)
+            invocations = self._extract_invocations(root, xaml_path, found["InvokeWorkflowFile"])
 
             # Extract arguments
-            arguments = self._extract_arguments(root)
+            arguments = self._extract_arguments(root, found["Members"])
 
             logger.debug(f"Found {len(invocations)} invocations and {len(arguments)} arguments")
             return invocations, arguments
@@ -79,12 +106,15 @@ class XamlAnalyzer:
             logger.warning(f"Failed to analyze XAML {xaml_path}: {e}")
             return [], []
 
-    def extract_activity_tree(self, xaml_path: Path, root: ET.Element | None = None) -> ActivityTree | None:
+    def extract_activity_tree(
+        self, xaml_path: Path, root: ET.Element | None = None, content: bytes | None = None
+    ) -> ActivityTree | None:
         """Extract complete activity tree from XAML workflow.
 
         Args:
             xaml_path: Path to XAML workflow file
             root: Optional pre-parsed XML root element (skips file read when provided)
+            content: Optional raw file bytes, hashed instead of re-reading the file
 
         Returns:
             ActivityTree with full activity structure, or None if parsing fails
@@ -94,23 +124,29 @@ class XamlAnalyzer:
         try:
             # Parse XAML safely using defusedxml (only if root not pre-provided)
             if root is None:
-                tree = defused_parse(xaml_path)
-                root = tree.getroot()
+                root = parse_xml_file(xaml_path)
 
             # Calculate content hash
-            with open(xaml_path, "rb") as f:
-                import hashlib
-                content_hash = hashlib.sha256(f.read()).hexdigest()
+            if content is not None:
+                content_hash = hashlib.sha256(content).hexdigest()
+            else:
+                with open(xaml_path, "rb") as f:
+                    content_hash = hashlib.file_digest(f, "sha256").hexdigest()
 
             # Extract workflow ID (relative path)
             workflow_id = xaml_path.name  # For now, just use filename
 
+            # Collect the elements of every lookup below in one tree walk
+            found = self._collect_elements_by_local_name(
+                root, ("Variable", "Members", "TextExpression.NamespacesForImplementation")
+            )
+
             # Extract variables and arguments
-            variables = self._extract_variables(root)
-            arguments = [arg.__dict__ for arg in self._extract_arguments(root)]
+            variables = self._extract_variables(root, found["Variable"])
+            arguments = [asdict(arg) for arg in self._extract_arguments(root, found["Members"])]
 
             # Extract imports
-            imports = self._extract_imports(root)
+            imports = self._extract_imports(root, found["TextExpression.NamespacesForImplementation"])
 
             # Extract root activity node
             root_activity = self._extract_activity_node(root, "root")
@@ -147,8 +183,7 @@ class XamlAnalyzer:
         try:
             # Parse XAML safely using defusedxml (only if root not pre-provided)
             if root is None:
-                tree = defused_parse(xaml_path)
-                root = tree.getroot()
+                root = parse_xml_file(xaml_path)
 
             workflow_id = xaml_path.name
             control_flow = WorkflowControlFlow(workflow_id=workflow_id)
@@ -178,8 +213,7 @@ class XamlAnalyzer:
         try:
             # Parse XAML safely using defusedxml (only if root not pre-provided)
             if root is None:
-                tree = defused_parse(xaml_path)
-                root = tree.getroot()
+                root = parse_xml_file(xaml_path)
 
             workflow_id = xaml_path.name
             resources = WorkflowResources(workflow_id=workflow_id)
@@ -230,12 +264,15 @@ class XamlAnalyzer:
 
         return metrics
 
-    def _extract_invocations(self, root: ET.Element, xaml_path: Path) -> list[InvocationData]:
+    def _extract_invocations(
+        self, root: ET.Element, xaml_path: Path, invoke_elements: list[ET.Element] | None = None
+    ) -> list[InvocationData]:
         """Extract InvokeWorkflowFile activities from XAML."""
         invocations = []
 
-        # Find all InvokeWorkflowFile elements (namespace-agnostic)
-        invoke_elements = self._find_elements_by_local_name(root, "InvokeWorkflowFile")
+        # Find all InvokeWorkflowFile elements (namespace-agnostic) unless already collected
+        if invoke_elements is None:
+            invoke_elements = self._find_elements_by_local_name(root, "InvokeWorkflowFile")
 
         for element in invoke_elements:
             invocation = self._analyze_invoke_element(element, xaml_path)
@@ -248,12 +285,13 @@ class XamlAnalyzer:
 
         return invocations
 
-    def _extract_arguments(self, root: ET.Element) -> list[ArgumentData]:
+    def _extract_arguments(self, root: ET.Element, members: list[ET.Element] | None = None) -> list[ArgumentData]:
         """Extract workflow arguments from XAML."""
         arguments = []
 
         # Look for x:Members section which contains arguments
-        members = self._find_elements_by_local_name(root, "Members")
+        if members is None:
+            members = self._find_elements_by_local_name(root, "Members")
 
         for member_section in members:
             # Find Property elements which represent arguments
@@ -296,59 +334,46 @@ class XamlAnalyzer:
         """Determine if invocation is direct, missing, dynamic, or coded."""
 
         # Check for dynamic paths (variables, expressions)
-        if any(indicator in workflow_file for indicator in ["{", "}", "[", "]", "Path.Combine", "+"]):
+        if DYNAMIC_PATH_PATTERN.search(workflow_file):
             return "invoke-dynamic"
 
-        # Check for coded workflows (.cs files)
+        # Check for coded workflows (.cs files); they are coded whether or not the file resolves
         if workflow_file.lower().endswith('.cs'):
-            # Try to resolve the coded workflow file
-            try:
-                current_dir = xaml_path.parent
-                possible_paths = [
-                    current_dir / workflow_file,
-                    current_dir.parent / workflow_file,
-                    # Framework folder is common for coded workflows
-                    current_dir / "Framework" / Path(workflow_file).name,
-                    current_dir.parent / "Framework" / Path(workflow_file).name,
-                ]
-
-                for path in possible_paths:
-                    if path.exists():
-                        return "invoke-coded"
-                
-                # File doesn't exist, but it's still a coded workflow reference
-                return "invoke-coded"
-            except Exception:
-                return "invoke-coded"
+            return "invoke-coded"
 
         # Try to resolve XAML path relative to current workflow
         try:
             current_dir = xaml_path.parent
-            
-            # Find project root by looking for project.json
-            project_root = current_dir
-            while project_root != project_root.parent:  # Not at filesystem root
-                if (project_root / "project.json").exists():
-                    break
-                project_root = project_root.parent
-            
-            # Try different relative paths including project root
-            possible_paths = [
-                current_dir / workflow_file,               # Relative to current workflow
-                current_dir.parent / workflow_file,        # Relative to parent directory
-                project_root / workflow_file,              # Relative to project root (for test workflows)
-                # Add more common patterns as needed
-            ]
-
-            for path in possible_paths:
-                if path.exists():
-                    return "invoke"
+
+            # Relative to current workflow, then to its parent directory
+            if (current_dir / workflow_file).exists() or (current_dir.parent / workflow_file).exists():
+                return "invoke"
+
+            # Relative to project root (for test workflows)
+            if (self._find_project_root(current_dir) / workflow_file).exists():
+                return "invoke"
 
             return "invoke-missing"
 
         except Exception:
             return "invoke-missing"
 
+    def _find_project_root(self, directory: Path) -> Path:
+        """Find the nearest ancestor of directory containing project.json.
+
+        Falls back to the filesystem root. Results are memoized per directory,
+        since every invocation in a workflow resolves from the same place.
+        """
+        project_root = self._project_roots.get(directory)
+        if project_root is None:
+            project_root = directory
+            while project_root != project_root.parent:  # Not at filesystem root
+                if (project_root / "project.json").exists():
+                    break
+                project_root = project_root.parent
+            self._project_roots[directory] = project_root
+        return project_root
+
     def _extract_invoke_arguments(self, element: ET.Element) -> dict[str, str]:
         """Extract arguments passed to InvokeWorkflowFile."""
         arguments = {}
@@ -393,24 +418,10 @@ class XamlAnalyzer:
         """
         dynamic_invocations = []
 
-        # Get static invoke targets to exclude from dynamic detection
-        static_targets = set()
-        invoke_elements = self._find_elements_by_local_name(root, "InvokeWorkflowFile")
-        for element in invoke_elements:
-            workflow_file = element.get("WorkflowFileName") or element.get("FileName")
-            if workflow_file:
-                # Add full path
-                static_targets.add(workflow_file.lower())
-                static_targets.add(normalize_path(workflow_file).lower())
-                # Add just filename (for Variable Reference matches)
-                filename_only = Path(workflow_file).name.lower()
-                static_targets.add(filename_only)
-
         text_content = ET.tostring(root, encoding="unicode", method="text")
 
         # Pattern for Path.Combine expressions - actual dynamic code
-        path_combine_pattern = r"Path\.Combine\([^)]+\.xaml[^)]*\)"
-        for match in re.finditer(path_combine_pattern, text_content, re.IGNORECASE):
+        for match in PATH_COMBINE_PATTERN.finditer(text_content):
             target_path = normalize_path(match.group())
             invocation = InvocationData(
                 target_path=target_path,
@@ -421,11 +432,10 @@ class XamlAnalyzer:
 
         # Pattern for variable expressions in brackets - actual VB/C# expressions
         # Look for [variableName.xaml] or [expression + ".xaml"]
-        bracket_pattern = r'\[([^]]*\.xaml[^]]*)\]'
-        for match in re.finditer(bracket_pattern, text_content, re.IGNORECASE):
+        for match in BRACKET_EXPRESSION_PATTERN.finditer(text_content):
             expression = match.group(1).strip()
             # Skip if this looks like a simple static reference
-            if not any(op in expression for op in ['+', '&', '"', "'", 'Path.', 'IO.', 'System.']):
+            if not DYNAMIC_EXPRESSION_PATTERN.search(expression):
                 # This is likely a static reference, not a dynamic expression
                 continue
                 
@@ -449,13 +459,15 @@ class XamlAnalyzer:
         prop_type = prop.get("Type", "Object")
 
         # Determine direction from attribute or name conventions
-        direction = "In"  # Default
-        if prop.get("Direction"):
-            direction = prop.get("Direction")
-        elif prop_name.lower().startswith("out_"):
-            direction = "Out"
-        elif prop_name.lower().startswith("io_"):
-            direction = "InOut"
+        direction = prop.get("Direction")
+        if not direction:
+            name_lower = prop_name.lower()
+            if name_lower.startswith("out_"):
+                direction = "Out"
+            elif name_lower.startswith("io_"):
+                direction = "InOut"
+            else:
+                direction = "In"  # Default
 
         # Extract default value
         default_value = prop.get("DefaultValue")
@@ -469,35 +481,38 @@ class XamlAnalyzer:
 
     def _find_elements_by_local_name(self, root: ET.Element, local_name: str) -> list[ET.Element]:
         """Find elements by local name, ignoring namespaces (ADR-001 pattern-matching)."""
-        elements = []
-
-        def search_recursive(element: ET.Element):
-            # Check if current element matches (local name only)
-            if element.tag.split("}")[-1] == local_name:
-                elements.append(element)
-
-            # Search children
-            for child in element:
-                search_recursive(child)
-
-        search_recursive(root)
-        return elements
-
-    def _build_namespace_patterns(self) -> dict[str, re.Pattern]:
-        """Build regex patterns for common UiPath namespaces."""
-        return {
-            "uipath_activities": re.compile(r"UiPath\.Core\.Activities", re.IGNORECASE),
-            "system_activities": re.compile(r"System\.Activities", re.IGNORECASE),
-            "invoke_workflow": re.compile(r"InvokeWorkflowFile", re.IGNORECASE),
-            "workflow_file": re.compile(r"\.xaml$", re.IGNORECASE)
-        }
-
-    def _extract_variables(self, root: ET.Element) -> list[dict[str, Any]]:
+        # Element.iter() walks the tree in C; matching the Clark-notation
+        # suffix avoids splitting every tag
+        suffix = "}" + local_name
+        return [
+            element for element in root.iter()
+            if element.tag == local_name or element.tag.endswith(suffix)
+        ]
+
+    def _collect_elements_by_local_name(
+        self, root: ET.Element, local_names: tuple[str, ...]
+    ) -> dict[str, list[ET.Element]]:
+        """Find the elements of several local names in a single tree walk.
+
+        Matches the same elements as _find_elements_by_local_name for each
+        name, without walking the tree once per name.
+        """
+        found: dict[str, list[ET.Element]] = {name: [] for name in local_names}
+        for element in root.iter():
+            matches = found.get(element.tag.rpartition("}")[2])
+            if matches is not None:
+                matches.append(element)
+        return found
+
+    def _extract_variables(
+        self, root: ET.Element, variable_elements: list[ET.Element] | None = None
+    ) -> list[dict[str, Any]]:
         """Extract workflow variables from XAML."""
         variables = []
 
         # Look for Variable elements (namespace-agnostic)
-        variable_elements = self._find_elements_by_local_name(root, "Variable")
+        if variable_elements is None:
+            variable_elements = self._find_elements_by_local_name(root, "Variable")
 
         for var_element in variable_elements:
             var_data = {
@@ -510,7 +525,7 @@ class XamlAnalyzer:
 
         return variables
 
-    def _extract_imports(self, root: ET.Element) -> list[str]:
+    def _extract_imports(self, root: ET.Element, import_elements: list[ET.Element] | None = None) -> list[str]:
         """Extract namespace imports from XAML."""
         imports = []
 
@@ -520,7 +535,8 @@ class XamlAnalyzer:
                 imports.append(f"{key[6:]} = {value}")
 
         # Look for TextExpression.NamespacesForImplementation elements
-        import_elements = self._find_elements_by_local_name(root, "TextExpression.NamespacesForImplementation")
+        if import_elements is None:
+            import_elements = self._find_elements_by_local_name(root, "TextExpression.NamespacesForImplementation")
         for import_element in import_elements:
             for child in import_element:
                 if hasattr(child, "text") and child.text:
@@ -531,7 +547,7 @@ class XamlAnalyzer:
     def _extract_activity_node(self, element: ET.Element, node_id: str, parent_id: str = None) -> ActivityNode:
         """Extract activity node from XML element."""
         # Get activity type (local name without namespace)
-        activity_type = element.tag.split("}")[-1] if "}" in element.tag else element.tag
+        activity_type = element.tag.rpartition("}")[2]
 
         # Get display name
         display_name = element.get("DisplayName", activity_type)
@@ -539,12 +555,15 @@ class XamlAnalyzer:
         # Extract all properties as a dictionary
         properties = dict(element.attrib)
 
-        # Extract activity arguments (child elements that aren't activities themselves)
+        # Split children in one pass: nested activities are walked below, the
+        # remaining property elements become activity arguments
         arguments = {}
+        activity_children = []
         for child in element:
-            child_tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-            # Skip nested activities, focus on property elements
-            if not self._is_activity_element(child):
+            if self._is_activity_element(child):
+                activity_children.append(child)
+            else:
+                child_tag = child.tag.rpartition("}")[2]
                 if child.text:
                     arguments[child_tag] = child.text.strip()
                 elif child.get("Value"):
@@ -563,34 +582,25 @@ class XamlAnalyzer:
         # Extract UiPath-specific properties
         activity_node.continue_on_error = properties.get("ContinueOnError")
         activity_node.timeout = properties.get("Timeout")
-        activity_node.view_state_id = properties.get("{http://schemas.microsoft.com/netfx/2010/xaml/activities/presentation}WorkflowViewState.IdRef")
+        activity_node.view_state_id = properties.get(VIEW_STATE_ID_ATTRIBUTE)
 
         # Extract child activities
-        child_index = 0
-        for child in element:
-            if self._is_activity_element(child):
-                child_node_id = f"{node_id}.{child_index}"
-                child_node = self._extract_activity_node(child, child_node_id, node_id)
-                activity_node.add_child(child_node)
-                child_index += 1
+        for child_index, child in enumerate(activity_children):
+            child_node_id = f"{node_id}.{child_index}"
+            child_node = self._extract_activity_node(child, child_node_id, node_id)
+            activity_node.add_child(child_node)
 
         return activity_node
 
     def _is_activity_element(self, element: ET.Element) -> bool:
         """Check if XML element represents an activity."""
-        # Simple heuristic: activities usually have DisplayName or are known activity types
-        tag = element.tag.split("}")[-1] if "}" in element.tag else element.tag
-
-        # Known activity types
-        activity_patterns = [
-            "Sequence", "Flowchart", "If", "While", "ForEach", "DoWhile",
-            "TryCatch", "Assign", "WriteLine", "InvokeWorkflowFile",
-            "Click", "Type", "GetText", "Delay", "LogMessage"
-        ]
+        # Simple heuristic: activities usually have DisplayName or are known activity types.
+        # The DisplayName lookup is cheapest and settles most activities without touching the tag.
+        if "DisplayName" in element.attrib:
+            return True
 
-        return (tag in activity_patterns or
-                element.get("DisplayName") is not None or
-                "Activity" in tag)
+        tag = element.tag.rpartition("}")[2]
+        return tag in ACTIVITY_TYPES or "Activity" in tag
 
     def _extract_control_flow_edges(self, element: ET.Element, control_flow: WorkflowControlFlow,
                                    parent_id: str, index: int = 0) -> None:
@@ -598,7 +608,7 @@ class XamlAnalyzer:
         current_id = f"{parent_id}.{index}" if parent_id != "root" else f"root.{index}"
 
         # Get activity type
-        activity_type = element.tag.split("}")[-1] if "}" in element.tag else element.tag
+        activity_type = element.tag.rpartition("}")[2]
 
         child_index = 0
         prev_child_id = None
@@ -615,7 +625,7 @@ class XamlAnalyzer:
                     # Conditional flow
                     condition = "then" if child_index == 0 else "else"
                     control_flow.add_edge(current_id, child_id, f"branch-{condition}")
-                elif activity_type in ["While", "DoWhile", "ForEach"]:
+                elif activity_type in LOOP_ACTIVITY_TYPES:
                     # Loop flow
                     control_flow.add_edge(current_id, child_id, "loop-enter")
                     control_flow.add_edge(child_id, current_id, "loop-back")
@@ -657,7 +667,7 @@ class XamlAnalyzer:
         # Check element text content
         if element.text and element.text.strip():
             text = element.text.strip()
-            if any(ext in text for ext in [".xaml", ".json", ".txt", ".csv"]):
+            if FILE_REFERENCE_PATTERN.search(text):
                 resources.add_reference("file", "text_content", text, current_id, "text")
 
         # Recursively process children
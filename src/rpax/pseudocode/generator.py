@@ -1,6 +1,7 @@
 """Pseudocode generator using enhanced XAML analysis."""
 
 import logging
+from collections import defaultdict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -127,25 +128,31 @@ class PseudocodeGenerator:
         """
         entries = []
 
-        # Find root activities (those with no parent)
-        root_activities = [act for act in activities if act.parent_id is None]
+        # Index children by parent once instead of scanning all activities per node
+        root_activities = []
+        children_by_parent: dict[str, list[EnhancedActivityNode]] = defaultdict(list)
+        for act in activities:
+            if act.parent_id is None:
+                root_activities.append(act)
+            else:
+                children_by_parent[act.parent_id].append(act)
 
         for root in root_activities:
-            entries.extend(self._process_activity_recursive(root, activities, 0))
+            entries.extend(self._process_activity_recursive(root, children_by_parent, 0))
 
         return entries
 
     def _process_activity_recursive(
         self,
         activity: EnhancedActivityNode,
-        all_activities: list[EnhancedActivityNode],
+        children_by_parent: dict[str, list[EnhancedActivityNode]],
         indent: int,
     ) -> list[PseudocodeEntry]:
         """Recursively process activity and its children.
 
         Args:
             activity: Current activity node
-            all_activities: All activity nodes for finding children
+            children_by_parent: Child activities keyed by parent node ID
             indent: Current indentation level
 
         Returns:
@@ -177,11 +184,9 @@ class PseudocodeGenerator:
         entries.append(entry)
 
         # Process children with increased indentation
-        children = [act for act in all_activities if act.parent_id == activity.node_id]
-
-        for child in children:
+        for child in children_by_parent.get(activity.node_id, ()):
             child_entries = self._process_activity_recursive(
-                child, all_activities, indent + 1
+                child, children_by_parent, indent + 1
             )
             entries.extend(child_entries)
             entry.children.extend(child_entries)
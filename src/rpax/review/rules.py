@@ -39,10 +39,9 @@ class ArgumentNamingRule(ValidationRule):
     def name(self) -> str:
         return "argument_naming"
 
-    def validate(
-        self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult
+    def validate_artifacts(
+        self, artifacts: ArtifactSet, config: RpaxConfig, result: ValidationResult
     ) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
         if not artifacts.workflows_index:
             return
 
@@ -92,10 +91,9 @@ class WorkflowSizeRule(ValidationRule):
     def name(self) -> str:
         return "workflow_size"
 
-    def validate(
-        self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult
+    def validate_artifacts(
+        self, artifacts: ArtifactSet, config: RpaxConfig, result: ValidationResult
     ) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
         if not artifacts.workflows_index:
             return
 
@@ -300,10 +298,9 @@ class OrphanWorkflowRule(ValidationRule):
     def name(self) -> str:
         return "orphan_workflows"
 
-    def validate(
-        self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult
+    def validate_artifacts(
+        self, artifacts: ArtifactSet, config: RpaxConfig, result: ValidationResult
     ) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
         if not artifacts.manifest or not artifacts.workflows_index:
             return
 
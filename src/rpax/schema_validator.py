@@ -5,13 +5,34 @@ support for all rpax artifact types, implementing versioned schema evolution.
 """
 
 import json
-from dataclasses import dataclass
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import jsonschema
 
+from rpax.utils.jsonio import load_json_file
+from rpax.utils.paths import user_cache_dir
+from rpax.utils.severity import count_severities
+
+# Compiled validators shared across ArtifactValidator instances, keyed by
+# canonical schema JSON so repeated validate_artifact_file calls reuse them
+_VALIDATOR_CACHE: dict[str, Any] = {}
+
+# Optional ijson import for streaming large artifacts
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 
 class SchemaVersion:
     """Represents a semantic version with comparison support."""
@@ -57,7 +78,7 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationIssue:
     """Represents a validation issue with context."""
 
@@ -68,63 +89,175 @@ class ValidationIssue:
     details: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of schema validation with detailed feedback."""
+    """Result of schema validation with detailed feedback.
+
+    Severity counts are computed from ``issues`` once; add further issues
+    through ``add_issue`` so the counts stay in step with the list.
+    """
 
     is_valid: bool
     schema_version: str
     issues: list[ValidationIssue]
     compatibility_info: dict[str, Any] | None = None
+    error_count: int = field(init=False, default=0)
+    warning_count: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.error_count, self.warning_count = count_severities(
+            self.issues, ValidationSeverity.ERROR, ValidationSeverity.WARNING
+        )
+
+    def add_issue(self, issue: ValidationIssue) -> None:
+        """Append an issue and keep the severity counts current."""
+        self.issues.append(issue)
+        if issue.severity is ValidationSeverity.ERROR:
+            self.error_count += 1
+        elif issue.severity is ValidationSeverity.WARNING:
+            self.warning_count += 1
 
     @property
     def has_errors(self) -> bool:
         """Check if result has any error-level issues."""
-        return any(issue.severity == ValidationSeverity.ERROR for issue in self.issues)
+        return self.error_count > 0
 
     @property
     def has_warnings(self) -> bool:
         """Check if result has any warning-level issues."""
-        return any(
-            issue.severity == ValidationSeverity.WARNING for issue in self.issues
-        )
+        return self.warning_count > 0
 
 
 class SchemaRegistry:
-    """Registry of all rpax artifact schemas with versioning support."""
+    """Registry of all rpax artifact schemas with versioning support.
 
-    def __init__(self):
+    Parsed schemas are cached on disk as a single JSON document keyed by the
+    schema files' names, sizes and mtimes. A matching cache replaces parsing
+    every schema file; a stale cache is discarded and the schema files are
+    re-parsed before the registry is used.
+    """
+
+    def __init__(self, cache_path: Path | None = None):
         self.schemas: dict[str, dict[str, dict[str, Any]]] = {}
+        self._sorted_versions: dict[
+            str, list[tuple[SchemaVersion, str, dict[str, Any]]]
+        ] = {}
         self.schema_dir = Path(__file__).parent / "schemas"
+        self.cache_path = cache_path or user_cache_dir() / "schema-registry.json"
         self._load_schemas()
 
     def _load_schemas(self):
-        """Load all schema files from the schemas directory."""
+        """Load all schemas from the disk cache or the schemas directory."""
         if not self.schema_dir.exists():
             return
 
-        for schema_file in self.schema_dir.glob("*.schema.json"):
-            try:
-                with open(schema_file, encoding="utf-8") as f:
-                    schema_data = json.load(f)
+        schema_files = sorted(self.schema_dir.glob("*.schema.json"))
+        if not schema_files:
+            return
 
-                # Extract artifact type and version from filename
-                # Format: {artifact-type}.v{version}.schema.json
-                filename = schema_file.stem.replace(".schema", "")
-                if ".v" in filename:
-                    artifact_type, version = filename.split(".v", 1)
-                else:
-                    # Legacy format without version
-                    artifact_type = filename
-                    version = "1.0.0"
+        fingerprint = self._fingerprint(schema_files)
+        cached = self._read_cache()
+        if cached is not None and cached["fingerprint"] == fingerprint:
+            self._set_schemas(cached["schemas"])
+            return
 
-                if artifact_type not in self.schemas:
-                    self.schemas[artifact_type] = {}
+        self._set_schemas(self._parse_schema_files(schema_files))
+        self._write_cache(fingerprint)
+
+    def _set_schemas(self, schemas: dict[str, dict[str, dict[str, Any]]]) -> None:
+        """Install a registry and its per-type version lists, sorted oldest first."""
+        self._sorted_versions = {
+            artifact_type: sorted(
+                (
+                    (SchemaVersion(version), version, schema)
+                    for version, schema in versions.items()
+                ),
+                key=lambda entry: entry[0],
+            )
+            for artifact_type, versions in schemas.items()
+        }
+        self.schemas = schemas
+
+    def _parse_schema_files(
+        self, schema_files: list[Path]
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Parse schema files into ``{artifact_type: {version: schema}}``.
+
+        Files are read and decoded on a small thread pool so that disk I/O
+        and JSON parsing of independent schema files overlap.
+        """
+        schemas: dict[str, dict[str, dict[str, Any]]] = {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(schema_files))) as executor:
+            futures = [executor.submit(load_json_file, f) for f in schema_files]
+
+            for schema_file, future in zip(schema_files, futures, strict=True):
+                try:
+                    schema_data = future.result()
+
+                    # Extract artifact type and version from filename
+                    # Format: {artifact-type}.v{version}.schema.json
+                    filename = schema_file.stem.replace(".schema", "")
+                    if ".v" in filename:
+                        artifact_type, version = filename.split(".v", 1)
+                    else:
+                        # Legacy format without version
+                        artifact_type = filename
+                        version = "1.0.0"
+
+                    if artifact_type not in schemas:
+                        schemas[artifact_type] = {}
+
+                    schemas[artifact_type][version] = schema_data
+
+                except Exception as e:
+                    print(f"Warning: Failed to load schema {schema_file}: {e}")
+
+        return schemas
+
+    def _fingerprint(self, schema_files: list[Path]) -> dict[str, Any]:
+        """Identify the schema file set by directory, names, sizes and mtimes."""
+        files = {}
+        for schema_file in schema_files:
+            stat = schema_file.stat()
+            files[schema_file.name] = [stat.st_mtime_ns, stat.st_size]
+        return {"schemaDir": str(self.schema_dir), "files": files}
+
+    def _read_cache(self) -> dict[str, Any] | None:
+        """Return the cached registry document, or None if missing or unusable."""
+        try:
+            cached = load_json_file(self.cache_path)
+        except (OSError, ValueError):
+            return None
 
-                self.schemas[artifact_type][version] = schema_data
+        if (
+            not isinstance(cached, dict)
+            or not isinstance(cached.get("fingerprint"), dict)
+            or not isinstance(cached.get("schemas"), dict)
+            or cached["fingerprint"].get("schemaDir") != str(self.schema_dir)
+        ):
+            return None
+        return cached
 
-            except Exception as e:
-                print(f"Warning: Failed to load schema {schema_file}: {e}")
+    def _write_cache(self, fingerprint: dict[str, Any]) -> None:
+        """Persist the parsed registry; cache write failures are not fatal."""
+        tmp: Path | None = None
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic write: unique tmp → rename, safe across concurrent processes
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.cache_path.parent,
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp = Path(f.name)
+                json.dump({"fingerprint": fingerprint, "schemas": self.schemas}, f)
+            tmp.replace(self.cache_path)
+        except OSError:
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
 
     def get_schema(
         self, artifact_type: str, version: str | None = None
@@ -135,23 +268,34 @@ class SchemaRegistry:
 
         if version is None:
             # Return latest version
-            versions = sorted(
-                [SchemaVersion(v) for v in self.schemas[artifact_type].keys()]
-            )
+            versions = self._sorted_versions.get(artifact_type)
             if not versions:
                 return None
-            latest_version = str(versions[-1])
-            return self.schemas[artifact_type][latest_version]
+            return versions[-1][2]
 
         return self.schemas[artifact_type].get(version)
 
     def get_available_versions(self, artifact_type: str) -> list[str]:
         """Get all available versions for an artifact type."""
-        if artifact_type not in self.schemas:
-            return []
-        return sorted(
-            self.schemas[artifact_type].keys(), key=lambda v: SchemaVersion(v)
-        )
+        return [
+            version for _, version, _ in self._sorted_versions.get(artifact_type, [])
+        ]
+
+    def find_compatible_schema(
+        self, artifact_type: str, version: str
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Find the newest schema version compatible with ``version``.
+
+        Returns:
+            Tuple of (version string, schema), or None if nothing is compatible
+        """
+        target_version = SchemaVersion(version)
+        for candidate, version_str, schema in reversed(
+            self._sorted_versions.get(artifact_type, [])
+        ):
+            if candidate.is_compatible_with(target_version):
+                return version_str, schema
+        return None
 
     def get_latest_version(self, artifact_type: str) -> str | None:
         """Get the latest version for an artifact type."""
@@ -162,13 +306,62 @@ class SchemaRegistry:
 class ArtifactValidator:
     """Validates rpax artifacts against versioned schemas."""
 
-    def __init__(self):
-        self.registry = SchemaRegistry()
+    def __init__(self, cache_path: Path | None = None):
+        self.registry = SchemaRegistry(cache_path)
+        self._validators: dict[int, tuple[dict[str, Any], Any]] = {}
 
     def validate_artifact(
-        self, artifact_data: dict[str, Any], artifact_type: str | None = None
+        self,
+        artifact_data: dict[str, Any],
+        artifact_type: str | None = None,
+        max_errors: int = 50,
+    ) -> ValidationResult:
+        """Validate an artifact against its schema.
+
+        Schema validation stops after ``max_errors`` errors have been collected.
+        """
+        return self._validate(artifact_data, artifact_type, max_errors=max_errors)
+
+    def validate_artifact_stream(
+        self,
+        fileobj: IO[bytes],
+        artifact_type: str = "activity-instances",
+        max_errors: int = 50,
     ) -> ValidationResult:
-        """Validate an artifact against its schema."""
+        """Validate an activity-instances file without materializing its activities.
+
+        The top-level fields are read in a first pass over the file; the
+        ``activities`` array is then streamed item by item in a second pass, so
+        peak memory is bounded by the largest single activity. Requires ijson.
+
+        Args:
+            fileobj: Seekable binary file object positioned at the start
+            artifact_type: Artifact type used to select the schema
+            max_errors: Maximum number of schema errors to collect
+
+        Returns:
+            Validation result equivalent to ``validate_artifact`` on the loaded data
+        """
+        header = _read_stream_header(fileobj, "activities")
+        fileobj.seek(0)
+        activities = ijson.items(fileobj, "activities.item", use_float=True)
+        return self._validate(
+            {"activities": [], **header}, artifact_type, activities, max_errors
+        )
+
+    def _validate(
+        self,
+        artifact_data: dict[str, Any],
+        artifact_type: str | None,
+        activities: Iterable[dict[str, Any]] | None = None,
+        max_errors: int = 50,
+    ) -> ValidationResult:
+        """Validate an artifact, optionally streaming its activities separately.
+
+        When ``activities`` is given, ``artifact_data`` holds only the envelope
+        (with an empty ``activities`` list) and each streamed activity is checked
+        against the item schema while business rules are aggregated.
+        """
         issues = []
 
         # Determine artifact type if not provided
@@ -194,8 +387,7 @@ class ArtifactValidator:
         schema = self.registry.get_schema(artifact_type, schema_version)
         if schema is None:
             # Try to find compatible schema
-            available_versions = self.registry.get_available_versions(artifact_type)
-            if not available_versions:
+            if not self.registry.get_available_versions(artifact_type):
                 return ValidationResult(
                     is_valid=False,
                     schema_version=schema_version,
@@ -208,20 +400,12 @@ class ArtifactValidator:
                     ],
                 )
 
-            # Find best compatible schema
-            target_version = SchemaVersion(schema_version)
-            compatible_schema = None
-            compatible_version = None
-
-            for version_str in available_versions:
-                version = SchemaVersion(version_str)
-                if version.is_compatible_with(target_version):
-                    compatible_schema = self.registry.get_schema(
-                        artifact_type, version_str
-                    )
-                    compatible_version = version_str
+            # Find best (newest) compatible schema
+            compatible = self.registry.find_compatible_schema(
+                artifact_type, schema_version
+            )
 
-            if compatible_schema is None:
+            if compatible is None:
                 return ValidationResult(
                     is_valid=False,
                     schema_version=schema_version,
@@ -234,7 +418,7 @@ class ArtifactValidator:
                     ],
                 )
 
-            schema = compatible_schema
+            compatible_version, schema = compatible
             issues.append(
                 ValidationIssue(
                     ValidationSeverity.WARNING,
@@ -243,39 +427,90 @@ class ArtifactValidator:
                 )
             )
 
-        # Validate against schema
-        try:
-            jsonschema.validate(artifact_data, schema)
+        # Validate against schema, collecting at most max_errors errors
+        validator = self._get_validator(schema)
+        schema_errors = list(islice(validator.iter_errors(artifact_data), max_errors))
 
-            # Additional validation checks
-            additional_issues = self._validate_business_rules(
-                artifact_data, artifact_type, schema_version
+        if activities is not None and not schema_errors:
+            activities = self._iter_schema_checked(
+                activities, validator, schema, schema_errors, max_errors
             )
-            issues.extend(additional_issues)
 
-            return ValidationResult(
-                is_valid=len(
-                    [i for i in issues if i.severity == ValidationSeverity.ERROR]
-                )
-                == 0,
-                schema_version=schema_version,
-                issues=issues,
+        # Additional validation checks; streamed item errors are collected
+        # into schema_errors while the rules consume the activities
+        additional_issues = []
+        if not schema_errors:
+            additional_issues = self._validate_business_rules(
+                artifact_data, artifact_type, schema_version, activities
             )
 
-        except jsonschema.ValidationError as e:
-            issues.append(
+        if schema_errors:
+            issues.extend(
                 ValidationIssue(
                     ValidationSeverity.ERROR,
                     e.message,
-                    self._format_json_path(e.absolute_path),
-                    self._format_json_path(e.schema_path),
+                    self._format_json_path(tuple(e.absolute_path)),
+                    self._format_json_path(tuple(e.schema_path)),
                 )
+                for e in schema_errors
             )
-
             return ValidationResult(
                 is_valid=False, schema_version=schema_version, issues=issues
             )
 
+        issues.extend(additional_issues)
+
+        result = ValidationResult(
+            is_valid=True, schema_version=schema_version, issues=issues
+        )
+        result.is_valid = not result.has_errors
+        return result
+
+    def _get_validator(self, schema: dict[str, Any]) -> jsonschema.protocols.Validator:
+        """Return a checked, reusable validator instance for ``schema``."""
+        cached = self._validators.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        key = json.dumps(schema, sort_keys=True)
+        validator = _VALIDATOR_CACHE.get(key)
+        if validator is None:
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = _VALIDATOR_CACHE[key] = validator_cls(schema)
+
+        self._validators[id(schema)] = (schema, validator)
+        return validator
+
+    def _iter_schema_checked(
+        self,
+        activities: Iterable[dict[str, Any]],
+        validator: jsonschema.protocols.Validator,
+        schema: dict[str, Any],
+        schema_errors: list[jsonschema.ValidationError],
+        max_errors: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield activities while validating each against the activities item schema.
+
+        Errors are appended to ``schema_errors`` with paths rooted at the
+        artifact document; iteration stops once ``max_errors`` is reached.
+        """
+        item_schema = schema.get("properties", {}).get("activities", {}).get("items")
+        if item_schema is None:
+            yield from activities
+            return
+
+        item_validator = validator.evolve(schema=item_schema)
+
+        for i, activity in enumerate(activities):
+            for error in item_validator.iter_errors(activity):
+                error.path.extendleft((i, "activities"))
+                error.schema_path.extendleft(("items", "activities", "properties"))
+                schema_errors.append(error)
+                if len(schema_errors) >= max_errors:
+                    return
+            yield activity
+
     def _infer_artifact_type(self, artifact_data: dict[str, Any]) -> str | None:
         """Infer artifact type from data structure."""
         # Look for distinctive fields that identify artifact types
@@ -289,55 +524,96 @@ class ArtifactValidator:
         return None
 
     def _validate_business_rules(
-        self, artifact_data: dict[str, Any], artifact_type: str, schema_version: str
+        self,
+        artifact_data: dict[str, Any],
+        artifact_type: str,
+        schema_version: str,
+        activities: Iterable[dict[str, Any]] | None = None,
     ) -> list[ValidationIssue]:
         """Validate business logic rules beyond schema validation."""
         issues = []
 
         if artifact_type == "activity-instances":
             issues.extend(
-                self._validate_activity_instances_rules(artifact_data, schema_version)
+                self._validate_activity_instances_rules(
+                    artifact_data, schema_version, activities
+                )
             )
 
         return issues
 
     def _validate_activity_instances_rules(
-        self, data: dict[str, Any], schema_version: str
+        self,
+        data: dict[str, Any],
+        schema_version: str,
+        activities: Iterable[dict[str, Any]] | None = None,
     ) -> list[ValidationIssue]:
-        """Validate activity instances specific business rules."""
+        """Validate activity instances specific business rules.
+
+        Activities are visited exactly once so that ``activities`` may be a
+        stream; counts, ID uniqueness and parent references are aggregated.
+        """
         issues = []
 
-        activities = data.get("activities", [])
+        if activities is None:
+            activities = data.get("activities", [])
         total_activities = data.get("totalActivities", 0)
 
-        # Check activity count consistency
-        if len(activities) != total_activities:
-            issues.append(
-                ValidationIssue(
-                    ValidationSeverity.ERROR,
-                    f"Activity count mismatch: declared {total_activities}, found {len(activities)}",
-                    "$.totalActivities",
-                )
-            )
-
-        # Check activity ID uniqueness
-        activity_ids = set()
+        # Check activity ID uniqueness while aggregating counts and parent refs
+        id_to_index: dict[str, int] = {}
+        parent_refs: list[tuple[int, str]] = []
+        activity_count = 0
+        visible_count = 0
         for i, activity in enumerate(activities):
+            activity_count += 1
             activity_id = activity.get("activityId", "")
-            if activity_id in activity_ids:
+            first_index = id_to_index.setdefault(activity_id, i)
+            if first_index != i:
                 issues.append(
                     ValidationIssue(
                         ValidationSeverity.ERROR,
                         f"Duplicate activity ID: {activity_id}",
                         f"$.activities[{i}].activityId",
+                        details={"firstIndex": first_index},
                     )
                 )
-            activity_ids.add(activity_id)
 
-        # Check parent-child relationships
-        for i, activity in enumerate(activities):
             parent_id = activity.get("parentActivityId")
-            if parent_id and parent_id not in activity_ids:
+            if parent_id:
+                parent_refs.append((i, parent_id))
+
+            if activity.get("isVisible", True):
+                visible_count += 1
+
+        # Check activity count consistency
+        if activity_count != total_activities:
+            issues.insert(
+                0,
+                ValidationIssue(
+                    ValidationSeverity.ERROR,
+                    f"Activity count mismatch: declared {total_activities}, found {activity_count}",
+                    "$.totalActivities",
+                ),
+            )
+
+        # Check parent-child relationships
+        issues.extend(self._check_parent_refs(parent_refs, id_to_index))
+
+        # Schema version specific validations
+        if SchemaVersion(schema_version) >= SchemaVersion("1.1.0"):
+            issues.extend(self._check_visible_count(data, visible_count))
+
+        return issues
+
+    def _check_parent_refs(
+        self, parent_refs: list[tuple[int, str]], id_to_index: dict[str, int]
+    ) -> list[ValidationIssue]:
+        """Report missing parent activities and cycles in the parent chain."""
+        issues = []
+        parent_of: dict[int, int] = {}
+        for i, parent_id in parent_refs:
+            parent_index = id_to_index.get(parent_id)
+            if parent_index is None:
                 issues.append(
                     ValidationIssue(
                         ValidationSeverity.WARNING,
@@ -345,26 +621,67 @@ class ArtifactValidator:
                         f"$.activities[{i}].parentActivityId",
                     )
                 )
+            else:
+                parent_of[i] = parent_index
 
-        # Schema version specific validations
-        if SchemaVersion(schema_version) >= SchemaVersion("1.1.0"):
-            # v1.1+ specific validations
-            if "visibleActivities" in data:
-                visible_count = sum(1 for a in activities if a.get("isVisible", True))
-                declared_visible = data["visibleActivities"]
-                if visible_count != declared_visible:
-                    issues.append(
-                        ValidationIssue(
-                            ValidationSeverity.WARNING,
-                            f"Visible activity count mismatch: declared {declared_visible}, found {visible_count}",
-                            "$.visibleActivities",
-                        )
+        issues.extend(self._find_parent_cycles(parent_of))
+        return issues
+
+    def _check_visible_count(
+        self, data: dict[str, Any], visible_count: int
+    ) -> list[ValidationIssue]:
+        """Check the v1.1+ ``visibleActivities`` count against the activities."""
+        if "visibleActivities" not in data:
+            return []
+
+        declared_visible = data["visibleActivities"]
+        if visible_count == declared_visible:
+            return []
+
+        return [
+            ValidationIssue(
+                ValidationSeverity.WARNING,
+                f"Visible activity count mismatch: declared {declared_visible}, found {visible_count}",
+                "$.visibleActivities",
+            )
+        ]
+
+    def _find_parent_cycles(self, parent_of: dict[int, int]) -> list[ValidationIssue]:
+        """Report cycles in the activity parent chain.
+
+        Each activity has at most one parent, so every chain is walked once
+        iteratively; a chain that reaches a node already on the current walk
+        closes a cycle.
+        """
+        issues = []
+        done: set[int] = set()
+
+        for start in parent_of:
+            walk: dict[int, None] = {}
+            node: int | None = start
+            while node is not None and node not in done and node not in walk:
+                walk[node] = None
+                node = parent_of.get(node)
+
+            if node is not None and node in walk:
+                issues.append(
+                    ValidationIssue(
+                        ValidationSeverity.ERROR,
+                        "Cycle in parent activity chain",
+                        f"$.activities[{node}].parentActivityId",
                     )
+                )
+            done.update(walk)
 
         return issues
 
-    def _format_json_path(self, path) -> str:
-        """Format JSONSchema path as JSONPath."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_json_path(path: tuple[str | int, ...]) -> str:
+        """Format JSONSchema path as JSONPath.
+
+        Cached because errors in large artifacts repeat the same schema paths.
+        """
         if not path:
             return "$"
 
@@ -431,15 +748,72 @@ class ArtifactValidator:
         return migration_steps
 
 
+def _read_stream_header(fileobj: IO[bytes], skip_key: str) -> dict[str, Any]:
+    """Read the top-level fields of a JSON object, skipping one large array.
+
+    Events below ``skip_key`` are tokenized but never built into Python objects.
+    A ``skip_key`` member that is not an array is kept so schema checks see it.
+
+    Raises:
+        ValueError: If the document root is not a JSON object
+    """
+    header: dict[str, Any] = {}
+    key: str = ""
+    skipping = False
+
+    events = ijson.parse(fileobj, use_float=True)
+    for prefix, event, value in events:
+        if prefix == "":
+            if event == "map_key":
+                key = value
+                skipping = False
+            elif event not in ("start_map", "end_map"):
+                raise ValueError("Artifact root must be a JSON object")
+            continue
+        if skipping or (prefix == skip_key and event == "start_array"):
+            skipping = True
+            continue
+
+        if event in ("start_map", "start_array"):
+            header[key] = _build_stream_value(event, value, events)
+        else:
+            header[key] = value
+
+    return header
+
+
+def _build_stream_value(
+    event: str, value: Any, events: Iterator[tuple[str, str, Any]]
+) -> Any:
+    """Build the container opened by ``event`` from the events that follow it."""
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    while True:
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return builder.value
+        _, event, value = next(events)
+
+
 def validate_artifact_file(
     file_path: Path, artifact_type: str | None = None
 ) -> ValidationResult:
-    """Convenience function to validate an artifact file."""
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
+    """Convenience function to validate an artifact file.
 
+    Activity-instances artifacts are streamed when ijson is installed.
+    """
+    try:
         validator = ArtifactValidator()
+
+        if HAS_IJSON and artifact_type == "activity-instances":
+            with open(file_path, "rb") as f:
+                return validator.validate_artifact_stream(f, artifact_type)
+
+        data = load_json_file(file_path)
         return validator.validate_artifact(data, artifact_type)
 
     except Exception as e:
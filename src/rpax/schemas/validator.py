@@ -2,11 +2,52 @@
 
 import json
 import logging
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from pydantic import BaseModel
+from pydantic import ValidationError as ModelValidationError
+
+from ..models.manifest import ProjectManifest
+from ..models.workflow import Workflow, WorkflowIndex
+from ..utils.jsonio import load_json_file, loads
+
+# Optional fastjsonschema import for code-generated validators
+try:
+    import fastjsonschema
+
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
 
 logger = logging.getLogger(__name__)
 
+# Manifest fields checked by the basic validator, in reporting order
+_MANIFEST_REQUIRED_ORDER = ("projectName", "rpaxVersion", "generatedAt")
+_MANIFEST_REQUIRED = frozenset(_MANIFEST_REQUIRED_ORDER)
+
+# Invocation record fields and kinds checked by the basic validator
+_INVOCATION_REQUIRED_ORDER = ("kind", "from", "to")
+_INVOCATION_REQUIRED = frozenset(_INVOCATION_REQUIRED_ORDER)
+_VALID_INVOCATION_KINDS = frozenset({"invoke", "invoke-missing", "invoke-dynamic"})
+_VALID_INVOCATION_KINDS_STR = "invoke, invoke-missing, invoke-dynamic"
+
+# Read size for streaming JSONL artifacts
+_JSONL_BLOCK_SIZE = 1 << 20
+
+# Compiled validators shared across ArtifactValidator instances, keyed by
+# (backend, canonical schema JSON); serializing is far cheaper than compiling
+_VALIDATOR_CACHE: dict[tuple[str, str], Any] = {}
+
+# Artifact types whose schemas SchemaGenerator derives from these models
+MODEL_BACKED_ARTIFACTS: dict[str, type[BaseModel]] = {
+    "manifest": ProjectManifest,
+    "workflow_index": WorkflowIndex,
+    "workflow": Workflow,
+}
+
 
 class ValidationError:
     """Represents a schema validation error."""
@@ -23,9 +64,40 @@ class ValidationError:
 class ArtifactValidator:
     """Validates rpax artifacts against JSON schemas."""
 
-    def __init__(self, schemas: dict[str, dict[str, Any]] | None = None):
+    def __init__(
+        self,
+        schemas: dict[str, dict[str, Any]] | None = None,
+        model_fast_path: bool = False,
+        backend: str = "jsonschema",
+    ):
+        """Initialize the validator.
+
+        Args:
+            schemas: Mapping of artifact type to JSON schema
+            model_fast_path: Decode and validate model-backed artifacts in one
+                pydantic pass; only valid when ``schemas`` were generated from
+                MODEL_BACKED_ARTIFACTS by SchemaGenerator
+            backend: "jsonschema" or "fastjsonschema"; the latter compiles each
+                schema to Python code and reports the first error per record,
+                falling back to jsonschema if not installed
+        """
         self.schemas = schemas or {}
+        self.model_fast_path = model_fast_path
         self.jsonschema_available = self._check_jsonschema_availability()
+        self._compiled: dict[str, Any] = (
+            self._compile_validators() if self.jsonschema_available else {}
+        )
+        self._fast: dict[str, Any] = (
+            self._compile_fast_validators() if backend == "fastjsonschema" else {}
+        )
+        self._result_cache: dict[
+            tuple[str, str], tuple[tuple[int, int], list[ValidationError]]
+        ] = {}
+        self._basic_dispatch: dict[str, Callable[[Any], list[ValidationError]]] = {
+            "manifest": self._validate_manifest_basic,
+            "workflow_index": self._validate_workflow_index_basic,
+            "invocation": self._validate_invocations_basic,
+        }
 
     def _check_jsonschema_availability(self) -> bool:
         """Check if jsonschema library is available."""
@@ -36,6 +108,47 @@ class ArtifactValidator:
             logger.warning("jsonschema library not available - validation will be limited")
             return False
 
+    def _compile_validators(self) -> dict[str, Any]:
+        """Check each schema once and build a reusable validator per artifact type."""
+        from jsonschema import SchemaError, validators
+
+        compiled = {}
+        for artifact_type, schema in self.schemas.items():
+            key = ("jsonschema", json.dumps(schema, sort_keys=True))
+            if key in _VALIDATOR_CACHE:
+                compiled[artifact_type] = _VALIDATOR_CACHE[key]
+                continue
+            try:
+                validator_cls = validators.validator_for(schema)
+                validator_cls.check_schema(schema)
+                compiled[artifact_type] = _VALIDATOR_CACHE[key] = validator_cls(schema)
+            except SchemaError as e:
+                logger.error(f"Invalid schema for artifact type {artifact_type}: {e.message}")
+        return compiled
+
+    def _compile_fast_validators(self) -> dict[str, Any]:
+        """Generate a fastjsonschema validation function per artifact type."""
+        if not HAS_FASTJSONSCHEMA:
+            logger.warning("fastjsonschema library not available - using jsonschema backend")
+            return {}
+
+        compiled = {}
+        for artifact_type, schema in self.schemas.items():
+            key = ("fastjsonschema", json.dumps(schema, sort_keys=True))
+            if key in _VALIDATOR_CACHE:
+                compiled[artifact_type] = _VALIDATOR_CACHE[key]
+                continue
+            try:
+                compiled[artifact_type] = _VALIDATOR_CACHE[key] = fastjsonschema.compile(
+                    schema
+                )
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                logger.warning(
+                    f"fastjsonschema cannot compile schema for {artifact_type}, "
+                    f"using jsonschema: {e}"
+                )
+        return compiled
+
     def validate_artifact_file(self, artifact_path: Path, artifact_type: str) -> list[ValidationError]:
         """Validate an artifact file against its schema.
         
@@ -46,32 +159,39 @@ class ArtifactValidator:
         Returns:
             List of validation errors (empty if valid)
         """
+        # Check if file exists
+        try:
+            stat = artifact_path.stat()
+        except OSError:
+            return [ValidationError(str(artifact_path), "File does not exist")]
+
+        # Unchanged files (same mtime and size) reuse their previous result
+        cache_key = (str(artifact_path), artifact_type)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
+
+        errors = self._validate_file(artifact_path, artifact_type)
+        self._result_cache[cache_key] = (signature, errors)
+        return list(errors)
+
+    def _validate_file(self, artifact_path: Path, artifact_type: str) -> list[ValidationError]:
+        """Load and validate an existing artifact file, bypassing the result cache."""
         errors = []
 
-        # Check if file exists
-        if not artifact_path.exists():
-            errors.append(ValidationError(str(artifact_path), "File does not exist"))
+        # Fast path: JSON decoding is the validation for model-backed artifacts;
+        # fall through to jsonschema only to report errors
+        if self._model_validates(artifact_path, artifact_type):
             return errors
 
+        # Handle JSONL files (like invocations.jsonl) as a record stream
+        if artifact_path.suffix == ".jsonl":
+            return self._validate_jsonl_file(artifact_path, artifact_type, errors)
+
         # Load artifact data
         try:
-            with open(artifact_path, encoding="utf-8") as f:
-                if artifact_path.suffix == ".jsonl":
-                    # Handle JSONL files (like invocations.jsonl)
-                    artifact_data = []
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            try:
-                                artifact_data.append(json.loads(line))
-                            except json.JSONDecodeError as e:
-                                errors.append(ValidationError(
-                                    f"{artifact_path}:line {line_num}",
-                                    f"Invalid JSON: {e}"
-                                ))
-                else:
-                    # Handle regular JSON files
-                    artifact_data = json.load(f)
+            artifact_data = load_json_file(artifact_path)
         except Exception as e:
             errors.append(ValidationError(str(artifact_path), f"Failed to load file: {e}"))
             return errors
@@ -83,7 +203,7 @@ class ArtifactValidator:
             return errors
 
         # Validate against schema
-        if self.jsonschema_available:
+        if self.jsonschema_available or artifact_type in self._fast:
             schema_errors = self._validate_with_jsonschema(artifact_data, schema, artifact_type)
             errors.extend(schema_errors)
         else:
@@ -93,6 +213,97 @@ class ArtifactValidator:
 
         return errors
 
+    def _validate_jsonl_file(
+        self, artifact_path: Path, artifact_type: str, errors: list[ValidationError]
+    ) -> list[ValidationError]:
+        """Validate a JSONL artifact record by record without building a list."""
+        schema = self.schemas.get(artifact_type)
+        if not schema:
+            errors.append(ValidationError(str(artifact_path), f"No schema available for artifact type: {artifact_type}"))
+            return errors
+
+        try:
+            with open(artifact_path, "rb", buffering=0) as f:
+                records = self._iter_jsonl(f, artifact_path, errors)
+                if self.jsonschema_available or artifact_type in self._fast:
+                    schema_errors = self._validate_with_jsonschema(records, schema, artifact_type)
+                else:
+                    schema_errors = self._basic_validation(list(records), artifact_type)
+        except OSError as e:
+            errors.append(ValidationError(str(artifact_path), f"Failed to load file: {e}"))
+            return errors
+
+        errors.extend(schema_errors)
+        return errors
+
+    def _iter_jsonl(
+        self, f: BinaryIO, artifact_path: Path, errors: list[ValidationError]
+    ) -> Iterator[Any]:
+        """Yield decoded JSONL records, reading the file in fixed-size blocks.
+
+        Blank lines and ``#`` comments are skipped; undecodable lines are
+        appended to ``errors`` with their line number, which is only worked
+        out when an error is reported.
+        """
+        buffer = bytearray()
+        lines_before = 0  # lines consumed with earlier blocks
+
+        while True:
+            block = f.read(_JSONL_BLOCK_SIZE)
+            if block:
+                buffer += block
+            elif buffer and not buffer.endswith(b"\n"):
+                buffer += b"\n"  # terminate a final line without newline
+
+            start = 0
+            end = buffer.find(b"\n")
+            while end != -1:
+                line_start = start
+                line = buffer[start:end]
+                start = end + 1
+                end = buffer.find(b"\n", start)
+
+                # Records start with "{"; only other lines pay for strip()
+                if not line.startswith(b"{"):
+                    line = line.strip()
+                    if not line or line.startswith(b"#"):
+                        continue
+
+                try:
+                    record = loads(line)
+                except ValueError as e:
+                    line_num = lines_before + buffer.count(b"\n", 0, line_start) + 1
+                    errors.append(ValidationError(
+                        f"{artifact_path}:line {line_num}",
+                        f"Invalid JSON: {e}"
+                    ))
+                else:
+                    yield record
+            lines_before += buffer.count(b"\n", 0, start)
+            del buffer[:start]
+
+            if not block:
+                return
+
+    def _model_validates(self, artifact_path: Path, artifact_type: str) -> bool:
+        """Check a model-backed artifact with a single pydantic JSON decode.
+
+        Returns:
+            True if the fast path is enabled and the artifact is valid
+        """
+        model = MODEL_BACKED_ARTIFACTS.get(artifact_type)
+        if not self.model_fast_path or model is None or artifact_path.suffix == ".jsonl":
+            return False
+
+        try:
+            # Aliases only: populate_by_name would accept snake_case keys the schema rejects
+            model.model_validate_json(
+                artifact_path.read_bytes(), strict=True, by_alias=True, by_name=False
+            )
+            return True
+        except (OSError, ModelValidationError):
+            return False
+
     def validate_artifact_data(self, data: Any, artifact_type: str) -> list[ValidationError]:
         """Validate artifact data directly against schema.
         
@@ -110,7 +321,7 @@ class ArtifactValidator:
             errors.append(ValidationError("data", f"No schema available for artifact type: {artifact_type}"))
             return errors
 
-        if self.jsonschema_available:
+        if self.jsonschema_available or artifact_type in self._fast:
             errors.extend(self._validate_with_jsonschema(data, schema, artifact_type))
         else:
             errors.extend(self._basic_validation(data, artifact_type))
@@ -118,23 +329,29 @@ class ArtifactValidator:
         return errors
 
     def _validate_with_jsonschema(self, data: Any, schema: dict[str, Any], artifact_type: str) -> list[ValidationError]:
-        """Validate using jsonschema library."""
+        """Validate using the precompiled jsonschema validator for the artifact type."""
         errors = []
 
-        try:
-            import jsonschema
+        fast_validate = self._fast.get(artifact_type)
+        if fast_validate is not None:
+            return self._validate_with_fastjsonschema(data, fast_validate, artifact_type)
+
+        validator = self._compiled.get(artifact_type)
+        if validator is None:
+            errors.append(ValidationError("schema", f"Invalid schema for artifact type: {artifact_type}"))
+            return errors
 
-            # Handle JSONL data (list of objects)
-            if isinstance(data, list) and artifact_type == "invocation":
+        try:
+            # Handle JSONL data (list or stream of objects)
+            if artifact_type == "invocation" and not isinstance(data, dict):
                 # Validate each invocation record
                 for i, record in enumerate(data):
                     try:
-                        jsonschema.validate(record, schema)
-                    except jsonschema.ValidationError as e:
-                        errors.append(ValidationError(
-                            f"record[{i}].{e.json_path}",
-                            e.message
-                        ))
+                        for error in validator.iter_errors(record):
+                            errors.append(ValidationError(
+                                f"record[{i}].{error.json_path}",
+                                error.message
+                            ))
                     except Exception as e:
                         errors.append(ValidationError(
                             f"record[{i}]",
@@ -143,12 +360,11 @@ class ArtifactValidator:
             else:
                 # Validate single object
                 try:
-                    jsonschema.validate(data, schema)
-                except jsonschema.ValidationError as e:
-                    errors.append(ValidationError(
-                        e.json_path or "root",
-                        e.message
-                    ))
+                    for error in validator.iter_errors(data):
+                        errors.append(ValidationError(
+                            error.json_path or "root",
+                            error.message
+                        ))
                 except Exception as e:
                     errors.append(ValidationError("root", f"Validation error: {e}"))
 
@@ -157,19 +373,46 @@ class ArtifactValidator:
 
         return errors
 
-    def _basic_validation(self, data: Any, artifact_type: str) -> list[ValidationError]:
-        """Basic validation without jsonschema library."""
+    def _validate_with_fastjsonschema(
+        self, data: Any, fast_validate: Any, artifact_type: str
+    ) -> list[ValidationError]:
+        """Validate using a fastjsonschema generated function (first error per record)."""
         errors = []
 
-        if artifact_type == "manifest":
-            errors.extend(self._validate_manifest_basic(data))
-        elif artifact_type == "workflow_index":
-            errors.extend(self._validate_workflow_index_basic(data))
-        elif artifact_type == "invocation":
-            errors.extend(self._validate_invocations_basic(data))
+        if artifact_type == "invocation" and not isinstance(data, dict):
+            for i, record in enumerate(data):
+                try:
+                    fast_validate(record)
+                except fastjsonschema.JsonSchemaValueException as e:
+                    errors.append(ValidationError(
+                        f"record[{i}].{self._fast_json_path(e.path)}",
+                        e.message
+                    ))
+        else:
+            try:
+                fast_validate(data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                errors.append(ValidationError(
+                    self._fast_json_path(e.path) if len(e.path) > 1 else "root",
+                    e.message
+                ))
 
         return errors
 
+    @staticmethod
+    def _fast_json_path(path: list[str | int]) -> str:
+        """Convert a fastjsonschema path (rooted at "data") to JSONPath."""
+        return "$" + "".join(
+            f"[{part}]" if isinstance(part, int) else f".{part}" for part in path[1:]
+        )
+
+    def _basic_validation(self, data: Any, artifact_type: str) -> list[ValidationError]:
+        """Basic validation without jsonschema library."""
+        basic_validator = self._basic_dispatch.get(artifact_type)
+        if basic_validator is None:
+            return []
+        return basic_validator(data)
+
     def _validate_manifest_basic(self, data: Any) -> list[ValidationError]:
         """Basic validation for manifest data."""
         errors = []
@@ -179,9 +422,9 @@ class ArtifactValidator:
             return errors
 
         # Check required fields
-        required_fields = ["projectName", "rpaxVersion", "generatedAt"]
-        for field in required_fields:
-            if field not in data:
+        missing = _MANIFEST_REQUIRED.difference(data)
+        for field in _MANIFEST_REQUIRED_ORDER:
+            if field in missing:
                 errors.append(ValidationError(field, f"Required field missing: {field}"))
 
         # Check data types
@@ -203,11 +446,12 @@ class ArtifactValidator:
             if not isinstance(data["workflows"], list):
                 errors.append(ValidationError("workflows", "Must be an array"))
             else:
+                append = errors.append  # bound once for the per-workflow loop
                 for i, workflow in enumerate(data["workflows"]):
                     if not isinstance(workflow, dict):
-                        errors.append(ValidationError(f"workflows[{i}]", "Must be an object"))
+                        append(ValidationError(f"workflows[{i}]", "Must be an object"))
                     elif "id" not in workflow:
-                        errors.append(ValidationError(f"workflows[{i}].id", "Required field missing"))
+                        append(ValidationError(f"workflows[{i}].id", "Required field missing"))
 
         return errors
 
@@ -219,24 +463,30 @@ class ArtifactValidator:
             errors.append(ValidationError("root", "Invocations must be an array"))
             return errors
 
+        # Bind hot names once for the per-record loop
+        append = errors.append
+        missing_required = _INVOCATION_REQUIRED.difference
+        valid_kinds = _VALID_INVOCATION_KINDS
+
         for i, invocation in enumerate(data):
             if not isinstance(invocation, dict):
-                errors.append(ValidationError(f"[{i}]", "Must be an object"))
+                append(ValidationError(f"[{i}]", "Must be an object"))
                 continue
 
             # Check required fields
-            required_fields = ["kind", "from", "to"]
-            for field in required_fields:
-                if field not in invocation:
-                    errors.append(ValidationError(f"[{i}].{field}", f"Required field missing: {field}"))
+            missing = missing_required(invocation)
+            if missing:
+                for field in _INVOCATION_REQUIRED_ORDER:
+                    if field in missing:
+                        append(ValidationError(f"[{i}].{field}", f"Required field missing: {field}"))
 
             # Check kind enum
             if "kind" in invocation:
-                valid_kinds = ["invoke", "invoke-missing", "invoke-dynamic"]
-                if invocation["kind"] not in valid_kinds:
-                    errors.append(ValidationError(
+                kind = invocation["kind"]
+                if not isinstance(kind, str) or kind not in valid_kinds:
+                    append(ValidationError(
                         f"[{i}].kind",
-                        f"Invalid kind: {invocation['kind']}. Must be one of: {', '.join(valid_kinds)}"
+                        f"Invalid kind: {kind}. Must be one of: {_VALID_INVOCATION_KINDS_STR}"
                     ))
 
         return errors
@@ -259,15 +509,33 @@ class ArtifactValidator:
             "invocations": artifacts_dir / "invocations.jsonl"
         }
 
-        for artifact_type, artifact_path in artifact_files.items():
-            if artifact_path.exists():
-                errors = self.validate_artifact_file(artifact_path, artifact_type)
-                results[artifact_type] = errors
-
-                if errors:
-                    logger.warning(f"Validation errors in {artifact_path}: {len(errors)} issues found")
-                else:
-                    logger.info(f"Artifact {artifact_path} is valid")
+        present = {
+            artifact_type: artifact_path
+            for artifact_type, artifact_path in artifact_files.items()
+            if artifact_path.exists()
+        }
+        if not present:
+            return results
+
+        # Artifacts are independent, so load and validate them concurrently;
+        # file I/O and decoding release the GIL
+        with ThreadPoolExecutor(max_workers=len(present)) as executor:
+            futures = {
+                artifact_type: executor.submit(
+                    self.validate_artifact_file, artifact_path, artifact_type
+                )
+                for artifact_type, artifact_path in present.items()
+            }
+
+        for artifact_type, future in futures.items():
+            artifact_path = present[artifact_type]
+            errors = future.result()
+            results[artifact_type] = errors
+
+            if errors:
+                logger.warning(f"Validation errors in {artifact_path}: {len(errors)} issues found")
+            else:
+                logger.info(f"Artifact {artifact_path} is valid")
 
         return results
 
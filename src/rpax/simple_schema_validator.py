@@ -4,49 +4,75 @@ This module provides basic schema validation and versioning support for rpax
 artifacts using only standard library components.
 """
 
-import json
-from dataclasses import dataclass
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
 
+from rpax.utils.jsonio import load_json_file
+from rpax.utils.severity import count_severities
 
+
+@dataclass(frozen=True, slots=True, eq=False)
 class SchemaVersion:
     """Represents a semantic version with comparison support."""
 
-    def __init__(self, version_str: str):
-        self.raw = version_str
-        parts = version_str.split(".")
-        self.major = int(parts[0])
-        self.minor = int(parts[1])
-        self.patch = int(parts[2])
-
-    def __str__(self):
+    raw: str
+    major: int = field(init=False)
+    minor: int = field(init=False)
+    patch: int = field(init=False)
+    _key: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        parts = self.raw.split(".")
+        major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2])
+        object.__setattr__(self, "major", major)
+        object.__setattr__(self, "minor", minor)
+        object.__setattr__(self, "patch", patch)
+        # Pack into one int so comparisons don't build tuples
+        object.__setattr__(self, "_key", (major << 32) | (minor << 16) | patch)
+
+    def __str__(self) -> str:
         return self.raw
 
-    def __eq__(self, other):
-        return (self.major, self.minor, self.patch) == (
-            other.major,
-            other.minor,
-            other.patch,
-        )
+    def __hash__(self) -> int:
+        return hash(self._key)
 
-    def __lt__(self, other):
-        return (self.major, self.minor, self.patch) < (
-            other.major,
-            other.minor,
-            other.patch,
-        )
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SchemaVersion):
+            return NotImplemented
+        return self._key == other._key
+
+    def __lt__(self, other: "SchemaVersion") -> bool:
+        return self._key < other._key
+
+    def __le__(self, other: "SchemaVersion") -> bool:
+        return self._key <= other._key
+
+    def __gt__(self, other: "SchemaVersion") -> bool:
+        return self._key > other._key
 
-    def __le__(self, other):
-        return self < other or self == other
+    def __ge__(self, other: "SchemaVersion") -> bool:
+        return self._key >= other._key
 
-    def is_compatible_with(self, other) -> bool:
+    def is_compatible_with(self, other: "SchemaVersion") -> bool:
         """Check if this version is backward compatible with another."""
         # Same major version is compatible
         return self.major == other.major
 
 
+@lru_cache(maxsize=64)
+def parse_version(version_str: str) -> SchemaVersion:
+    """Return a cached SchemaVersion for a version string."""
+    return SchemaVersion(version_str)
+
+
+V_1_1_0 = parse_version("1.1.0")
+
+
 class ValidationSeverity(Enum):
     """Severity levels for validation issues."""
 
@@ -55,7 +81,7 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationIssue:
     """Represents a validation issue with context."""
 
@@ -65,38 +91,149 @@ class ValidationIssue:
     details: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of schema validation with detailed feedback."""
+    """Result of schema validation with detailed feedback.
+
+    Severity counts are computed from ``issues`` once; add further issues
+    through ``add_issue`` so the counts stay in step with the list.
+    """
 
     is_valid: bool
     schema_version: str
     issues: list[ValidationIssue]
+    error_count: int = field(init=False, default=0)
+    warning_count: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.error_count, self.warning_count = count_severities(
+            self.issues, ValidationSeverity.ERROR, ValidationSeverity.WARNING
+        )
+
+    def add_issue(self, issue: ValidationIssue) -> None:
+        """Append an issue and keep the severity counts current."""
+        self.issues.append(issue)
+        if issue.severity is ValidationSeverity.ERROR:
+            self.error_count += 1
+        elif issue.severity is ValidationSeverity.WARNING:
+            self.warning_count += 1
 
     @property
     def has_errors(self) -> bool:
         """Check if result has any error-level issues."""
-        return any(issue.severity == ValidationSeverity.ERROR for issue in self.issues)
+        return self.error_count > 0
 
     @property
     def has_warnings(self) -> bool:
         """Check if result has any warning-level issues."""
-        return any(
-            issue.severity == ValidationSeverity.WARNING for issue in self.issues
-        )
+        return self.warning_count > 0
+
+
+# Required fields in reporting order, plus frozensets for C-level set difference
+_ARTIFACT_REQUIRED_ORDER = ("schemaVersion", "workflowId", "totalActivities", "activities")
+_ARTIFACT_REQUIRED = frozenset(_ARTIFACT_REQUIRED_ORDER)
+
+_V11_REQUIRED_ORDER = ("projectId",)
+_V11_REQUIRED = frozenset(_V11_REQUIRED_ORDER)
+
+_ACTIVITY_REQUIRED_ORDER = (
+    "activityId",
+    "workflowId",
+    "activityType",
+    "nodeId",
+    "depth",
+    "arguments",
+    "configuration",
+    "properties",
+    "metadata",
+    "expressions",
+    "variablesReferenced",
+    "selectors",
+    "isVisible",
+)
+_ACTIVITY_REQUIRED = frozenset(_ACTIVITY_REQUIRED_ORDER)
+
+# {projectId}#{workflowId}#{nodeId}#{contentHash}: three non-blank parts
+# followed by an 8-character hex content hash
+_ACTIVITY_ID_RE = re.compile(r"(?:\s*[^#\s][^#]*#){3}[0-9a-fA-F]{8}")
+
+
+def _missing_fields(
+    record: Any, required: frozenset[str], order: tuple[str, ...]
+) -> list[str]:
+    """Return required fields absent from a record, in declaration order."""
+    missing = required.difference(record)
+    if not missing:
+        return []
+    return [name for name in order if name in missing]
+
+
+# Artifact type for each combination of the top-level keys checked by
+# _infer_artifact_type (bit 0: activities, 1: totalActivities, 2: workflows,
+# 3: project, 4: invocations)
+_ARTIFACT_TYPE_BY_SIGNATURE: tuple[str | None, ...] = tuple(
+    "activity-instances" if signature & 0b00011 == 0b00011
+    else "manifest" if signature & 0b01100 == 0b01100
+    else "invocations" if signature & 0b10000
+    else None
+    for signature in range(32)
+)
+
+
+class _FirstError(Exception):
+    """Raised in fail-fast mode to stop validation at the first error."""
+
+    def __init__(self, issues: list[ValidationIssue]) -> None:
+        super().__init__("validation stopped at first error")
+        self.issues = issues
+
+
+class _IssueSink(Protocol):
+    """Anything issues can be appended to: a plain list or _FailFastIssues."""
+
+    def append(self, issue: ValidationIssue, /) -> None: ...
+
+
+class _FailFastIssues:
+    """Issue sink that aborts validation once an error-level issue is added."""
+
+    def __init__(self, issues: list[ValidationIssue]) -> None:
+        self.issues = issues
+
+    def append(self, issue: ValidationIssue) -> None:
+        self.issues.append(issue)
+        if issue.severity is ValidationSeverity.ERROR:
+            raise _FirstError(self.issues)
+
+
+# Per-version activity-instances check: (data, schema_version, issues) -> None
+_VersionValidator = Callable[[dict[str, Any], str, _IssueSink], None]
 
 
 class SimpleArtifactValidator:
     """Simple validator for rpax artifacts using basic validation rules."""
 
-    def __init__(self):
-        self.supported_versions = {"activity-instances": ["1.0.0", "1.1.0"]}
+    def __init__(self) -> None:
+        self.supported_versions: dict[str, list[str]] = {
+            "activity-instances": ["1.0.0", "1.1.0"]
+        }
+        self._version_dispatch: dict[tuple[str, str], _VersionValidator] = {
+            ("activity-instances", "1.0.0"): self._validate_activity_instances_v10,
+            ("activity-instances", "1.1.0"): self._validate_activity_instances_v11,
+        }
 
     def validate_artifact(
-        self, artifact_data: dict[str, Any], artifact_type: str | None = None
+        self,
+        artifact_data: dict[str, Any],
+        artifact_type: str | None = None,
+        fail_fast: bool = False,
     ) -> ValidationResult:
-        """Validate an artifact against basic schema rules."""
-        issues = []
+        """Validate an artifact against basic schema rules.
+
+        With ``fail_fast`` validation stops at the first error-level issue,
+        which is enough for callers that only need ``is_valid``.
+        """
+        issues: list[ValidationIssue] = []
 
         # Determine artifact type if not provided
         if artifact_type is None:
@@ -121,11 +258,11 @@ class SimpleArtifactValidator:
         supported = self.supported_versions.get(artifact_type, [])
         if schema_version not in supported:
             # Try to find compatible version
-            target_version = SchemaVersion(schema_version)
+            target_version = parse_version(schema_version)
             compatible_found = False
 
             for supported_version in supported:
-                if SchemaVersion(supported_version).is_compatible_with(target_version):
+                if parse_version(supported_version).is_compatible_with(target_version):
                     compatible_found = True
                     issues.append(
                         ValidationIssue(
@@ -151,65 +288,121 @@ class SimpleArtifactValidator:
 
         # Perform validation based on artifact type
         if artifact_type == "activity-instances":
-            validation_issues = self._validate_activity_instances(
-                artifact_data, schema_version
-            )
+            try:
+                validation_issues = self._validate_activity_instances(
+                    artifact_data, schema_version, fail_fast
+                )
+            except _FirstError as stop:
+                validation_issues = stop.issues
             issues.extend(validation_issues)
 
-        return ValidationResult(
-            is_valid=len([i for i in issues if i.severity == ValidationSeverity.ERROR])
-            == 0,
-            schema_version=schema_version,
-            issues=issues,
+        result = ValidationResult(
+            is_valid=True, schema_version=schema_version, issues=issues
         )
+        result.is_valid = not result.has_errors
+        return result
 
     def _infer_artifact_type(self, artifact_data: dict[str, Any]) -> str | None:
         """Infer artifact type from data structure."""
-        if "activities" in artifact_data and "totalActivities" in artifact_data:
-            return "activity-instances"
-        elif "workflows" in artifact_data and "project" in artifact_data:
-            return "manifest"
-        elif "invocations" in artifact_data:
-            return "invocations"
-
-        return None
+        signature = (
+            ("activities" in artifact_data)
+            | ("totalActivities" in artifact_data) << 1
+            | ("workflows" in artifact_data) << 2
+            | ("project" in artifact_data) << 3
+            | ("invocations" in artifact_data) << 4
+        )
+        return _ARTIFACT_TYPE_BY_SIGNATURE[signature]
 
     def _validate_activity_instances(
-        self, data: dict[str, Any], schema_version: str
+        self, data: dict[str, Any], schema_version: str, fail_fast: bool = False
     ) -> list[ValidationIssue]:
-        """Validate activity instances artifact."""
-        issues = []
-
-        # Required fields for all versions
-        required_fields = [
-            "schemaVersion",
-            "workflowId",
-            "totalActivities",
-            "activities",
-        ]
-        for field in required_fields:
-            if field not in data:
+        """Validate activity instances artifact with the checks for its version.
+
+        Cheap artifact-level checks run before the per-activity loop so that
+        fail-fast mode bails out as early as possible.
+        """
+        issues: list[ValidationIssue] = []
+        sink: _IssueSink = _FailFastIssues(issues) if fail_fast else issues
+
+        validate = self._version_dispatch.get(("activity-instances", schema_version))
+        if validate is None:
+            # Compatible version outside the supported list
+            if parse_version(schema_version) >= V_1_1_0:
+                validate = self._validate_activity_instances_v11
+            else:
+                validate = self._validate_activity_instances_v10
+        validate(data, schema_version, sink)
+
+        return issues
+
+    def _validate_activity_instances_v10(
+        self, data: dict[str, Any], schema_version: str, issues: _IssueSink
+    ) -> None:
+        """Validate a v1.0 activity instances artifact."""
+        self._check_required_fields(data, issues)
+        self._check_activities(data, issues)
+
+    def _validate_activity_instances_v11(
+        self, data: dict[str, Any], schema_version: str, issues: _IssueSink
+    ) -> None:
+        """Validate a v1.1+ activity instances artifact."""
+        self._check_required_fields(data, issues)
+
+        # v1.1 required fields
+        for field_name in _missing_fields(data, _V11_REQUIRED, _V11_REQUIRED_ORDER):
+            issues.append(
+                ValidationIssue(
+                    ValidationSeverity.ERROR,
+                    f"Missing required field for v{schema_version}: {field_name}",
+                    f"$.{field_name}",
+                )
+            )
+
+        visible_count, selector_count = self._check_activities(data, issues)
+
+        if "visibleActivities" in data:
+            declared_visible = data["visibleActivities"]
+            if visible_count != declared_visible:
                 issues.append(
                     ValidationIssue(
-                        ValidationSeverity.ERROR,
-                        f"Missing required field: {field}",
-                        f"$.{field}",
+                        ValidationSeverity.WARNING,
+                        f"Visible activity count mismatch: declared {declared_visible}, found {visible_count}",
+                        "$.visibleActivities",
                     )
                 )
 
-        # Version-specific required fields
-        if SchemaVersion(schema_version) >= SchemaVersion("1.1.0"):
-            v11_required = ["projectId"]
-            for field in v11_required:
-                if field not in data:
-                    issues.append(
-                        ValidationIssue(
-                            ValidationSeverity.ERROR,
-                            f"Missing required field for v{schema_version}: {field}",
-                            f"$.{field}",
-                        )
+        if "activitiesWithSelectors" in data:
+            declared_selector_count = data["activitiesWithSelectors"]
+            if selector_count != declared_selector_count:
+                issues.append(
+                    ValidationIssue(
+                        ValidationSeverity.WARNING,
+                        f"Activities with selectors count mismatch: declared {declared_selector_count}, found {selector_count}",
+                        "$.activitiesWithSelectors",
                     )
+                )
+
+    def _check_required_fields(
+        self, data: dict[str, Any], issues: _IssueSink
+    ) -> None:
+        """Check the artifact-level fields required by all versions."""
+        for field_name in _missing_fields(data, _ARTIFACT_REQUIRED, _ARTIFACT_REQUIRED_ORDER):
+            issues.append(
+                ValidationIssue(
+                    ValidationSeverity.ERROR,
+                    f"Missing required field: {field_name}",
+                    f"$.{field_name}",
+                )
+            )
+
+    def _check_activities(
+        self, data: dict[str, Any], issues: _IssueSink
+    ) -> tuple[int, int]:
+        """Validate the activities list.
 
+        Returns:
+            Visible activity count and count of activities with selectors
+        """
         # Validate activities if present
         activities = data.get("activities", [])
         total_activities = data.get("totalActivities", 0)
@@ -224,155 +417,121 @@ class SimpleArtifactValidator:
                 )
             )
 
-        # Validate individual activities
-        activity_ids = set()
+        # Validate individual activities, aggregating counters in the same pass.
+        # Hot names are bound to locals and issue paths are only formatted
+        # when an issue is reported.
+        append = issues.append
+        issue = ValidationIssue
+        error = ValidationSeverity.ERROR
+        check_id_format = self._validate_activity_id_format
+        missing_fields = _missing_fields
+        activity_ids: dict[str, int] = {}
+        claim_id = activity_ids.setdefault
+        parent_refs: list[tuple[int, str]] = []
+        add_parent_ref = parent_refs.append
+        visible_count = 0
+        selector_count = 0
         for i, activity in enumerate(activities):
-            activity_path = f"$.activities[{i}]"
-
             # Required activity fields
-            activity_required = [
-                "activityId",
-                "workflowId",
-                "activityType",
-                "nodeId",
-                "depth",
-                "arguments",
-                "configuration",
-                "properties",
-                "metadata",
-                "expressions",
-                "variablesReferenced",
-                "selectors",
-                "isVisible",
-            ]
-
-            for field in activity_required:
-                if field not in activity:
-                    issues.append(
-                        ValidationIssue(
-                            ValidationSeverity.ERROR,
-                            f"Activity missing required field: {field}",
-                            f"{activity_path}.{field}",
-                        )
+            missing = missing_fields(
+                activity, _ACTIVITY_REQUIRED, _ACTIVITY_REQUIRED_ORDER
+            )
+            for field_name in missing:
+                append(
+                    issue(
+                        error,
+                        f"Activity missing required field: {field_name}",
+                        f"$.activities[{i}].{field_name}",
                     )
+                )
+
+            # Required fields are indexed directly once known to be present
+            if missing:
+                activity_id = activity.get("activityId", "")
+                depth = activity.get("depth")
+                is_visible = activity.get("isVisible", True)  # missing counts as visible
+                selectors = activity.get("selectors")
+            else:
+                activity_id = activity["activityId"]
+                depth = activity["depth"]
+                is_visible = activity["isVisible"]
+                selectors = activity["selectors"]
 
             # Validate activity ID format
-            activity_id = activity.get("activityId", "")
             if activity_id:
-                if not self._validate_activity_id_format(activity_id):
-                    issues.append(
-                        ValidationIssue(
-                            ValidationSeverity.ERROR,
+                if not check_id_format(activity_id):
+                    append(
+                        issue(
+                            error,
                             f"Invalid activity ID format: {activity_id}",
-                            f"{activity_path}.activityId",
+                            f"$.activities[{i}].activityId",
                         )
                     )
 
-                # Check for duplicates
-                if activity_id in activity_ids:
-                    issues.append(
-                        ValidationIssue(
-                            ValidationSeverity.ERROR,
+                # Check for duplicates (one hash probe records and detects)
+                if claim_id(activity_id, i) != i:
+                    append(
+                        issue(
+                            error,
                             f"Duplicate activity ID: {activity_id}",
-                            f"{activity_path}.activityId",
+                            f"$.activities[{i}].activityId",
                         )
                     )
-                activity_ids.add(activity_id)
 
             # Validate depth is non-negative integer
-            depth = activity.get("depth")
             if depth is not None and (not isinstance(depth, int) or depth < 0):
-                issues.append(
-                    ValidationIssue(
-                        ValidationSeverity.ERROR,
+                append(
+                    issue(
+                        error,
                         f"Invalid depth value: {depth} (must be non-negative integer)",
-                        f"{activity_path}.depth",
+                        f"$.activities[{i}].depth",
                     )
                 )
 
             # Validate isVisible is boolean
-            is_visible = activity.get("isVisible")
             if is_visible is not None and not isinstance(is_visible, bool):
-                issues.append(
-                    ValidationIssue(
-                        ValidationSeverity.ERROR,
+                append(
+                    issue(
+                        error,
                         f"Invalid isVisible value: {is_visible} (must be boolean)",
-                        f"{activity_path}.isVisible",
+                        f"$.activities[{i}].isVisible",
                     )
                 )
+            if is_visible:
+                visible_count += 1
+
+            if selectors:
+                selector_count += 1
 
-        # Check parent-child relationships
-        for i, activity in enumerate(activities):
             parent_id = activity.get("parentActivityId")
-            if parent_id and parent_id not in activity_ids:
-                issues.append(
-                    ValidationIssue(
+            if parent_id:
+                add_parent_ref((i, parent_id))
+
+        # Check parent-child relationships
+        for i, parent_id in parent_refs:
+            if parent_id not in activity_ids:
+                append(
+                    issue(
                         ValidationSeverity.WARNING,
                         f"Parent activity not found: {parent_id}",
                         f"$.activities[{i}].parentActivityId",
                     )
                 )
 
-        # Version-specific validations
-        if SchemaVersion(schema_version) >= SchemaVersion("1.1.0"):
-            # v1.1+ specific validations
-            if "visibleActivities" in data:
-                visible_count = sum(1 for a in activities if a.get("isVisible", True))
-                declared_visible = data["visibleActivities"]
-                if visible_count != declared_visible:
-                    issues.append(
-                        ValidationIssue(
-                            ValidationSeverity.WARNING,
-                            f"Visible activity count mismatch: declared {declared_visible}, found {visible_count}",
-                            "$.visibleActivities",
-                        )
-                    )
-
-            if "activitiesWithSelectors" in data:
-                selector_count = sum(
-                    1
-                    for a in activities
-                    if a.get("selectors") and len(a["selectors"]) > 0
-                )
-                declared_selector_count = data["activitiesWithSelectors"]
-                if selector_count != declared_selector_count:
-                    issues.append(
-                        ValidationIssue(
-                            ValidationSeverity.WARNING,
-                            f"Activities with selectors count mismatch: declared {declared_selector_count}, found {selector_count}",
-                            "$.activitiesWithSelectors",
-                        )
-                    )
-
-        return issues
+        return visible_count, selector_count
 
     def _validate_activity_id_format(self, activity_id: str) -> bool:
         """Validate activity ID format: {projectId}#{workflowId}#{nodeId}#{contentHash}"""
-        parts = activity_id.split("#")
-        if len(parts) != 4:
-            return False
-
-        # Check content hash format (8 hex characters)
-        content_hash = parts[3]
-        if len(content_hash) != 8:
-            return False
-
-        try:
-            int(content_hash, 16)  # Should be valid hex
-        except ValueError:
-            return False
-
-        # Other parts should be non-empty
-        return all(part.strip() for part in parts[:3])
+        return _ACTIVITY_ID_RE.fullmatch(activity_id) is not None
 
     def validate_compatibility(
         self, old_version: str, new_version: str, artifact_type: str
     ) -> tuple[bool, list[str]]:
         """Check if a version upgrade is backward compatible."""
-        old_ver = SchemaVersion(old_version)
-        new_ver = SchemaVersion(new_version)
+        old_ver = parse_version(old_version)
+        new_ver = parse_version(new_version)
 
-        issues = []
+        issues: list[str] = []
 
         # Major version changes break compatibility
         if old_ver.major != new_ver.major:
@@ -399,13 +558,13 @@ class SimpleArtifactValidator:
         self, old_version: str, new_version: str, artifact_type: str
     ) -> list[str]:
         """Generate migration steps for version upgrades."""
-        migration_steps = []
+        migration_steps: list[str] = []
 
-        old_ver = SchemaVersion(old_version)
-        new_ver = SchemaVersion(new_version)
+        old_ver = parse_version(old_version)
+        new_ver = parse_version(new_version)
 
         if artifact_type == "activity-instances":
-            if old_ver < SchemaVersion("1.1.0") and new_ver >= SchemaVersion("1.1.0"):
+            if old_ver < V_1_1_0 and new_ver >= V_1_1_0:
                 migration_steps.extend(
                     [
                         "Add 'projectId' field to root object",
@@ -420,15 +579,14 @@ class SimpleArtifactValidator:
 
 
 def validate_artifact_file(
-    file_path: Path, artifact_type: str | None = None
+    file_path: Path, artifact_type: str | None = None, fail_fast: bool = False
 ) -> ValidationResult:
     """Convenience function to validate an artifact file."""
     try:
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_file(file_path)
 
         validator = SimpleArtifactValidator()
-        return validator.validate_artifact(data, artifact_type)
+        return validator.validate_artifact(data, artifact_type, fail_fast)
 
     except Exception as e:
         return ValidationResult(
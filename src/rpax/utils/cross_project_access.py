@@ -4,17 +4,56 @@ Provides fuzzy project resolution, disambiguation, and cross-project summaries
 optimized for MCP request-response patterns.
 """
 
-import json
 import logging
+import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from operator import attrgetter
+
+from rpax.utils.jsonio import load_json_file, load_json_file_cached
+
+# Optional rapidfuzz import for faster fuzzy matching
+try:
+    from rapidfuzz import fuzz
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
 
 logger = logging.getLogger(__name__)
 
+# Minimum similarity for a fuzzy project match
+FUZZY_CUTOFF = 0.4
+
+
+def _similarity(query: str, candidate: str) -> float:
+    """SequenceMatcher ratio, skipping pairs that cannot reach FUZZY_CUTOFF.
+    
+    Identical strings return 1.0 directly. The length bound
+    2*min(len)/(len+len) and quick_ratio() are cheap upper bounds on
+    ratio(), so pairs below the cutoff return 0.0 without the full match.
+    With rapidfuzz, fuzz.ratio replaces quick_ratio() as the bound: it is
+    the longest-common-subsequence ratio, and SequenceMatcher's matching
+    blocks form a common subsequence, so it never scores below ratio().
+    """
+    if query == candidate:
+        return 1.0
+    total = len(query) + len(candidate)
+    if 2 * min(len(query), len(candidate)) < FUZZY_CUTOFF * total:
+        return 0.0
+    if HAS_RAPIDFUZZ:
+        # Margin so float rounding in fuzz.ratio cannot reject a pair at the cutoff
+        if fuzz.ratio(query, candidate) < FUZZY_CUTOFF * 100 - 1e-6:
+            return 0.0
+        return SequenceMatcher(None, query, candidate).ratio()
+    matcher = SequenceMatcher(None, query, candidate)
+    if matcher.quick_ratio() < FUZZY_CUTOFF:
+        return 0.0
+    return matcher.ratio()
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectMatch:
     """Represents a project match with confidence score."""
     slug: str
@@ -28,9 +67,10 @@ class ProjectMatch:
 class CrossProjectAccessor:
     """Provides MCP-optimized cross-project access patterns."""
     
-    def __init__(self, lake_root: Path):
+    def __init__(self, lake_root: Path) -> None:
         self.lake_root = Path(lake_root)
         self.lake_index = self._load_lake_index()
+        self._build_search_index()
         
     def _load_lake_index(self) -> Optional[Dict[str, Any]]:
         """Load lake index if it exists."""
@@ -39,11 +79,66 @@ class CrossProjectAccessor:
             return None
             
         try:
-            with open(lake_index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            lake_index: Dict[str, Any] = load_json_file(lake_index_path)
         except Exception as e:
             logger.warning(f"Failed to load lake index: {e}")
             return None
+        
+        # Slugs and types repeat across matches and lookups; share one object each
+        for project in lake_index.get("projects", []):
+            for key in ("project_slug", "project_type"):
+                value = project.get(key)
+                if isinstance(value, str):
+                    project[key] = sys.intern(value)
+        return lake_index
+    
+    def _build_search_index(self) -> None:
+        """Lowercase project slugs and names once and index them for lookups.
+        
+        Sets the parallel ``_slugs_lower``/``_names_lower`` lists (lake index
+        order) used for fuzzy scoring, ``_exact_index`` mapping each
+        lowercased slug and name to the indices of projects carrying it, and
+        ``_by_slug`` mapping each slug to its project entry.
+        """
+        projects = self.lake_index.get("projects", []) if self.lake_index else []
+        
+        # First entry wins, as the linear scans it replaces did
+        self._by_slug: Dict[str, Dict[str, Any]] = {}
+        for project in projects:
+            slug = project.get("project_slug")
+            if slug is not None:
+                self._by_slug.setdefault(slug, project)
+        
+        self._slugs_lower = [p.get("project_slug", "").lower() for p in projects]
+        self._names_lower = [p.get("name", "").lower() for p in projects]
+        
+        self._exact_index: Dict[str, List[int]] = {}
+        for index, (slug_lower, name_lower) in enumerate(
+            zip(self._slugs_lower, self._names_lower, strict=True)
+        ):
+            for key in {slug_lower, name_lower}:
+                self._exact_index.setdefault(key, []).append(index)
+    
+    def _fuzzy_confidences(self, query_lower: str) -> Dict[int, float]:
+        """Score the query against every project slug and name.
+        
+        Args:
+            query_lower: Lowercased query
+            
+        Returns:
+            Mapping of project index to the best slug/name similarity (0-1),
+            for projects scoring at least FUZZY_CUTOFF
+        """
+        confidences: Dict[int, float] = {}
+        for index, (slug_lower, name_lower) in enumerate(
+            zip(self._slugs_lower, self._names_lower, strict=True)
+        ):
+            slug_similarity = _similarity(query_lower, slug_lower)
+            name_similarity = _similarity(query_lower, name_lower)
+            confidence = max(slug_similarity, name_similarity)
+            if confidence >= FUZZY_CUTOFF:
+                confidences[index] = confidence
+        return confidences
     
     def resolve_project(self, query: str, max_results: int = 5) -> List[ProjectMatch]:
         """Resolve project from partial name with fuzzy matching.
@@ -59,6 +154,7 @@ class CrossProjectAccessor:
             return []
             
         matches = []
+        matched_slugs: Set[str] = set()
         query_lower = query.lower()
         
         # Get projects from lake index
@@ -66,29 +162,30 @@ class CrossProjectAccessor:
         search_indices = self.lake_index.get("search_indices", {})
         
         # 1. Exact match by slug or name
-        for project in projects:
+        for index in self._exact_index.get(query_lower, []):
+            project = projects[index]
             slug = project.get("project_slug", "")
             name = project.get("name", "")
             display_name = project.get("display_name", name)
             project_type = project.get("project_type", "unknown")
             
-            if query_lower == slug.lower() or query_lower == name.lower():
-                matches.append(ProjectMatch(
-                    slug=slug,
-                    name=name,
-                    display_name=display_name,
-                    project_type=project_type,
-                    confidence=1.0,
-                    match_type="exact"
-                ))
+            matches.append(ProjectMatch(
+                slug=slug,
+                name=name,
+                display_name=display_name,
+                project_type=project_type,
+                confidence=1.0,
+                match_type="exact"
+            ))
+            matched_slugs.add(slug)
         
         # 2. Partial name matching (using existing indices)
         partial_matches = search_indices.get("by_partial_name", {}).get(query_lower, [])
         for slug in partial_matches:
-            if any(m.slug == slug for m in matches):
+            if slug in matched_slugs:
                 continue  # Already have exact match
                 
-            project = next((p for p in projects if p.get("project_slug") == slug), None)
+            project = self._by_slug.get(slug)
             if project:
                 confidence = len(query_lower) / len(slug)  # Longer query = higher confidence
                 matches.append(ProjectMatch(
@@ -99,33 +196,34 @@ class CrossProjectAccessor:
                     confidence=confidence,
                     match_type="partial"
                 ))
+                matched_slugs.add(slug)
         
         # 3. Fuzzy matching for other projects
-        for project in projects:
+        confidences = self._fuzzy_confidences(query_lower)
+        for index in sorted(confidences):
+            project = projects[index]
             slug = project.get("project_slug", "")
             name = project.get("name", "")
             
-            if any(m.slug == slug for m in matches):
+            if slug in matched_slugs:
                 continue  # Already matched
                 
-            # Calculate fuzzy match confidence
-            slug_similarity = SequenceMatcher(None, query_lower, slug.lower()).ratio()
-            name_similarity = SequenceMatcher(None, query_lower, name.lower()).ratio()
-            confidence = max(slug_similarity, name_similarity)
-            
-            # Only include if reasonably similar
-            if confidence >= 0.4:
-                matches.append(ProjectMatch(
-                    slug=slug,
-                    name=name,
-                    display_name=project.get("display_name", name),
-                    project_type=project.get("project_type", "unknown"),
-                    confidence=confidence,
-                    match_type="fuzzy"
-                ))
+            # Only reasonably similar projects were scored
+            confidence = confidences[index]
+            matches.append(ProjectMatch(
+                slug=slug,
+                name=name,
+                display_name=project.get("display_name", name),
+                project_type=project.get("project_type", "unknown"),
+                confidence=confidence,
+                match_type="fuzzy"
+            ))
         
-        # Sort by confidence (descending) and limit results
-        matches.sort(key=lambda m: (-m.confidence, m.slug))
+        # Sort by confidence (descending) and limit results. The sort is
+        # stable, so a slug pre-sort is only needed to break confidence ties.
+        if len({m.confidence for m in matches}) < len(matches):
+            matches.sort(key=attrgetter("slug"))
+        matches.sort(key=attrgetter("confidence"), reverse=True)
         return matches[:max_results]
     
     def get_project_entry_points(self, project_slug: str, detail_level: str = "medium") -> Optional[Dict[str, Any]]:
@@ -142,8 +240,7 @@ class CrossProjectAccessor:
             return None
             
         # Find project in lake index
-        project = next((p for p in self.lake_index.get("projects", []) 
-                       if p.get("project_slug") == project_slug), None)
+        project = self._by_slug.get(project_slug)
         if not project:
             return None
         
@@ -158,11 +255,11 @@ class CrossProjectAccessor:
         if not entry_points_path:
             return None
         
-        # Load entry points file
+        # Load entry points file (cached by mtime and size across calls)
         try:
             full_path = self.lake_root / entry_points_path.replace('\\', '/')
-            with open(full_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            entry_points: Dict[str, Any] = load_json_file_cached(full_path)
+            return entry_points
         except Exception as e:
             logger.warning(f"Failed to load entry points for {project_slug}: {e}")
             return None
@@ -182,7 +279,7 @@ class CrossProjectAccessor:
         projects = self.lake_index.get("projects", [])
         statistics = self.lake_index.get("statistics", {})
         
-        summary = {
+        summary: Dict[str, Any] = {
             "lake_overview": {
                 "total_projects": statistics.get("total_projects", 0),
                 "total_workflows": statistics.get("total_workflows", 0),
@@ -266,8 +363,7 @@ class CrossProjectAccessor:
             return {}
             
         # Find project in lake index
-        project = next((p for p in self.lake_index.get("projects", []) 
-                       if p.get("project_slug") == project_slug), None)
+        project = self._by_slug.get(project_slug)
         if not project:
             return {}
         
@@ -0,0 +1,156 @@
+"""JSON encoding and decoding helpers with an optional orjson fast path.
+
+orjson is used when installed (``pip install rpa-cli[fast]``); otherwise the
+standard library ``json`` module is used. Both raise ``ValueError`` subclasses
+on malformed input, so callers can handle errors uniformly.
+"""
+
+import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Optional orjson import for faster encoding and decoding
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional ijson import for allocation-free syntax checks
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Most recently used parsed files, keyed by (path, loader)
+_FILE_CACHE_SIZE = 128
+_file_cache: OrderedDict[tuple[str, Callable[[Path], Any]], tuple[tuple[int, int], Any]] = (
+    OrderedDict()
+)
+_file_cache_lock = threading.Lock()
+
+# Files at least this large are decoded from a read-only memory map
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode a JSON document from a bytes-like object or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    # json.loads accepts bytearray but not memoryview
+    return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        default: Called for objects the encoder cannot serialize natively
+        indent: Pretty-print with two-space indentation
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(
+        obj, default=default, indent=2 if indent else None, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def load_json_file(path: Path) -> Any:
+    """Read and decode a JSON file in a single call.
+
+    With orjson, files of _MMAP_THRESHOLD bytes or more are decoded straight
+    from a read-only memory map. This avoids copying the file into a bytes
+    object and reads pages from the OS page cache.
+    """
+    if not HAS_ORJSON:
+        return json.loads(path.read_bytes())
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def cached_load(path: Path, loader: Callable[[Path], Any]) -> Any:
+    """Parse a file with ``loader``, reusing the result while the file is unchanged.
+
+    Results are keyed by path and loader and invalidated when the file's
+    mtime or size changes. The parsed data is shared between callers and
+    must be treated as read-only.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read
+    """
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = (str(path), loader)
+
+    with _file_cache_lock:
+        entry = _file_cache.get(key)
+        if entry is not None and entry[0] == signature:
+            _file_cache.move_to_end(key)
+            return entry[1]
+
+    data = loader(path)
+
+    with _file_cache_lock:
+        _file_cache[key] = (signature, data)
+        _file_cache.move_to_end(key)
+        while len(_file_cache) > _FILE_CACHE_SIZE:
+            _file_cache.popitem(last=False)
+    return data
+
+
+def load_json_file_cached(path: Path) -> Any:
+    """Like load_json_file, but cached by mtime and size; see cached_load."""
+    return cached_load(path, load_json_file)
+
+
+def is_cached(path: Path, loader: Callable[[Path], Any] = load_json_file) -> bool:
+    """Return True if cached_load(path, loader) would not re-read the file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    with _file_cache_lock:
+        entry = _file_cache.get((str(path), loader))
+    return entry is not None and entry[0] == (stat.st_mtime_ns, stat.st_size)
+
+
+def verify_json_file(path: Path) -> str | None:
+    """Check that a file holds one well-formed JSON document.
+
+    With ijson the file is tokenized in 64 KiB chunks without building any
+    values; otherwise it is parsed and discarded.
+
+    Returns:
+        None if the file is valid, else the first line of the parser error
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    if HAS_IJSON:
+        try:
+            with open(path, "rb") as f:
+                for _ in ijson.basic_parse(f, buf_size=65536):
+                    pass
+        except ijson.JSONError as e:
+            return str(e).splitlines()[0]
+        return None
+
+    try:
+        load_json_file(path)
+    except ValueError as e:
+        return str(e)
+    return None
@@ -1,15 +1,29 @@
 """Utilities for multi-project lake operations."""
 
-import json
 import logging
+import os
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.table import Table
+from rpax.utils.jsonio import cached_load, load_json_file, load_json_file_cached
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 logger = logging.getLogger(__name__)
-console = Console()
+
+
+@cache
+def _get_console() -> "Console":
+    """Create the shared Rich console on first use.
+    
+    Rich is only imported when something is printed, so library callers
+    that just resolve slugs or load indices never pay for it.
+    """
+    from rich.console import Console
+    return Console()
 
 
 class ProjectNotFoundError(Exception):
@@ -22,7 +36,7 @@ class MultipleProjectsFoundError(Exception):
     pass
 
 
-def find_lake_directory(path: Path) -> Optional[Path]:
+def find_lake_directory(path: Path) -> Path | None:
     """Find the lake directory starting from the given path.
     
     Args:
@@ -31,26 +45,27 @@ def find_lake_directory(path: Path) -> Optional[Path]:
     Returns:
         Path to lake directory if found, None otherwise
     """
-    path = path.resolve()
-    
+    root = os.path.realpath(path)
+
     # Check if path itself is a lake directory
-    if is_lake_directory(path):
-        return path
-    
+    if _is_lake_dir(root):
+        return Path(root)
+
     # Check common lake locations
+    parent = os.path.dirname(root)
     candidates = [
-        path / ".rpax-lake",
-        path / ".rpax-out", 
-        path / "output",
+        os.path.join(root, ".rpax-lake"),
+        os.path.join(root, ".rpax-out"),
+        os.path.join(root, "output"),
         # Also check parent directories
-        path.parent / ".rpax-lake",
-        path.parent / ".rpax-out",
+        os.path.join(parent, ".rpax-lake"),
+        os.path.join(parent, ".rpax-out"),
     ]
-    
+
     for candidate in candidates:
-        if is_lake_directory(candidate):
-            return candidate
-    
+        if _is_lake_dir(candidate):
+            return Path(candidate)
+
     return None
 
 
@@ -63,17 +78,23 @@ def is_lake_directory(path: Path) -> bool:
     Returns:
         True if directory contains lake structure
     """
-    if not path.exists() or not path.is_dir():
+    return _is_lake_dir(os.fspath(path))
+
+
+def _is_lake_dir(path: str) -> bool:
+    """is_lake_directory on a plain string path, without Path objects."""
+    if not os.path.isdir(path):
         return False
-    
+
     # Check for projects.json (multi-project lake)
-    if (path / "projects.json").exists():
+    if os.path.exists(os.path.join(path, "projects.json")):
         return True
-    
+
     # Check for direct manifest.json (single-project lake)
-    if (path / "manifest.json").exists() and (path / "workflows.index.json").exists():
+    if (os.path.exists(os.path.join(path, "manifest.json"))
+            and os.path.exists(os.path.join(path, "workflows.index.json"))):
         return True
-    
+
     return False
 
 
@@ -89,7 +110,7 @@ def is_multi_project_lake(lake_dir: Path) -> bool:
     return (lake_dir / "projects.json").exists()
 
 
-def load_projects_index(lake_dir: Path) -> Dict[str, any]:
+def load_projects_index(lake_dir: Path) -> dict[str, any]:
     """Load projects.json index from lake directory.
     
     Args:
@@ -104,12 +125,11 @@ def load_projects_index(lake_dir: Path) -> Dict[str, any]:
     projects_file = lake_dir / "projects.json"
     if not projects_file.exists():
         raise FileNotFoundError(f"No projects.json found in {lake_dir}")
-    
-    with open(projects_file, encoding="utf-8") as f:
-        return json.load(f)
+
+    return load_json_file(projects_file)
 
 
-def list_project_slugs(lake_dir: Path) -> List[str]:
+def list_project_slugs(lake_dir: Path) -> list[str]:
     """List all project slugs in the lake.
     
     Args:
@@ -120,16 +140,18 @@ def list_project_slugs(lake_dir: Path) -> List[str]:
     """
     if not is_multi_project_lake(lake_dir):
         # Single project lake - infer slug from directory structure
-        for item in lake_dir.iterdir():
-            if item.is_dir() and (item / "manifest.json").exists():
-                return [item.name]
+        # DirEntry.is_dir() answers from the directory listing, no stat per child
+        with os.scandir(lake_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "manifest.json")):
+                    return [entry.name]
         return []
-    
+
     projects = load_projects_index(lake_dir)
     return [project["slug"] for project in projects.get("projects", [])]
 
 
-def resolve_project_slug(lake_dir: Path, project_hint: Optional[str] = None) -> str:
+def resolve_project_slug(lake_dir: Path, project_hint: str | None = None) -> str:
     """Resolve project slug from hint or auto-discover.
     
     Args:
@@ -144,37 +166,41 @@ def resolve_project_slug(lake_dir: Path, project_hint: Optional[str] = None) ->
         MultipleProjectsFoundError: If multiple matches and no disambiguation
     """
     project_slugs = list_project_slugs(lake_dir)
-    
+
     if not project_slugs:
         raise ProjectNotFoundError("No projects found in lake")
-    
+
     # If no hint provided, auto-discover
     if not project_hint:
         if len(project_slugs) == 1:
             return project_slugs[0]
         else:
             # Multiple projects, need disambiguation
+            console = _get_console()
             console.print("[yellow]Multiple projects found in lake:[/yellow]")
             for slug in project_slugs:
                 console.print(f"  - {slug}")
             console.print("\n[dim]Specify project with --project parameter[/dim]")
             raise MultipleProjectsFoundError(f"Found {len(project_slugs)} projects, specify --project")
-    
+
     # Exact match
     if project_hint in project_slugs:
         return project_hint
-    
+
     # Partial match
-    matches = [slug for slug in project_slugs if project_hint.lower() in slug.lower()]
-    
+    hint_lower = project_hint.lower()
+    matches = [slug for slug in project_slugs if hint_lower in slug.lower()]
+
     if len(matches) == 1:
         return matches[0]
     elif len(matches) > 1:
+        console = _get_console()
         console.print(f"[yellow]Multiple projects match '{project_hint}':[/yellow]")
         for slug in matches:
             console.print(f"  - {slug}")
         raise MultipleProjectsFoundError(f"Multiple matches for '{project_hint}'")
     else:
+        console = _get_console()
         console.print(f"[red]No project found matching '{project_hint}'[/red]")
         console.print("[yellow]Available projects:[/yellow]")
         for slug in project_slugs:
@@ -200,17 +226,17 @@ def get_project_artifacts_dir(lake_dir: Path, project_slug: str) -> Path:
     else:
         # Single project lake - artifacts are in lake root
         project_dir = lake_dir
-    
+
     if not project_dir.exists():
         raise ProjectNotFoundError(f"Project directory not found: {project_dir}")
-    
+
     if not (project_dir / "manifest.json").exists():
         raise ProjectNotFoundError(f"No manifest.json found in {project_dir}")
-    
+
     return project_dir
 
 
-def load_workflow_index(artifacts_dir: Path) -> Dict[str, any]:
+def load_workflow_index(artifacts_dir: Path) -> dict[str, any]:
     """Load workflows.index.json from project artifacts directory.
     
     Args:
@@ -225,12 +251,37 @@ def load_workflow_index(artifacts_dir: Path) -> Dict[str, any]:
     index_file = artifacts_dir / "workflows.index.json"
     if not index_file.exists():
         raise FileNotFoundError(f"No workflows.index.json found in {artifacts_dir}")
-    
-    with open(index_file, encoding="utf-8") as f:
-        return json.load(f)
 
+    # Cached by mtime and size; callers must not mutate the result
+    return load_json_file_cached(index_file)
+
+
+@dataclass
+class _WorkflowIndex:
+    """Lookup tables over a workflows.index.json, built once per file version."""
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    by_filename: dict[str, dict[str, Any]] = field(default_factory=dict)
+    paths_lower: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    display_lower: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
 
-def find_workflow_in_project(artifacts_dir: Path, workflow_hint: str) -> Optional[Dict[str, any]]:
+
+def _load_workflow_lookup(index_file: Path) -> _WorkflowIndex:
+    """Build a _WorkflowIndex from a workflows.index.json file."""
+    lookup = _WorkflowIndex()
+    for workflow in load_json_file_cached(index_file).get("workflows", []):
+        # First entry wins, as the sequential scans did
+        workflow_id = workflow.get("id")
+        if workflow_id is not None:
+            lookup.by_id.setdefault(workflow_id, workflow)
+        file_name = workflow.get("fileName")
+        if file_name is not None:
+            lookup.by_filename.setdefault(file_name, workflow)
+        lookup.paths_lower.append(((workflow.get("relativePath") or "").lower(), workflow))
+        lookup.display_lower.append(((workflow.get("displayName") or "").lower(), workflow))
+    return lookup
+
+
+def find_workflow_in_project(artifacts_dir: Path, workflow_hint: str) -> dict[str, any] | None:
     """Find a workflow in project by ID, filename, or partial path.
     
     Args:
@@ -241,36 +292,35 @@ def find_workflow_in_project(artifacts_dir: Path, workflow_hint: str) -> Optiona
         Workflow data if found, None otherwise
     """
     try:
-        index = load_workflow_index(artifacts_dir)
-        workflows = index.get("workflows", [])
-        
-        # Exact ID match
-        for workflow in workflows:
-            if workflow.get("id") == workflow_hint:
-                return workflow
-        
-        # Filename match
-        for workflow in workflows:
-            if workflow.get("fileName") == workflow_hint:
-                return workflow
-        
-        # Partial path match
-        for workflow in workflows:
-            relative_path = workflow.get("relativePath", "")
-            if workflow_hint.lower() in relative_path.lower():
-                return workflow
-        
-        # Display name match
-        for workflow in workflows:
-            display_name = workflow.get("displayName", "")
-            if workflow_hint.lower() in display_name.lower():
-                return workflow
-        
-        return None
-        
+        # Cached by mtime and size alongside the index itself
+        lookup = cached_load(artifacts_dir / "workflows.index.json", _load_workflow_lookup)
     except FileNotFoundError:
         return None
 
+    # Exact ID match
+    workflow = lookup.by_id.get(workflow_hint)
+    if workflow is not None:
+        return workflow
+
+    # Filename match
+    workflow = lookup.by_filename.get(workflow_hint)
+    if workflow is not None:
+        return workflow
+
+    hint_lower = workflow_hint.lower()
+
+    # Partial path match
+    for relative_path, workflow in lookup.paths_lower:
+        if hint_lower in relative_path:
+            return workflow
+
+    # Display name match
+    for display_name, workflow in lookup.display_lower:
+        if hint_lower in display_name:
+            return workflow
+
+    return None
+
 
 def show_project_summary(lake_dir: Path, project_slug: str) -> None:
     """Display summary information for a project.
@@ -281,20 +331,20 @@ def show_project_summary(lake_dir: Path, project_slug: str) -> None:
     """
     try:
         artifacts_dir = get_project_artifacts_dir(lake_dir, project_slug)
-        
+
         # Load manifest
         manifest_file = artifacts_dir / "manifest.json"
-        with open(manifest_file, encoding="utf-8") as f:
-            manifest = json.load(f)
-        
+        manifest = load_json_file(manifest_file)
+
         # Load workflow index
         index = load_workflow_index(artifacts_dir)
-        
+
+        console = _get_console()
         console.print(f"\n[bold blue]Project: {manifest.get('projectName', 'Unknown')}[/bold blue]")
         console.print(f"Slug: {project_slug}")
         console.print(f"Type: {manifest.get('projectType', 'Unknown')}")
         console.print(f"Workflows: {index.get('totalWorkflows', 0)}")
         console.print(f"Entry Points: {len(manifest.get('entryPoints', []))}")
-        
+
     except Exception as e:
-        console.print(f"[red]Error loading project summary: {e}[/red]")
\ No newline at end of file
+        _get_console().print(f"[red]Error loading project summary: {e}[/red]")
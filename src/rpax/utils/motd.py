@@ -6,7 +6,6 @@ silently swallowed — MOTD must never crash the CLI.
 """
 
 import json
-import os
 import threading
 import time
 import urllib.error
@@ -17,6 +16,8 @@ from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 
+from rpax.utils.paths import user_cache_dir
+
 MOTD_URL = (
     "https://raw.githubusercontent.com/rpapub/rpax/motd/motd.json"
 )
@@ -30,13 +31,7 @@ _CACHE_TTL_SECONDS = 86400  # 24 hours
 
 def _cache_path() -> Path:
     """Return OS-appropriate cache file path."""
-    if os.name == "nt":
-        local_app = os.environ.get("LOCALAPPDATA")
-        base = Path(local_app) if local_app else Path.home() / ".cache"
-    else:
-        xdg = os.environ.get("XDG_CACHE_HOME")
-        base = Path(xdg) if xdg else Path.home() / ".cache"
-    return base / "rpa-cli" / "motd-cache.json"
+    return user_cache_dir() / "motd-cache.json"
 
 
 def _is_cache_fresh(path: Path) -> bool:
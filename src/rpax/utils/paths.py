@@ -1,5 +1,8 @@
 """Path normalization utilities for cross-platform compatibility."""
 
+import os
+from pathlib import Path
+
 
 def normalize_path(path: str) -> str:
     """Convert any path to canonical forward slash format.
@@ -24,6 +27,8 @@ def normalize_path(path: str) -> str:
     if not path:
         return path
     
+    # str.replace on a single character is a memchr scan in C; a translate
+    # table is ~30x slower on CPython for typical workflow paths
     return path.replace("\\", "/")
 
 
@@ -43,8 +48,19 @@ def normalize_workflow_path(target_path: str) -> str:
         return target_path
         
     # Remove .xaml extension if present for ID matching
-    normalized = normalize_path(target_path)
-    if normalized.endswith(".xaml"):
-        normalized = normalized[:-5]  # Remove ".xaml"
-        
-    return normalized
\ No newline at end of file
+    return normalize_path(target_path).removesuffix(".xaml")
+
+
+def user_cache_dir() -> Path:
+    """Return the OS-appropriate per-user cache directory for rpa-cli.
+
+    Uses ``%LOCALAPPDATA%`` on Windows and ``$XDG_CACHE_HOME`` elsewhere,
+    falling back to ``~/.cache``. The directory is not created.
+    """
+    if os.name == "nt":
+        local_app = os.environ.get("LOCALAPPDATA")
+        base = Path(local_app) if local_app else Path.home() / ".cache"
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "rpa-cli"
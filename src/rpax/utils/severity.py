@@ -0,0 +1,19 @@
+"""Severity counting shared by the schema validators."""
+
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any
+
+
+def count_severities(
+    issues: Iterable[Any], error: Enum, warning: Enum
+) -> tuple[int, int]:
+    """Count ``error``- and ``warning``-level issues in a single pass."""
+    error_count = 0
+    warning_count = 0
+    for issue in issues:
+        if issue.severity is error:
+            error_count += 1
+        elif issue.severity is warning:
+            warning_count += 1
+    return error_count, warning_count
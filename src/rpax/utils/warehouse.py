@@ -1,6 +1,5 @@
 """Utilities for multi-record archive operations."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -8,6 +7,8 @@ from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
 
+from rpax.utils.jsonio import load_json_file
+
 logger = logging.getLogger(__name__)
 console = Console()
 
@@ -109,14 +110,12 @@ def load_bays_index(warehouse_dir: Path) -> Dict[str, any]:
     """
     records_file = warehouse_dir / "bays.json"
     if records_file.exists():
-        with open(records_file, encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(records_file)
 
     # Legacy fallback: projects.json
     projects_file = warehouse_dir / "projects.json"
     if projects_file.exists():
-        with open(projects_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_file(projects_file)
         # Normalize legacy format: projects[] → bays[]
         if "projects" in data and "bays" not in data:
             data["bays"] = [
@@ -250,8 +249,7 @@ def load_workflow_index(artifacts_dir: Path) -> Dict[str, any]:
     if not index_file.exists():
         raise FileNotFoundError(f"No workflows.index.json found in {artifacts_dir}")
 
-    with open(index_file, encoding="utf-8") as f:
-        return json.load(f)
+    return load_json_file(index_file)
 
 
 def find_workflow_in_record(artifacts_dir: Path, workflow_hint: str) -> Optional[Dict[str, any]]:
@@ -308,8 +306,7 @@ def show_bay_summary(warehouse_dir: Path, bay_id: str) -> None:
 
         # Load manifest
         manifest_file = artifacts_dir / "manifest.json"
-        with open(manifest_file, encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = load_json_file(manifest_file)
 
         # Load workflow index
         index = load_workflow_index(artifacts_dir)
@@ -0,0 +1,25 @@
+"""XML parsing helpers for XAML workflows.
+
+All workflow XML goes through defusedxml, which rejects entity declarations
+and external DTDs before they can be expanded.
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from defusedxml.ElementTree import fromstring as defused_fromstring
+
+
+def parse_xml(data: bytes | str) -> ET.Element:
+    """Parse an XML document and return its root element.
+
+    Raises:
+        ET.ParseError: If the document is malformed
+        defusedxml.DefusedXmlException: If the document declares entities
+    """
+    return defused_fromstring(data)
+
+
+def parse_xml_file(path: Path | str) -> ET.Element:
+    """Read and parse an XML file, returning its root element."""
+    return parse_xml(Path(path).read_bytes())
@@ -4,7 +4,14 @@ This module implements the lightweight validation layer (ADR-010) focused on pip
 rather than semantic correctness. It validates parser artifacts for downstream consumption.
 """
 
-from .framework import ValidationFramework, ValidationResult, ValidationRule
+from .framework import (
+    InvocationRule,
+    InvocationVisitor,
+    InvocationWalker,
+    ValidationFramework,
+    ValidationResult,
+    ValidationRule,
+)
 from .rules import (
     ArgumentsPresenceRule,
     ArtifactsPresenceRule,
@@ -19,6 +26,9 @@ __all__ = [
     "ValidationFramework",
     "ValidationResult",
     "ValidationRule",
+    "InvocationRule",
+    "InvocationVisitor",
+    "InvocationWalker",
     "ArtifactsPresenceRule",
     "RootsResolvableRule",
     "ReferentialIntegrityRule",
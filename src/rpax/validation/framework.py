@@ -4,17 +4,35 @@ Implements the lightweight validation approach from ADR-010 with pluggable rules
 and configurable behavior for CI/CD pipeline integration.
 """
 
-import json
 import logging
+import mmap
+import os
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, partial
 from pathlib import Path
 
 from ..config import RpaxConfig
+from ..utils.jsonio import (
+    cached_load,
+    dumps,
+    load_json_file,
+    load_json_file_cached,
+    loads,
+)
 
 logger = logging.getLogger(__name__)
 
+# invocations.jsonl files larger than this are memory-mapped instead of read
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Upper bound on concurrently running rules; they mostly wait on disk I/O
+_MAX_RULE_WORKERS = 8
+
 
 class ValidationStatus(str, Enum):
     """Validation status according to ADR-010."""
@@ -23,7 +41,12 @@ class ValidationStatus(str, Enum):
     FAIL = "fail"
 
 
-@dataclass
+# Status precedence for promotion: pass < warn < fail
+_RANK_STATUS = (ValidationStatus.PASS, ValidationStatus.WARN, ValidationStatus.FAIL)
+_STATUS_RANK = {status: rank for rank, status in enumerate(_RANK_STATUS)}
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationIssue:
     """A single validation issue found during validation."""
     rule: str
@@ -41,6 +64,19 @@ class ValidationIssue:
         return f"[{self.severity.value.upper()}] {self.rule}: {self.message}{location}"
 
 
+def _issue_to_json(obj: object) -> dict:
+    """JSON default hook emitting a ValidationIssue as in ValidationResult.to_dict()."""
+    if isinstance(obj, ValidationIssue):
+        return {
+            "rule": obj.rule,
+            "severity": obj.severity.value,
+            "message": obj.message,
+            "artifact": obj.artifact,
+            "path": obj.path
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 @dataclass
 class ValidationResult:
     """Results of validation run according to ADR-010."""
@@ -60,15 +96,37 @@ class ValidationResult:
         self.issues.append(issue)
 
         # Update overall status (fail > warn > pass)
-        if severity == ValidationStatus.FAIL:
-            self.status = ValidationStatus.FAIL
-        elif severity == ValidationStatus.WARN and self.status == ValidationStatus.PASS:
-            self.status = ValidationStatus.WARN
+        self.status = _RANK_STATUS[max(_STATUS_RANK[self.status], _STATUS_RANK[severity])]
 
     def increment_counter(self, name: str, value: int = 1) -> None:
         """Increment a counter."""
         self.counters[name] = self.counters.get(name, 0) + value
 
+    def merge(self, other: "ValidationResult") -> None:
+        """Fold another result's issues, counters and status into this one."""
+        self.issues.extend(other.issues)
+        for name, value in other.counters.items():
+            self.increment_counter(name, value)
+
+        self.status = _RANK_STATUS[max(_STATUS_RANK[self.status], _STATUS_RANK[other.status])]
+
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """Serialize to JSON with the same shape as to_dict().
+
+        orjson encodes the ValidationIssue dataclasses natively, so no
+        per-issue dicts are built; _issue_to_json covers the stdlib path.
+        """
+        return dumps(
+            {
+                "status": self.status.value,
+                "exit_code": self.exit_code,
+                "counters": self.counters,
+                "issues": self.issues,
+            },
+            default=_issue_to_json,
+            indent=indent,
+        )
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON output."""
         return {
@@ -91,23 +149,154 @@ class ValidationResult:
 class ValidationRule(ABC):
     """Base class for validation rules."""
 
+    # Rules that share mutable state across runs set this to False so the
+    # framework runs them on the calling thread instead of the worker pool
+    thread_safe: bool = True
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each default entry point delegates to the other, so one must be overridden
+        if (cls.validate is ValidationRule.validate
+                and cls.validate_artifacts is ValidationRule.validate_artifacts):
+            raise TypeError(f"{cls.__name__} must override validate() or validate_artifacts()")
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Rule name for identification."""
         pass
 
-    @abstractmethod
     def validate(self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult) -> None:
         """Execute validation rule.
         
+        Rules that inspect files directly override this method. The default
+        loads the artifacts and delegates to validate_artifacts().
+        
         Args:
             artifacts_dir: Directory containing parser artifacts
             config: rpax configuration
             result: Validation result to update with issues/counters
         """
+        self.validate_artifacts(ArtifactSet.load(artifacts_dir), config, result)
+
+    def validate_artifacts(self, artifacts: "ArtifactSet", config: RpaxConfig,
+                           result: ValidationResult) -> None:
+        """Execute validation rule against already-loaded artifacts.
+        
+        ValidationFramework loads the ArtifactSet once per run and passes it
+        to every rule that overrides this method. The default runs validate()
+        on the artifacts directory.
+        
+        Args:
+            artifacts: Loaded parser artifacts
+            config: rpax configuration
+            result: Validation result to update with issues/counters
+        """
+        self.validate(artifacts.artifacts_dir, config, result)
+
+
+@dataclass
+class InvocationVisitor:
+    """Per-run callbacks an InvocationRule contributes to the invocation pass."""
+    on_invocation: Callable[[int, dict], None]
+    finish: Callable[[], None] | None = None
+
+
+class InvocationRule(ValidationRule):
+    """Base class for rules that walk invocations.jsonl record by record.
+
+    ValidationFramework runs all invocation rules in a single shared pass
+    over ``artifacts.invocations`` instead of one pass per rule. Per-run
+    state lives in the visitor's closures, so rule instances stay reusable.
+    """
+
+    @abstractmethod
+    def invocation_visitor(self, artifacts: "ArtifactSet", config: RpaxConfig,
+                           result: ValidationResult) -> InvocationVisitor | None:
+        """Prepare one run of the rule.
+        
+        Args:
+            artifacts: Loaded parser artifacts
+            config: rpax configuration
+            result: Validation result the visitor updates
+            
+        Returns:
+            Callbacks for each invocation and the end of the pass, or None
+            when the rule has nothing to check
+        """
         pass
 
+    def validate_artifacts(self, artifacts: "ArtifactSet", config: RpaxConfig,
+                           result: ValidationResult) -> None:
+        """Run this rule on its own pass over the invocations."""
+        visitor = self.invocation_visitor(artifacts, config, result)
+        if visitor is None:
+            return
+        on_invocation = visitor.on_invocation
+        for index, invocation in enumerate(artifacts.invocations):
+            on_invocation(index, invocation)
+        if visitor.finish is not None:
+            visitor.finish()
+
+
+def _load_invocations(invocations_path: Path) -> list[dict]:
+    """Parse invocations.jsonl, skipping comments, blank and malformed lines.
+
+    Small files are read in one call; files above _MMAP_THRESHOLD are
+    memory-mapped so they are paged in by the OS rather than copied.
+    """
+    with open(invocations_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                invocations = _parse_invocation_lines(data)
+        else:
+            invocations = _parse_invocation_lines(f.read())
+    _intern_invocation_fields(invocations)
+    return invocations
+
+
+def _intern_invocation_fields(invocations: list[dict]) -> None:
+    """Intern ``kind`` and ``from``/``to`` workflow ids in place.
+
+    Each of these values recurs across many invocation records; interning
+    collapses them to one object apiece and lets set and dict lookups and
+    comparisons against literals match on identity.
+    """
+    intern = sys.intern
+    for invocation in invocations:
+        for key in ("kind", "from", "to"):
+            value = invocation.get(key)
+            if type(value) is str:
+                invocation[key] = intern(value)
+
+
+def _parse_invocation_lines(data: bytes | mmap.mmap) -> list[dict]:
+    """Decode newline-delimited invocation records from a bytes-like buffer."""
+    if isinstance(data, bytes):
+        try:
+            # Clean files need no per-line strip or exception handling; a
+            # comment, blank or malformed line fails the whole pass instead
+            return [loads(line) for line in data.split(b"\n") if line]
+        except ValueError:
+            pass
+
+    invocations = []
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = size
+        line = data[start:end].strip()
+        start = end + 1
+        if line and not line.startswith(b"#"):  # Skip comments and empty lines
+            try:
+                invocations.append(loads(line))
+            except ValueError:
+                # Skip malformed lines (placeholder files may have invalid JSON)
+                continue
+    return invocations
+
 
 @dataclass
 class WorkflowArtifacts:
@@ -128,36 +317,44 @@ class ArtifactSet:
 
     @classmethod
     def load(cls, artifacts_dir: Path) -> "ArtifactSet":
-        """Load artifacts from directory."""
+        """Load artifacts from directory.
+
+        Parsed files are cached by mtime and size, so repeated loads of an
+        unchanged directory share the same (read-only) data.
+        """
         artifacts = cls(artifacts_dir)
 
         # Load manifest.json
         manifest_path = artifacts_dir / "manifest.json"
         if manifest_path.exists():
-            with open(manifest_path, encoding="utf-8") as f:
-                artifacts.manifest = json.load(f)
+            artifacts.manifest = load_json_file_cached(manifest_path)
 
         # Load workflows.index.json
         workflows_path = artifacts_dir / "workflows.index.json"
         if workflows_path.exists():
-            with open(workflows_path, encoding="utf-8") as f:
-                artifacts.workflows_index = json.load(f)
+            artifacts.workflows_index = load_json_file_cached(workflows_path)
 
-        # Load invocations.jsonl (if exists)
+        # Load invocations.jsonl (if exists and is non-empty)
         invocations_path = artifacts_dir / "invocations.jsonl"
-        if invocations_path.exists():
-            with open(invocations_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):  # Skip comments and empty lines
-                        try:
-                            artifacts.invocations.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            # Skip malformed lines (placeholder files may have invalid JSON)
-                            continue
+        try:
+            has_invocations = invocations_path.stat().st_size > 0
+        except OSError:
+            has_invocations = False
+        if has_invocations:
+            artifacts.invocations = cached_load(invocations_path, _load_invocations)
 
         return artifacts
 
+    @cached_property
+    def known_workflow_ids(self) -> frozenset[str]:
+        """Workflow ``id`` values declared in workflows.index.json."""
+        if not self.workflows_index:
+            return frozenset()
+        return frozenset(
+            sys.intern(str(workflow["id"])) for workflow in self.workflows_index.get("workflows", [])
+            if "id" in workflow
+        )
+
     def workflow_artifacts(self, workflow_id: str) -> WorkflowArtifacts:
         """Load per-workflow artifact bundle for a given workflowId.
 
@@ -181,22 +378,76 @@ class ArtifactSet:
 
         tree_path = self.artifacts_dir / "activities.tree" / f"{wf_id}.json"
         if tree_path.exists():
-            with open(tree_path, encoding="utf-8") as f:
-                result.tree = json.load(f)
+            result.tree = load_json_file(tree_path)
 
         instances_path = self.artifacts_dir / "activities.instances" / f"{safe_id}.json"
         if instances_path.exists():
-            with open(instances_path, encoding="utf-8") as f:
-                result.instances = json.load(f)
+            result.instances = load_json_file(instances_path)
 
         pseudocode_path = self.artifacts_dir / "pseudocode" / f"{wf_id}.json"
         if pseudocode_path.exists():
-            with open(pseudocode_path, encoding="utf-8") as f:
-                result.pseudocode = json.load(f)
+            result.pseudocode = load_json_file(pseudocode_path)
 
         return result
 
 
+def _record_rule_failure(name: str, error: Exception, result: ValidationResult) -> None:
+    """Log a rule that raised and record it as a failing issue."""
+    logger.error(f"Rule {name} failed with error: {error}")
+    result.add_issue(
+        name,
+        ValidationStatus.FAIL,
+        f"Rule execution failed: {error}"
+    )
+
+
+class InvocationWalker:
+    """Feed every registered InvocationRule from one pass over the invocations.
+
+    Each rule gets its own ValidationResult. A rule that raises is recorded
+    as failed and dropped from the rest of the pass; the others carry on.
+    """
+
+    def __init__(self, artifacts: ArtifactSet, config: RpaxConfig):
+        self.artifacts = artifacts
+        self.config = config
+        self._visitors: list[tuple[Callable[[int, dict], None], str, ValidationResult,
+                                   Callable[[], None] | None]] = []
+
+    def add(self, rule: InvocationRule) -> ValidationResult:
+        """Prepare a rule for the pass and return the result it will fill."""
+        name = rule.name
+        rule_result = ValidationResult(status=ValidationStatus.PASS)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Executing rule: {name}")
+        try:
+            visitor = rule.invocation_visitor(self.artifacts, self.config, rule_result)
+        except Exception as e:
+            _record_rule_failure(name, e, rule_result)
+            return rule_result
+        if visitor is not None:
+            self._visitors.append((visitor.on_invocation, name, rule_result, visitor.finish))
+        return rule_result
+
+    def run(self) -> None:
+        """Walk the invocations once, then let each surviving rule finish."""
+        visitors = self._visitors
+        for position, invocation in enumerate(self.artifacts.invocations):
+            for visitor in visitors:
+                try:
+                    visitor[0](position, invocation)
+                except Exception as e:
+                    _record_rule_failure(visitor[1], e, visitor[2])
+                    visitors = [other for other in visitors if other is not visitor]
+
+        for _, name, rule_result, finish in visitors:
+            if finish is not None:
+                try:
+                    finish()
+                except Exception as e:
+                    _record_rule_failure(name, e, rule_result)
+
+
 class ValidationFramework:
     """Main validation framework implementing ADR-010."""
 
@@ -222,24 +473,112 @@ class ValidationFramework:
         logger.info(f"Starting validation of artifacts in {artifacts_dir}")
         logger.info(f"Running {len(self.rules)} validation rules")
 
-        # Execute all rules
-        for rule in self.rules:
-            logger.debug(f"Executing rule: {rule.name}")
-            try:
-                rule.validate(artifacts_dir, self.config, result)
-            except Exception as e:
-                logger.error(f"Rule {rule.name} failed with error: {e}")
-                result.add_issue(
-                    rule.name,
-                    ValidationStatus.FAIL,
-                    f"Rule execution failed: {e}"
-                )
+        # Load the artifacts once and hand the same set to every rule
+        try:
+            artifacts: ArtifactSet | None = ArtifactSet.load(artifacts_dir)
+        except Exception as e:
+            # Let each rule load (and fail) on its own, as before sharing
+            logger.debug(f"Shared artifact load failed: {e}")
+            artifacts = None
+
+        rule_results = self._run_jobs(self._build_jobs(artifacts_dir, artifacts))
+        for index in sorted(rule_results):
+            result.merge(rule_results[index])
 
         logger.info(f"Validation completed with status: {result.status.value}")
         logger.info(f"Found {len(result.issues)} issues")
 
         return result
 
+    def _build_jobs(
+        self, artifacts_dir: Path, artifacts: ArtifactSet | None
+    ) -> list[tuple[bool, Callable[[], dict[int, ValidationResult]]]]:
+        """Build one job per rule, plus one shared invocation pass.
+
+        Each job fills fresh results for its rules, keyed by rule index, and
+        is paired with whether it may run on a worker thread.
+        """
+        # Rules walking invocations share one pass over them
+        shared_pass = [
+            (index, rule) for index, rule in enumerate(self.rules)
+            if artifacts is not None and isinstance(rule, InvocationRule)
+            and type(rule).validate is ValidationRule.validate
+        ]
+        if len(shared_pass) < 2:
+            shared_pass = []
+        shared_indices = {index for index, _ in shared_pass}
+
+        jobs: list[tuple[bool, Callable[[], dict[int, ValidationResult]]]] = []
+        for index, rule in enumerate(self.rules):
+            if index not in shared_indices:
+                run = self._bind_rule(rule, artifacts_dir, artifacts)
+                jobs.append((
+                    getattr(rule, "thread_safe", True),
+                    partial(self._run_rule_job, index, rule.name, run),
+                ))
+        if shared_pass and artifacts is not None:
+            jobs.append((
+                all(rule.thread_safe for _, rule in shared_pass),
+                partial(self._walk_invocations, shared_pass, artifacts),
+            ))
+        return jobs
+
+    @staticmethod
+    def _run_jobs(
+        jobs: list[tuple[bool, Callable[[], dict[int, ValidationResult]]]],
+    ) -> dict[int, ValidationResult]:
+        """Run thread-safe jobs concurrently and the rest on this thread.
+
+        Results are keyed by rule index; merging them in rule order keeps the
+        issue list identical to a sequential run.
+        """
+        rule_results: dict[int, ValidationResult] = {}
+        parallel = [job for thread_safe, job in jobs if thread_safe]
+        if len(parallel) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(parallel), _MAX_RULE_WORKERS)) as executor:
+                futures = [executor.submit(job) for job in parallel]
+                for thread_safe, job in jobs:
+                    if not thread_safe:
+                        rule_results.update(job())
+                for future in futures:
+                    rule_results.update(future.result())
+        else:
+            for _, job in jobs:
+                rule_results.update(job())
+        return rule_results
+
+    @staticmethod
+    def _bind_rule(rule: ValidationRule, artifacts_dir: Path,
+                   artifacts: ArtifactSet | None) -> Callable[[RpaxConfig, ValidationResult], None]:
+        """Bind a rule's entry point to the shared artifacts or the directory.
+
+        Rules that only override validate_artifacts() run on the shared
+        ArtifactSet; rules overriding validate() receive the directory.
+        """
+        if artifacts is not None and type(rule).validate is ValidationRule.validate:
+            return partial(rule.validate_artifacts, artifacts)
+        return partial(rule.validate, artifacts_dir)
+
+    def _run_rule_job(self, index: int, name: str,
+                      validate: Callable[[RpaxConfig, ValidationResult], None]) -> dict[int, ValidationResult]:
+        """Execute one rule into a fresh result, recording failures as issues."""
+        rule_result = ValidationResult(status=ValidationStatus.PASS)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Executing rule: {name}")
+        try:
+            validate(self.config, rule_result)
+        except Exception as e:
+            _record_rule_failure(name, e, rule_result)
+        return {index: rule_result}
+
+    def _walk_invocations(self, rules: Sequence[tuple[int, InvocationRule]],
+                          artifacts: ArtifactSet) -> dict[int, ValidationResult]:
+        """Run several invocation rules in a single InvocationWalker pass."""
+        walker = InvocationWalker(artifacts, self.config)
+        rule_results = {index: walker.add(rule) for index, rule in rules}
+        walker.run()
+        return rule_results
+
     def create_default_rules(self) -> None:
         """Create default validation rules according to ADR-010."""
         from .rules import (
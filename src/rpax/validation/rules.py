@@ -3,15 +3,37 @@
 Each rule validates a specific aspect of parser artifacts for pipeline readiness.
 """
 
-import json
 import logging
+import os
+from collections import deque
+from functools import partial
 from pathlib import Path
 
 from ..config import RpaxConfig
-from .framework import ArtifactSet, ValidationResult, ValidationRule, ValidationStatus
+from ..utils.jsonio import is_cached, load_json_file_cached, verify_json_file
+from .framework import (
+    ArtifactSet,
+    InvocationRule,
+    InvocationVisitor,
+    ValidationResult,
+    ValidationRule,
+    ValidationStatus,
+)
 
 logger = logging.getLogger(__name__)
 
+# Invocation kinds the parser emits
+_ALLOWED_KINDS = frozenset({"invoke", "invoke-missing", "invoke-dynamic"})
+
+# Listed in invalid-kind messages
+_ALLOWED_KINDS_STR = ", ".join(sorted(_ALLOWED_KINDS))
+
+# Counter names for valid kinds, formatted once instead of per invocation
+_KIND_COUNTERS = {kind: f"kind_{kind}" for kind in _ALLOWED_KINDS}
+
+# Uncached artifacts larger than this are syntax-checked without parsing
+_STREAM_VERIFY_THRESHOLD = 16 * 1024 * 1024
+
 
 class ArtifactsPresenceRule(ValidationRule):
     """Validate that required artifacts are present."""
@@ -36,16 +58,26 @@ class ArtifactsPresenceRule(ValidationRule):
                     artifact=file_name
                 )
             else:
-                # Verify it's valid JSON
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        json.load(f)
+                # Verify it's valid JSON. Small files are parsed into the file
+                # cache ArtifactSet.load reads from (or taken from it); large
+                # uncached ones are only tokenized, without building values
+                if (file_path.stat().st_size > _STREAM_VERIFY_THRESHOLD
+                        and not is_cached(file_path)):
+                    error = verify_json_file(file_path)
+                else:
+                    try:
+                        load_json_file_cached(file_path)
+                        error = None
+                    except ValueError as e:
+                        error = str(e)
+
+                if error is None:
                     result.increment_counter("artifacts_valid")
-                except json.JSONDecodeError as e:
+                else:
                     result.add_issue(
                         self.name,
                         ValidationStatus.FAIL,
-                        f"Invalid JSON in {file_name}: {e}",
+                        f"Invalid JSON in {file_name}: {error}",
                         artifact=file_name
                     )
 
@@ -57,9 +89,7 @@ class ProvenanceRule(ValidationRule):
     def name(self) -> str:
         return "provenance"
 
-    def validate(self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
-
+    def validate_artifacts(self, artifacts: ArtifactSet, config: RpaxConfig, result: ValidationResult) -> None:
         if not artifacts.manifest:
             result.add_issue(
                 self.name,
@@ -95,20 +125,20 @@ class RootsResolvableRule(ValidationRule):
     def name(self) -> str:
         return "roots_resolvable"
 
-    def validate(self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
-
+    def validate_artifacts(self, artifacts: ArtifactSet, config: RpaxConfig, result: ValidationResult) -> None:
         if not artifacts.manifest:
             return  # Will be caught by artifacts_presence rule
 
-        project_root = Path(artifacts.manifest.get("projectRoot", "."))
+        project_root = artifacts.manifest.get("projectRoot", ".")
         entry_points = artifacts.manifest.get("entryPoints", [])
         main_workflow = artifacts.manifest.get("mainWorkflow")
 
+        # One directory listing per parent directory instead of a stat per root
+        listings = _DirectoryListings()
+
         # Check main workflow
         if main_workflow:
-            main_path = project_root / main_workflow
-            if not main_path.exists():
+            if not listings.exists(os.path.join(project_root, main_workflow)):
                 result.add_issue(
                     self.name,
                     ValidationStatus.FAIL,
@@ -122,8 +152,7 @@ class RootsResolvableRule(ValidationRule):
         # Check entry points
         for i, entry_point in enumerate(entry_points):
             if isinstance(entry_point, dict) and "filePath" in entry_point:
-                entry_path = project_root / entry_point["filePath"]
-                if not entry_path.exists():
+                if not listings.exists(os.path.join(project_root, entry_point["filePath"])):
                     result.add_issue(
                         self.name,
                         ValidationStatus.FAIL,
@@ -135,30 +164,60 @@ class RootsResolvableRule(ValidationRule):
                     result.increment_counter("roots_resolved")
 
 
-class ReferentialIntegrityRule(ValidationRule):
+class _DirectoryListings:
+    """Answer file existence checks from one os.scandir per parent directory.
+
+    Names and directories are compared with os.path.normcase, so lookups
+    stay case-insensitive on Windows like the stat calls they replace, and
+    spellings of one directory that differ only in case or separators
+    share a listing.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[str, set[str]] = {}
+
+    def exists(self, path: str) -> bool:
+        parent, name = os.path.split(path)
+        if not name:
+            return os.path.exists(path)
+        key = os.path.normcase(parent)
+        names = self._names.get(key)
+        if names is None:
+            names = self._names[key] = self._list(parent or ".")
+        return os.path.normcase(name) in names
+
+    @staticmethod
+    def _list(directory: str) -> set[str]:
+        try:
+            with os.scandir(directory) as entries:
+                # Broken symlinks do not exist as far as stat is concerned
+                return {
+                    os.path.normcase(entry.name) for entry in entries
+                    if not entry.is_symlink() or os.path.exists(entry.path)
+                }
+        except OSError:
+            return set()
+
+
+class ReferentialIntegrityRule(InvocationRule):
     """Validate referential integrity in invocations."""
 
     @property
     def name(self) -> str:
         return "referential_integrity"
 
-    def validate(self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
-
+    def invocation_visitor(self, artifacts: ArtifactSet, config: RpaxConfig,
+                           result: ValidationResult) -> InvocationVisitor | None:
         if not artifacts.workflows_index:
-            return  # Will be caught by artifacts_presence rule
-
-        # Build set of known workflow IDs
-        known_workflows = set()
-        workflows = artifacts.workflows_index.get("workflows", [])
-        for workflow in workflows:
-            if "id" in workflow:
-                known_workflows.add(workflow["id"])
+            return None  # Will be caught by artifacts_presence rule
 
+        known_workflows = artifacts.known_workflow_ids
         result.increment_counter("known_workflows", len(known_workflows))
+        if not artifacts.invocations:
+            return None
 
         # Validate invocations
-        for i, invocation in enumerate(artifacts.invocations):
+        def on_invocation(i: int, invocation: dict) -> None:
             if invocation.get("kind") == "invoke":
                 from_id = invocation.get("from")
                 to_id = invocation.get("to")
@@ -181,110 +240,210 @@ class ReferentialIntegrityRule(ValidationRule):
                         path=f"$[{i}].to"
                     )
 
+        return InvocationVisitor(on_invocation)
+
 
-class KindsBoundedRule(ValidationRule):
+class KindsBoundedRule(InvocationRule):
     """Validate that invocation kinds are bounded to allowed values."""
 
     @property
     def name(self) -> str:
         return "kinds_bounded"
 
-    def validate(self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
-
-        allowed_kinds = {"invoke", "invoke-missing", "invoke-dynamic"}
+    def invocation_visitor(self, artifacts: ArtifactSet, config: RpaxConfig,
+                           result: ValidationResult) -> InvocationVisitor | None:
+        if not artifacts.invocations:
+            return None
 
-        for i, invocation in enumerate(artifacts.invocations):
+        def on_invocation(i: int, invocation: dict) -> None:
             kind = invocation.get("kind")
-            if kind and kind not in allowed_kinds:
+            counter = _KIND_COUNTERS.get(kind)
+            if counter is not None:
+                result.increment_counter(counter)
+            elif kind:
                 result.add_issue(
                     self.name,
                     ValidationStatus.FAIL,
-                    f"Invalid invocation kind: {kind}. Allowed: {', '.join(sorted(allowed_kinds))}",
+                    f"Invalid invocation kind: {kind}. Allowed: {_ALLOWED_KINDS_STR}",
                     artifact="invocations.jsonl",
                     path=f"$[{i}].kind"
                 )
-            elif kind in allowed_kinds:
-                result.increment_counter(f"kind_{kind}")
 
+        return InvocationVisitor(on_invocation)
 
-class ArgumentsPresenceRule(ValidationRule):
+
+class ArgumentsPresenceRule(InvocationRule):
     """Validate that invoked workflows have arguments blocks."""
 
     @property
     def name(self) -> str:
         return "arguments_presence"
 
-    def validate(self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
+    def invocation_visitor(self, artifacts: ArtifactSet, config: RpaxConfig,
+                           result: ValidationResult) -> InvocationVisitor | None:
+        if not artifacts.invocations:
+            return None
 
         # For now, just count invocations with arguments
         # Full implementation would require activity-level parsing
-        for invocation in artifacts.invocations:
+        def on_invocation(i: int, invocation: dict) -> None:
             if "arguments" in invocation:
                 result.increment_counter("invocations_with_arguments")
             else:
                 result.increment_counter("invocations_without_arguments")
 
+        return InvocationVisitor(on_invocation)
 
-class CycleDetectionRule(ValidationRule):
+
+class CycleDetectionRule(InvocationRule):
     """Detect cycles in workflow invocation graph."""
 
     @property
     def name(self) -> str:
         return "cycle_detection"
 
-    def validate(self, artifacts_dir: Path, config: RpaxConfig, result: ValidationResult) -> None:
-        artifacts = ArtifactSet.load(artifacts_dir)
-
-        # Build adjacency list from invocations
-        graph: dict[str, set[str]] = {}
-
-        for invocation in artifacts.invocations:
+    def invocation_visitor(self, artifacts: ArtifactSet, config: RpaxConfig,
+                           result: ValidationResult) -> InvocationVisitor | None:
+        if not artifacts.invocations:
+            result.increment_counter("cycles_detected", 0)
+            return None
+
+        # Build adjacency list from invocations over dense integer node ids;
+        # targets are kept in dict keys: deduplicated, in first-seen order
+        node_ids: dict[str, int] = {}
+        adjacency: list[dict[int, None]] = []
+        sources: list[int] = []  # Nodes in the order they first invoke something
+
+        def node_id(workflow_id: str) -> int:
+            node = node_ids.get(workflow_id)
+            if node is None:
+                node = node_ids[workflow_id] = len(adjacency)
+                adjacency.append({})
+            return node
+
+        def on_invocation(i: int, invocation: dict) -> None:
             if invocation.get("kind") == "invoke":
                 from_id = invocation.get("from")
                 to_id = invocation.get("to")
 
                 if from_id and to_id:
-                    if from_id not in graph:
-                        graph[from_id] = set()
-                    graph[from_id].add(to_id)
-
-        # Detect cycles using DFS
-        visited = set()
-        rec_stack = set()
+                    targets = adjacency[node_id(from_id)]
+                    if not targets:
+                        sources.append(node_ids[from_id])
+                    targets[node_id(to_id)] = None
+
+        return InvocationVisitor(
+            on_invocation,
+            partial(self._report_cycles, node_ids, adjacency, sources, config, result),
+        )
+
+    def _report_cycles(self, node_ids: dict[str, int], adjacency: list[dict[int, None]],
+                       sources: list[int], config: RpaxConfig, result: ValidationResult) -> None:
+        """Find cycles in the finished graph and report them."""
+        graph = [list(targets) for targets in adjacency]
+        position = [len(sources)] * len(graph)
+        for rank, node in enumerate(sources):
+            position[node] = rank
+
+        # Every strongly connected component with more than one workflow, or
+        # a workflow invoking itself, contains at least one cycle
         cycles_found = []
-
-        def has_cycle_util(node: str, path: list[str]) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, set()):
-                if neighbor not in visited:
-                    if has_cycle_util(neighbor, path.copy()):
-                        return True
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles_found.append(" -> ".join(cycle))
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        for node in graph:
-            if node not in visited:
-                has_cycle_util(node, [])
+        for component in _strongly_connected_components(graph, sources):
+            if len(component) == 1 and component[0] not in adjacency[component[0]]:
+                continue
+            # Members of a cycle all invoke something, so all are sources
+            start = min(component, key=position.__getitem__)
+            cycles_found.append((position[start], component, _shortest_cycle(graph, start, set(component))))
+        cycles_found.sort(key=lambda found: found[0])
 
         result.increment_counter("cycles_detected", len(cycles_found))
 
-        for cycle in cycles_found:
-            severity = ValidationStatus.FAIL if config.validation.fail_on_cycles else ValidationStatus.WARN
+        severity = ValidationStatus.FAIL if config.validation.fail_on_cycles else ValidationStatus.WARN
+        names = list(node_ids)
+        for _, component, cycle in cycles_found:
+            message = f"Cycle detected: {' -> '.join(names[node] for node in cycle)}"
+            if len(component) > len(cycle) - 1:
+                message += f" ({len(component)} workflows mutually reachable)"
             result.add_issue(
                 self.name,
                 severity,
-                f"Cycle detected: {cycle}",
+                message,
                 artifact="invocations.jsonl"
             )
+
+
+def _strongly_connected_components(graph: list[list[int]], roots: list[int]) -> list[list[int]]:
+    """Tarjan's algorithm with an explicit stack, linear in nodes plus edges.
+
+    Args:
+        graph: Adjacency lists indexed by node id
+        roots: Nodes to start searches from, in order
+
+    Returns:
+        Components in the order Tarjan completes them
+    """
+    index_of = [-1] * len(graph)
+    lowlink = [0] * len(graph)
+    on_stack = [False] * len(graph)
+    stack: list[int] = []
+    components = []
+    next_index = 0
+
+    for root in roots:
+        if index_of[root] >= 0:
+            continue
+        index_of[root] = lowlink[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(graph[root]))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if index_of[neighbor] < 0:
+                    # Descend; this node's remaining edges resume afterwards
+                    index_of[neighbor] = lowlink[neighbor] = next_index
+                    next_index += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = True
+                    work.append((neighbor, iter(graph[neighbor])))
+                    break
+                if on_stack[neighbor] and index_of[neighbor] < lowlink[node]:
+                    lowlink[node] = index_of[neighbor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def _shortest_cycle(graph: list[list[int]], start: int, members: set[int]) -> list[int]:
+    """Shortest path from start back to itself within one component."""
+    parents: dict[int, int | None] = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph[node]:
+            if neighbor == start:
+                path = [node]
+                while (parent := parents[path[-1]]) is not None:
+                    path.append(parent)
+                path.reverse()
+                return path + [start]
+            if neighbor in members and neighbor not in parents:
+                parents[neighbor] = node
+                queue.append(neighbor)
+    return [start]
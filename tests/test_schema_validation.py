@@ -10,15 +10,24 @@ import json
 from pathlib import Path
 from typing import Dict, Any
 
+import pytest
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from rpax import schema_validator
 from rpax.schema_validator import (
-    ArtifactValidator, SchemaRegistry, SchemaVersion, 
-    ValidationSeverity, validate_artifact_file
+    ArtifactValidator, SchemaRegistry, SchemaVersion, ValidationIssue,
+    ValidationResult, ValidationSeverity, validate_artifact_file
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_schema_cache(tmp_path, monkeypatch):
+    """Keep registries built without a cache_path out of the user cache dir."""
+    monkeypatch.setattr(schema_validator, "user_cache_dir", lambda: tmp_path / "cache")
+
+
 def test_schema_registry():
     """Test schema registry loading and version management."""
     print("=== Testing Schema Registry ===")
@@ -416,6 +425,176 @@ def test_real_artifact_validation():
     return validated_count > 0
 
 
+def test_schema_registry_disk_cache(tmp_path, monkeypatch):
+    """A fresh registry cache replaces parsing the schema files."""
+    cache_path = tmp_path / "schema-registry.json"
+    registry = SchemaRegistry(cache_path=cache_path)
+    assert cache_path.exists()
+
+    def fail_parse(self, schema_files):
+        raise AssertionError("schema files should not be parsed on a cache hit")
+
+    monkeypatch.setattr(SchemaRegistry, "_parse_schema_files", fail_parse)
+    cached = SchemaRegistry(cache_path=cache_path)
+
+    assert cached.schemas == registry.schemas
+
+
+def test_schema_registry_stale_cache_is_reparsed(tmp_path):
+    """A stale cache is never served; schema files are re-parsed first."""
+    cache_path = tmp_path / "schema-registry.json"
+    registry = SchemaRegistry(cache_path=cache_path)
+
+    document = json.loads(cache_path.read_text(encoding="utf-8"))
+    document["fingerprint"]["files"] = {}
+    document["schemas"] = {"stale": {"1.0.0": {}}}
+    cache_path.write_text(json.dumps(document), encoding="utf-8")
+
+    refreshed = SchemaRegistry(cache_path=cache_path)
+
+    assert refreshed.schemas == registry.schemas
+    assert refreshed.get_schema("stale") is None
+    rewritten = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert rewritten["fingerprint"]["files"]
+
+
+def test_schema_registry_failed_cache_write_leaves_no_temp_file(
+    tmp_path, monkeypatch
+):
+    """A failed cache rename removes its temporary file."""
+
+    def fail_replace(self, target):
+        raise OSError("simulated rename failure")
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+    registry = SchemaRegistry(cache_path=tmp_path / "schema-registry.json")
+
+    assert registry.schemas
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_artifact_validator_uses_given_cache_path(tmp_path):
+    cache_path = tmp_path / "registry.json"
+
+    ArtifactValidator(cache_path=cache_path)
+
+    assert cache_path.exists()
+    assert not (tmp_path / "cache").exists()
+
+
+def test_schema_errors_capped_by_max_errors():
+    """Schema validation collects every error up to the max_errors cap."""
+    artifact = {
+        "schemaVersion": "1.0.0",
+        "workflowId": "w",
+        "totalActivities": 3,
+        "activities": [{"activity_id": n} for n in range(3)],
+    }
+    validator = ArtifactValidator()
+
+    capped = validator.validate_artifact(artifact, "activity-instances", max_errors=2)
+    uncapped = validator.validate_artifact(artifact, "activity-instances")
+
+    assert not capped.is_valid
+    assert capped.error_count == 2
+    assert uncapped.error_count > 2
+
+
+def test_validation_result_counts_follow_issues():
+    """Counts are computed at construction and kept current by add_issue."""
+    result = ValidationResult(
+        is_valid=True,
+        schema_version="1.0.0",
+        issues=[ValidationIssue(ValidationSeverity.INFO, "i", "$")],
+    )
+    assert not result.has_errors and not result.has_warnings
+
+    result.add_issue(ValidationIssue(ValidationSeverity.WARNING, "w", "$"))
+    result.add_issue(ValidationIssue(ValidationSeverity.ERROR, "e", "$"))
+
+    assert (result.error_count, result.warning_count) == (1, 1)
+    assert len(result.issues) == 3
+    assert result.has_errors and result.has_warnings
+
+
+def test_activity_parent_cycle_detected():
+    """Parent references that loop back are reported once per cycle."""
+    data = {
+        "totalActivities": 4,
+        "activities": [
+            {"activityId": "a", "parentActivityId": "c"},
+            {"activityId": "b", "parentActivityId": "a"},
+            {"activityId": "c", "parentActivityId": "b"},
+            {"activityId": "d", "parentActivityId": "a"},
+        ],
+    }
+
+    issues = ArtifactValidator()._validate_activity_instances_rules(data, "1.0.0")
+
+    cycles = [i for i in issues if i.message == "Cycle in parent activity chain"]
+    assert len(cycles) == 1
+    assert cycles[0].severity == ValidationSeverity.ERROR
+
+
+def _stream_test_artifact(depth_value=0):
+    """Build a small v1.1.0 activity instances artifact for streaming tests."""
+    def activity(n):
+        return {
+            "activity_id": f"p#w#Activity_{n}#0000000{n}",
+            "workflow_id": "w",
+            "activity_type": "Sequence",
+            "node_id": f"Activity_{n}",
+            "depth": depth_value if n == 2 else 0,
+            "arguments": {},
+            "configuration": {},
+            "properties": {},
+            "metadata": {},
+            "expressions": [],
+            "variables_referenced": [],
+            "selectors": {},
+            "is_visible": True,
+            "visible_attributes": {},
+            "invisible_attributes": {},
+            "variables": [],
+            "child_activities": [],
+            "expression_objects": [],
+            "xpath_location": None,
+            "source_line": None,
+        }
+
+    return {
+        "schemaVersion": "1.1.0",
+        "workflowId": "w",
+        "projectId": "p",
+        "totalActivities": 3,
+        "activities": [activity(1), activity(2), activity(3)],
+    }
+
+
+def _issue_summary(result):
+    return [(i.severity, i.message, i.path, i.schema_path) for i in result.issues]
+
+
+def test_streaming_validation_matches_in_memory(tmp_path):
+    """Streamed activity-instances validation reports the same issues."""
+    pytest.importorskip("ijson")
+
+    for artifact in (_stream_test_artifact(), _stream_test_artifact("deep")):
+        artifact_file = tmp_path / "artifact.json"
+        artifact_file.write_text(json.dumps(artifact), encoding="utf-8")
+
+        with open(artifact_file, "rb") as f:
+            streamed = ArtifactValidator().validate_artifact_stream(f)
+        in_memory = ArtifactValidator().validate_artifact(
+            artifact, "activity-instances"
+        )
+
+        assert streamed.is_valid == in_memory.is_valid
+        assert _issue_summary(streamed) == _issue_summary(in_memory)
+
+    assert any(i.path == "$.activities[1].depth" for i in streamed.issues)
+
+
 def main():
     """Run all schema validation tests."""
     print("Testing Schema Validation and Versioning System")
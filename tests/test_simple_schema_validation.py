@@ -14,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from rpax.simple_schema_validator import (
     SimpleArtifactValidator, SchemaVersion, 
-    ValidationSeverity, validate_artifact_file
+    ValidationSeverity, validate_artifact_file, parse_version
 )
 
 
@@ -39,6 +39,13 @@ def test_schema_version_comparison():
     assert not v100.is_compatible_with(v200), "Major compatibility should fail"
     print("OK - Version compatibility checks work correctly")
     
+    # Parsed versions are cached and compare by value
+    assert parse_version("1.1.0") is parse_version("1.1.0"), "Version cache miss"
+    assert parse_version("1.1.0") == v110, "Cached version equality failed"
+    assert v110 >= v101 and v110 <= v200, "Range comparison failed"
+    assert len({v110, SchemaVersion("1.1.0")}) == 1, "Version hashing failed"
+    print("OK - Parsed versions are cached")
+    
     return True
 
 
@@ -228,6 +235,31 @@ def test_invalid_activity_artifact():
     return tests_passed == 3
 
 
+def test_fail_fast_stops_at_first_error():
+    """Test that fail-fast mode stops after the first error-level issue."""
+    print("\n=== Testing Fail-Fast Validation ===")
+    
+    validator = SimpleArtifactValidator()
+    invalid_artifact = {
+        "schemaVersion": "1.1.0",
+        "workflowId": "test-workflow",
+        # Missing projectId, totalActivities, activities
+    }
+    
+    full = validator.validate_artifact(invalid_artifact, "activity-instances")
+    fast = validator.validate_artifact(
+        invalid_artifact, "activity-instances", fail_fast=True
+    )
+    
+    assert full.error_count > 1, "Expected several errors without fail-fast"
+    assert not fast.is_valid, "Fail-fast result should be invalid"
+    assert fast.error_count == 1, "Fail-fast should stop at the first error"
+    assert fast.issues[0] == full.issues[0], "Fail-fast should report the first error"
+    print("OK - Fail-fast validation stops at first error")
+    
+    return True
+
+
 def test_backward_compatibility():
     """Test backward compatibility validation."""
     print("\n=== Testing Backward Compatibility ===")
@@ -374,6 +406,7 @@ def main():
         ("Schema Version Comparison", test_schema_version_comparison),
         ("Valid Activity Artifact", test_valid_activity_artifact),
         ("Invalid Activity Artifacts", test_invalid_activity_artifact),
+        ("Fail-Fast Validation", test_fail_fast_stops_at_first_error),
         ("Backward Compatibility", test_backward_compatibility),
         ("Migration Guidance", test_migration_guidance),
         ("Real Artifact Validation", test_real_artifact_validation),
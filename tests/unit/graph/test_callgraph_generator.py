@@ -0,0 +1,34 @@
+"""Unit tests for rpax.graph.callgraph_generator."""
+
+from rpax.config import ProjectConfig, ProjectType, RpaxConfig
+from rpax.graph.callgraph_generator import CallGraphGenerator
+from rpax.models.callgraph import WorkflowNode
+
+
+def _node(workflow_id: str) -> WorkflowNode:
+    return WorkflowNode(workflow_id=workflow_id, workflow_path=workflow_id, display_name=workflow_id)
+
+
+def test_process_invocations_records_each_caller_once_in_call_order():
+    workflows = {
+        workflow_id: _node(workflow_id)
+        for workflow_id in ("Main.xaml", "Process.xaml", "Log.xaml")
+    }
+    workflows["Log.xaml"].dependents.append("Init.xaml")
+    invocations = [
+        {"from": f"proj#{source}#abcd", "targetPath": target, "kind": "invoke"}
+        for source, target in [
+            ("Main.xaml", "Log.xaml"),
+            ("Process.xaml", "Log.xaml"),
+            ("Main.xaml", "Log.xaml"),
+            ("Main.xaml", "Process.xaml"),
+            ("Init.xaml", "Log.xaml"),
+        ]
+    ]
+
+    generator = CallGraphGenerator(RpaxConfig(project=ProjectConfig(type=ProjectType.PROCESS)))
+    generator._process_invocations(workflows, invocations)
+
+    assert workflows["Log.xaml"].dependents == ["Init.xaml", "Main.xaml", "Process.xaml"]
+    assert workflows["Process.xaml"].dependents == ["Main.xaml"]
+    assert len(workflows["Main.xaml"].dependencies) == 3
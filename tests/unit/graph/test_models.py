@@ -0,0 +1,37 @@
+"""Unit tests for rpax.graph.models."""
+
+from rpax.graph.models import EdgeKind, EdgeSpec, GraphSpec
+
+
+def _graph(*edges: tuple[str, str], kind: EdgeKind = EdgeKind.INVOKE) -> GraphSpec:
+    graph = GraphSpec(title="test")
+    for from_node, to_node in edges:
+        graph.add_edge(EdgeSpec(from_node=from_node, to_node=to_node, kind=kind))
+    return graph
+
+
+def test_detect_cycles_finds_self_and_mutual_cycles():
+    cycles = _graph(("a", "b"), ("b", "a"), ("c", "c"), ("b", "d")).detect_cycles()
+
+    assert sorted(cycles) == [["a", "b", "a"], ["c", "c"]]
+
+
+def test_detect_cycles_ignores_non_invoke_edges():
+    assert _graph(("a", "b"), ("b", "a"), kind=EdgeKind.INVOKE_MISSING).detect_cycles() == []
+
+
+def test_detect_cycles_handles_deep_chains():
+    depth = 5000
+    graph = _graph(*((f"w{i}", f"w{i + 1}") for i in range(depth)), (f"w{depth}", "w0"))
+
+    [cycle] = graph.detect_cycles()
+
+    assert cycle[0] == cycle[-1] == "w0"
+    assert len(cycle) == depth + 2
+
+
+def test_mark_cycles_flags_cycle_edges():
+    graph = _graph(("a", "b"), ("b", "a"), ("b", "c"))
+    graph.mark_cycles()
+
+    assert [edge.has_cycle for edge in graph.edges] == [True, True, False]
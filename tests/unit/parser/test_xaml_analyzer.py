@@ -0,0 +1,132 @@
+"""Tests for the legacy XamlAnalyzer element scans."""
+
+import hashlib
+import xml.etree.ElementTree as ET
+
+from rpax.parser.xaml_analyzer import XamlAnalyzer
+
+WORKFLOW_XAML = """\
+<Activity x:Class="Main"
+    xmlns="http://schemas.microsoft.com/netfx/2009/xaml/activities"
+    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
+    xmlns:ui="http://schemas.uipath.com/workflow/activities">
+  <x:Members>
+    <x:Property Name="in_Config" Type="InArgument(x:String)" />
+    <x:Property Name="out_Result" Type="OutArgument(x:Int32)" />
+  </x:Members>
+  <Sequence DisplayName="Main Sequence">
+    <Sequence.Variables>
+      <Variable x:TypeArguments="x:String" Name="filePath" />
+    </Sequence.Variables>
+    <ui:InvokeWorkflowFile DisplayName="Invoke Helper" WorkflowFileName="Helper.xaml" />
+    <Assign DisplayName="Assign Result" />
+  </Sequence>
+</Activity>
+"""
+
+
+class TestXamlAnalyzerScans:
+    """Test namespace-agnostic element lookups."""
+
+    def setup_method(self):
+        self.analyzer = XamlAnalyzer()
+        self.root = ET.fromstring(WORKFLOW_XAML)
+
+    def test_find_elements_by_local_name_ignores_namespaces(self):
+        found = self.analyzer._find_elements_by_local_name(self.root, "Property")
+
+        assert [element.get("Name") for element in found] == ["in_Config", "out_Result"]
+        assert self.analyzer._find_elements_by_local_name(self.root, "Activity") == [self.root]
+        assert self.analyzer._find_elements_by_local_name(self.root, "Members.Property") == []
+
+    def test_find_elements_by_local_name_matches_unqualified_tags(self):
+        root = ET.fromstring("<Root><Variable Name='a' /><Wrapper><Variable Name='b' /></Wrapper></Root>")
+
+        found = self.analyzer._find_elements_by_local_name(root, "Variable")
+
+        assert [element.get("Name") for element in found] == ["a", "b"]
+
+    def test_collect_elements_by_local_name_matches_single_lookups(self):
+        names = ("Activity", "Property", "Variable", "Sequence", "Members.Property")
+
+        found = self.analyzer._collect_elements_by_local_name(self.root, names)
+
+        for name in names:
+            assert found[name] == self.analyzer._find_elements_by_local_name(self.root, name)
+
+    def test_extract_variables(self):
+        assert [variable["name"] for variable in self.analyzer._extract_variables(self.root)] == ["filePath"]
+
+    def test_find_dynamic_invocations(self, tmp_path):
+        root = ET.fromstring(
+            WORKFLOW_XAML.replace(
+                '<Assign DisplayName="Assign Result" />',
+                '<Assign DisplayName="Assign Result"><InArgument>'
+                '[Path.Combine(folder, "Dyn.xaml")]</InArgument></Assign>',
+            )
+        )
+
+        found = self.analyzer._find_dynamic_invocations(root, tmp_path / "Main.xaml")
+
+        assert [(invocation.kind, invocation.activity_name) for invocation in found] == [
+            ("invoke-dynamic", "Dynamic Path.Combine"),
+            ("invoke-dynamic", "Variable Expression"),
+        ]
+
+    def test_is_activity_element(self):
+        assert self.analyzer._is_activity_element(ET.Element("{http://schemas.uipath.com/workflow/activities}Click"))
+        assert self.analyzer._is_activity_element(ET.Element("Custom", DisplayName="Do it"))
+        assert self.analyzer._is_activity_element(ET.Element("InvokeActivity"))
+        assert not self.analyzer._is_activity_element(ET.Element("Sequence.Variables"))
+
+    def test_extract_activity_node_splits_arguments_and_children(self):
+        sequence = self.analyzer._find_elements_by_local_name(self.root, "Sequence")[0]
+        ET.SubElement(sequence, "Sequence.Timeout").text = " 00:00:30 "
+
+        node = self.analyzer._extract_activity_node(sequence, "root.0")
+
+        assert node.arguments == {"Sequence.Variables": "", "Sequence.Timeout": "00:00:30"}
+        assert [(child.node_id, child.activity_type) for child in node.children] == [
+            ("root.0.0", "InvokeWorkflowFile"),
+            ("root.0.1", "Assign"),
+        ]
+
+    def test_determine_invocation_kind_detects_expressions(self, tmp_path):
+        xaml_path = tmp_path / "Main.xaml"
+
+        for workflow_file in ("[wfPath]", "{dynamic}", "folder + name", 'Path.Combine(a, "b.xaml")'):
+            assert self.analyzer._determine_invocation_kind(workflow_file, xaml_path) == "invoke-dynamic"
+        assert self.analyzer._determine_invocation_kind("Missing.xaml", xaml_path) == "invoke-missing"
+
+    def test_determine_invocation_kind_resolves_from_project_root(self, tmp_path):
+        (tmp_path / "project.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "Framework").mkdir()
+        (tmp_path / "Framework" / "Init.xaml").write_text("<Activity />", encoding="utf-8")
+        nested = tmp_path / "Workflows" / "Orders" / "Process"
+        nested.mkdir(parents=True)
+
+        kind = self.analyzer._determine_invocation_kind("Framework/Init.xaml", nested / "Main.xaml")
+
+        assert kind == "invoke"
+        assert self.analyzer._project_roots == {nested: tmp_path}
+        assert self.analyzer._determine_invocation_kind("Coded/Step.cs", nested / "Main.xaml") == "invoke-coded"
+
+    def test_extract_activity_tree_hashes_supplied_content(self, tmp_path):
+        xaml_path = tmp_path / "Main.xaml"
+        content = WORKFLOW_XAML.encode("utf-8")
+        xaml_path.write_bytes(content)
+
+        from_file = self.analyzer.extract_activity_tree(xaml_path)
+        xaml_path.unlink()
+        from_content = self.analyzer.extract_activity_tree(xaml_path, root=self.root, content=content)
+
+        assert from_file.content_hash == from_content.content_hash == hashlib.sha256(content).hexdigest()
+
+    def test_analyze_argument_property_direction(self):
+        def direction(name, **attrib):
+            return self.analyzer._analyze_argument_property(ET.Element("Property", Name=name, **attrib)).direction
+
+        assert [direction(name) for name in ("in_Config", "Out_Result", "IO_Row", "outbox", "io")] == [
+            "In", "Out", "InOut", "In", "In",
+        ]
+        assert direction("out_Result", Direction="InOut") == "InOut"
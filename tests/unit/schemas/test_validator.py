@@ -0,0 +1,191 @@
+"""Tests for rpax.schemas.validator.ArtifactValidator."""
+
+import json
+
+import pytest
+
+from rpax.models.manifest import ProjectManifest
+from rpax.schemas import ArtifactValidator, SchemaGenerator
+
+
+@pytest.fixture(scope="module")
+def schemas():
+    """Schemas generated from the rpax Pydantic models."""
+    return SchemaGenerator().generate_all_schemas()
+
+
+@pytest.fixture
+def manifest_data():
+    """A valid manifest artifact as written by the parser."""
+    manifest = ProjectManifest(
+        projectName="TestProject",
+        projectType="process",
+        projectRoot="/projects/test",
+        rpaxVersion="0.1.0",
+        generatedAt="2025-09-05T12:00:00Z",
+        mainWorkflow="Main.xaml",
+        totalWorkflows=1,
+    )
+    return json.loads(manifest.model_dump_json(by_alias=True))
+
+
+@pytest.mark.parametrize("model_fast_path", [False, True])
+def test_valid_manifest(tmp_path, schemas, manifest_data, model_fast_path):
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(json.dumps(manifest_data), encoding="utf-8")
+
+    validator = ArtifactValidator(schemas, model_fast_path=model_fast_path)
+
+    assert validator.validate_artifact_file(manifest_file, "manifest") == []
+
+
+@pytest.mark.parametrize("model_fast_path", [False, True])
+def test_invalid_manifest_reports_schema_errors(
+    tmp_path, schemas, manifest_data, model_fast_path
+):
+    manifest_data["totalWorkflows"] = "1"
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(json.dumps(manifest_data), encoding="utf-8")
+
+    validator = ArtifactValidator(schemas, model_fast_path=model_fast_path)
+    errors = validator.validate_artifact_file(manifest_file, "manifest")
+
+    assert len(errors) == 1
+    assert "totalWorkflows" in errors[0].path
+
+
+@pytest.mark.parametrize("model_fast_path", [False, True])
+def test_snake_case_manifest_is_rejected(tmp_path, schemas, model_fast_path):
+    manifest = ProjectManifest(
+        projectName="TestProject",
+        projectType="process",
+        projectRoot="/projects/test",
+        rpaxVersion="0.1.0",
+        generatedAt="2025-09-05T12:00:00Z",
+        mainWorkflow="Main.xaml",
+        totalWorkflows=1,
+    )
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(manifest.model_dump_json(by_alias=False), encoding="utf-8")
+
+    validator = ArtifactValidator(schemas, model_fast_path=model_fast_path)
+
+    assert validator.validate_artifact_file(manifest_file, "manifest")
+
+
+def test_model_fast_path_skips_json_load(tmp_path, schemas, manifest_data, monkeypatch):
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(json.dumps(manifest_data), encoding="utf-8")
+
+    validator = ArtifactValidator(schemas, model_fast_path=True)
+    monkeypatch.setattr(
+        validator,
+        "_validate_with_jsonschema",
+        lambda *args: pytest.fail("jsonschema should not run for valid artifacts"),
+    )
+
+    assert validator.validate_artifact_file(manifest_file, "manifest") == []
+
+
+def test_invocation_records_validated_with_compiled_validator(tmp_path, schemas):
+    invocations_file = tmp_path / "invocations.jsonl"
+    records = [
+        {"kind": "invoke", "from": "Main.xaml", "to": "Child.xaml"},
+        {"kind": "call", "from": "Main.xaml", "to": "Other.xaml"},
+    ]
+    invocations_file.write_text(
+        "\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8"
+    )
+
+    validator = ArtifactValidator(schemas)
+    errors = validator.validate_artifact_file(invocations_file, "invocation")
+
+    assert "invocation" in validator._compiled
+    assert [e.path for e in errors] == ["record[1].$.kind"]
+
+
+def test_invocation_stream_spans_blocks(tmp_path, schemas, monkeypatch):
+    monkeypatch.setattr("rpax.schemas.validator._JSONL_BLOCK_SIZE", 16)
+    invocations_file = tmp_path / "invocations.jsonl"
+    invocations_file.write_bytes(
+        b'# comment\n'
+        b'{"kind": "invoke", "from": "Main.xaml", "to": "Child.xaml"}\n'
+        b'\n'
+        b'{not json}\n'
+        b'{"kind": "call", "from": "Main.xaml", "to": "Other.xaml"}'
+    )
+
+    validator = ArtifactValidator(schemas)
+    errors = validator.validate_artifact_file(invocations_file, "invocation")
+
+    assert [e.path for e in errors] == [
+        f"{invocations_file}:line 4",
+        "record[1].$.kind",
+    ]
+
+
+def test_invalid_schema_reported_not_raised(tmp_path):
+    artifact_file = tmp_path / "manifest.json"
+    artifact_file.write_text("{}", encoding="utf-8")
+
+    validator = ArtifactValidator({"manifest": {"type": "not-a-type"}})
+    errors = validator.validate_artifact_file(artifact_file, "manifest")
+
+    assert len(errors) == 1
+    assert "Invalid schema" in errors[0].message
+
+
+def test_fastjsonschema_backend_matches_jsonschema(tmp_path, schemas):
+    pytest.importorskip("fastjsonschema")
+    invocations_file = tmp_path / "invocations.jsonl"
+    records = [
+        {"kind": "invoke", "from": "Main.xaml", "to": "Child.xaml"},
+        {"kind": "call", "from": "Main.xaml", "to": "Other.xaml"},
+    ]
+    invocations_file.write_text(
+        "\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8"
+    )
+
+    validator = ArtifactValidator(schemas, backend="fastjsonschema")
+    errors = validator.validate_artifact_file(invocations_file, "invocation")
+
+    assert "invocation" in validator._fast
+    assert [e.path for e in errors] == ["record[1].$.kind"]
+
+
+def test_compiled_validators_shared_across_instances(schemas):
+    first = ArtifactValidator(schemas)
+    second = ArtifactValidator({k: dict(v) for k, v in schemas.items()})
+
+    assert second._compiled["manifest"] is first._compiled["manifest"]
+
+
+def test_validate_all_artifacts_keeps_artifact_order(tmp_path, schemas, manifest_data):
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest_data), encoding="utf-8")
+    (tmp_path / "workflows.index.json").write_text("{not json", encoding="utf-8")
+
+    validator = ArtifactValidator(schemas)
+    results = validator.validate_all_artifacts(tmp_path)
+
+    assert list(results) == ["manifest", "workflow_index"]
+    assert results["manifest"] == []
+    assert "Failed to load file" in results["workflow_index"][0].message
+
+
+def test_unchanged_file_reuses_cached_result(tmp_path, schemas, manifest_data, monkeypatch):
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(json.dumps(manifest_data), encoding="utf-8")
+
+    validator = ArtifactValidator(schemas)
+    assert validator.validate_artifact_file(manifest_file, "manifest") == []
+
+    def fail_validate(*args):
+        raise AssertionError("cached result not used")
+
+    monkeypatch.setattr(validator, "_validate_file", fail_validate)
+    assert validator.validate_artifact_file(manifest_file, "manifest") == []
+
+    monkeypatch.undo()
+    manifest_data.pop("projectName")
+    manifest_file.write_text(json.dumps(manifest_data), encoding="utf-8")
+    assert validator.validate_artifact_file(manifest_file, "manifest") != []
@@ -200,3 +200,15 @@ class TestActivityModels:
         assert metrics.loop_count == 2
         assert metrics.invoke_count == 3
         assert metrics.log_count == 4
+
+    def test_per_activity_models_are_slotted(self):
+        """Test models created once per activity or edge carry no instance dict."""
+        node = ActivityNode("root", "Sequence", "Root")
+        edge = ControlFlowEdge("root.0", "root.1", "seq-next")
+        reference = ResourceReference("file", "Config", "Config.xlsx", "root.0", "FileName")
+
+        for instance in (node, edge, reference):
+            assert not hasattr(instance, "__dict__")
+
+        node.continue_on_error = "True"
+        assert node.continue_on_error == "True"
@@ -157,6 +157,80 @@ class TestEnhancedParserIntegration:
             # Verify legacy analyzer was used
             mock_analyzer.assert_called_once()
     
+    @pytest.mark.parametrize("use_enhanced", [True, False])
+    def test_activities_artifacts_match_across_processes(self, tmp_path, monkeypatch, use_enhanced):
+        """Test that large projects extracted in worker processes match a serial run."""
+        import rpax.artifacts
+
+        config = RpaxConfig(
+            project=ProjectConfig(type=ProjectType.PROCESS),
+            parser=ParserConfig(use_enhanced=use_enhanced)
+        )
+        project_root = tmp_path / "project"
+        project_root.mkdir()
+        workflows = []
+        for index in range(3):
+            name = f"Workflow{index}"
+            (project_root / f"{name}.xaml").write_text(
+                '<Activity xmlns="http://schemas.microsoft.com/netfx/2009/xaml/activities">'
+                f'<Sequence DisplayName="{name}"><Delay DisplayName="Wait {index}" /></Sequence>'
+                '</Activity>',
+                encoding="utf-8",
+            )
+            workflows.append(Workflow(
+                id=f"test-project#{name}#abcd1234",
+                bay_id="test-project",
+                workflow_id=name,
+                content_hash="abcd1234567890123456789012345678",
+                file_path=str(project_root / f"{name}.xaml"),
+                file_name=f"{name}.xaml",
+                relative_path=f"{name}.xaml",
+                discovered_at="2024-01-01T00:00:00Z",
+                file_size=1024,
+                last_modified="2024-01-01T00:00:00Z"
+            ))
+        workflow_index = WorkflowIndex(
+            project_name="TestProject",
+            project_root=str(project_root),
+            scan_timestamp="2024-01-01T00:00:00Z",
+            workflows=workflows,
+            total_workflows=len(workflows),
+            successful_parses=len(workflows),
+            failed_parses=0
+        )
+
+        def generate(output_dir):
+            artifacts = ArtifactGenerator(config, output_dir)._generate_activities_artifacts(
+                workflow_index, project_root
+            )
+            return {name: path.relative_to(output_dir) for name, path in artifacts.items()}
+
+        serial = generate(tmp_path / "serial")
+        monkeypatch.setattr(rpax.artifacts, "_MIN_PARALLEL_WORKFLOWS", 1)
+        monkeypatch.setattr(rpax.artifacts.os, "cpu_count", lambda: 2)
+        parallel = generate(tmp_path / "parallel")
+
+        def content(output_dir, path):
+            lines = (output_dir / path).read_text(encoding="utf-8").splitlines()
+            return [line for line in lines if '"extractedAt"' not in line]
+
+        assert "metrics_Workflow2" in serial
+        assert parallel == serial
+        for path in serial.values():
+            if path.parts[0] != "activities.instances":
+                assert content(tmp_path / "parallel", path) == content(tmp_path / "serial", path)
+
+    @pytest.mark.parametrize(("node_id", "activity_path"), [
+        ("Activity_1", "Activity"),
+        ("Activity/Sequence_2/If_5", "Activity/Sequence/If"),
+        ("Activity/Sequence_2_7/Assign_1a_3", "Activity/Sequence/Assign_1a"),
+    ])
+    def test_node_id_to_activity_path(self, node_id, activity_path):
+        """Test positional counters are stripped from every nodeId component."""
+        from rpax.artifacts import _node_id_to_activity_path
+
+        assert _node_id_to_activity_path(node_id) == activity_path
+
     def test_enhanced_activity_tree_serialization(self, tmp_path):
         """Test that enhanced activity trees are properly serialized."""
         config = RpaxConfig(
@@ -276,4 +350,53 @@ class TestEnhancedXamlAnalyzer:
         
         # Test missing invocation
         assert analyzer._classify_invocation("") == "invoke-missing"
-        assert analyzer._classify_invocation(None) == "invoke-missing"
\ No newline at end of file
+        assert analyzer._classify_invocation(None) == "invoke-missing"
+
+    def test_visual_activity_extraction_handles_deep_nesting(self):
+        """Test deeply nested workflows do not hit the recursion limit."""
+        import sys
+        import xml.etree.ElementTree as ET
+
+        analyzer = EnhancedXamlAnalyzer()
+        depth = sys.getrecursionlimit() + 100
+        root = current = ET.Element("Sequence")
+        for _ in range(depth):
+            current = ET.SubElement(current, "Sequence")
+
+        nodes = analyzer._extract_visual_activities(root)
+
+        assert len(nodes) == depth + 1
+        assert nodes[-1].depth == depth
+        assert nodes[-1].parent_id == nodes[-2].node_id
+
+    def test_sibling_counters_do_not_outlive_a_walk(self):
+        """Test repeated walks on one analyzer start their sibling indices afresh."""
+        import xml.etree.ElementTree as ET
+
+        analyzer = EnhancedXamlAnalyzer()
+        root = ET.fromstring("<Sequence><Sequence/><Sequence/></Sequence>")
+
+        first = [node.node_id for node in analyzer._extract_visual_activities(root)]
+        second = [node.node_id for node in analyzer._extract_visual_activities(root)]
+
+        assert first == second == ["/Sequence[0]", "Sequence/Sequence[0]", "Sequence/Sequence[1]"]
+        assert analyzer.sibling_counters == {}
+
+    def test_calculate_metrics_walks_deep_trees(self):
+        """Test metrics count every node and the depth of deeply nested trees."""
+        import sys
+
+        from rpax.parser.enhanced_xaml_analyzer import EnhancedActivityTree
+
+        depth = sys.getrecursionlimit() + 100
+        root = node = {"nodeId": "0", "children": []}
+        for index in range(1, depth):
+            child = {"nodeId": str(index), "children": []}
+            node["children"].append(child)
+            node = child
+        node["children"].append({"nodeId": "leaf"})
+
+        metrics = EnhancedXamlAnalyzer().calculate_metrics(EnhancedActivityTree({"rootNode": root}))
+
+        assert metrics.total_nodes == depth + 1
+        assert metrics.max_depth == depth + 1
@@ -220,6 +220,41 @@ class TestPseudocodeGenerator:
         # Parent should contain child in its children list
         assert parent_entry.children[0] == child_entry
 
+    def test_generate_pseudocode_entries_keeps_document_order(self):
+        """Test children are emitted under their own parent in document order."""
+
+        def node(node_id, parent_id=None):
+            return EnhancedActivityNode(
+                node_id=node_id,
+                tag=node_id.rpartition("/")[2].split("[")[0],
+                display_name=node_id,
+                path=node_id,
+                depth=node_id.count("/") - 1,
+                is_visual=True,
+                parent_id=parent_id,
+            )
+
+        activities = [
+            node("/Sequence[0]"),
+            node("/Sequence[0]/If[0]", "/Sequence[0]"),
+            node("/Sequence[0]/If[0]/Assign[0]", "/Sequence[0]/If[0]"),
+            node("/Sequence[0]/LogMessage[0]", "/Sequence[0]"),
+            node("/Sequence[0]/If[0]/Assign[1]", "/Sequence[0]/If[0]"),
+        ]
+
+        entries = self.generator._generate_pseudocode_entries(activities)
+
+        assert [(entry.node_id, entry.indent) for entry in entries] == [
+            ("/Sequence[0]", 0),
+            ("/Sequence[0]/If[0]", 1),
+            ("/Sequence[0]/If[0]/Assign[0]", 2),
+            ("/Sequence[0]/If[0]/Assign[1]", 2),
+            ("/Sequence[0]/LogMessage[0]", 1),
+        ]
+        assert [child.node_id for child in entries[0].children] == [
+            entry.node_id for entry in entries[1:]
+        ]
+
     def test_render_as_text(self):
         """Test rendering pseudocode artifact as text."""
         artifact = PseudocodeArtifact(
@@ -0,0 +1,194 @@
+"""Unit tests for rpax.utils.cross_project_access."""
+
+import json
+import random
+import sys
+from difflib import SequenceMatcher
+
+import pytest
+
+from rpax.utils import cross_project_access
+from rpax.utils.cross_project_access import CrossProjectAccessor
+
+
+@pytest.fixture
+def lake_root(tmp_path):
+    """A lake with a lake_index.json describing three projects."""
+    lake_index = {
+        "projects": [
+            {
+                "project_slug": "frozenchlorine-1234abcd",
+                "name": "FrozenChlorine",
+                "display_name": "Frozen Chlorine",
+                "project_type": "process",
+            },
+            {
+                "project_slug": "frozen-helper-5678abcd",
+                "name": "FrozenHelper",
+                "project_type": "library",
+            },
+            {
+                "project_slug": "invoices-9abcdef0",
+                "name": "Invoices",
+                "project_type": "process",
+            },
+        ],
+        "search_indices": {
+            "by_partial_name": {"frozen": ["frozenchlorine-1234abcd", "frozen-helper-5678abcd"]},
+        },
+    }
+    (tmp_path / "lake_index.json").write_text(json.dumps(lake_index), encoding="utf-8")
+    return tmp_path
+
+
+def test_resolve_exact_match_first(lake_root):
+    matches = CrossProjectAccessor(lake_root).resolve_project("invoices")
+
+    assert matches[0].slug == "invoices-9abcdef0"
+    assert matches[0].match_type == "exact"
+    assert matches[0].confidence == 1.0
+
+
+def test_resolve_partial_matches(lake_root):
+    matches = CrossProjectAccessor(lake_root).resolve_project("frozen")
+
+    assert {m.slug for m in matches if m.match_type == "partial"} == {
+        "frozenchlorine-1234abcd",
+        "frozen-helper-5678abcd",
+    }
+
+
+@pytest.mark.parametrize("has_rapidfuzz", [False, True])
+def test_resolve_fuzzy_matches(lake_root, monkeypatch, has_rapidfuzz):
+    if has_rapidfuzz and not cross_project_access.HAS_RAPIDFUZZ:
+        pytest.skip("rapidfuzz not installed")
+    monkeypatch.setattr(cross_project_access, "HAS_RAPIDFUZZ", has_rapidfuzz)
+
+    matches = CrossProjectAccessor(lake_root).resolve_project("invoice")
+
+    assert [(m.slug, m.match_type) for m in matches] == [("invoices-9abcdef0", "fuzzy")]
+    assert matches[0].confidence == pytest.approx(14 / 15)
+
+
+def test_resolve_without_lake_index(tmp_path):
+    assert CrossProjectAccessor(tmp_path).resolve_project("anything") == []
+
+
+@pytest.mark.parametrize(
+    ("query", "candidate"),
+    [("froz", "frozenchlorine"), ("abc", "cab"), ("invoice", "invoices"), ("ab", "abcdefghij"), ("xyz", "xyz")],
+)
+def test_similarity_matches_sequence_matcher_above_cutoff(query, candidate):
+    expected = SequenceMatcher(None, query, candidate).ratio()
+    similarity = cross_project_access._similarity(query, candidate)
+
+    if expected >= cross_project_access.FUZZY_CUTOFF:
+        assert similarity == pytest.approx(expected)
+    else:
+        assert similarity < cross_project_access.FUZZY_CUTOFF
+
+
+def test_fuzzy_confidences_are_identical_with_and_without_rapidfuzz(lake_root, monkeypatch):
+    if not cross_project_access.HAS_RAPIDFUZZ:
+        pytest.skip("rapidfuzz not installed")
+    rng = random.Random(0)
+
+    def word():
+        return "".join(rng.choices("abcde-", k=rng.randint(1, 12)))
+
+    index_path = lake_root / "lake_index.json"
+    lake_index = json.loads(index_path.read_text(encoding="utf-8"))
+    lake_index["projects"] = [{"project_slug": word(), "name": word()} for _ in range(300)]
+    index_path.write_text(json.dumps(lake_index), encoding="utf-8")
+    accessor = CrossProjectAccessor(lake_root)
+    queries = [word() for _ in range(30)]
+
+    with_rapidfuzz = [accessor._fuzzy_confidences(query) for query in queries]
+    monkeypatch.setattr(cross_project_access, "HAS_RAPIDFUZZ", False)
+    without_rapidfuzz = [accessor._fuzzy_confidences(query) for query in queries]
+
+    assert with_rapidfuzz == without_rapidfuzz
+
+
+def test_resolve_exact_match_is_case_insensitive_on_name(lake_root):
+    matches = CrossProjectAccessor(lake_root).resolve_project("FROZENHELPER")
+
+    assert (matches[0].slug, matches[0].match_type) == ("frozen-helper-5678abcd", "exact")
+
+
+def test_project_resources_lookup_by_slug(lake_root):
+    index_path = lake_root / "lake_index.json"
+    lake_index = json.loads(index_path.read_text(encoding="utf-8"))
+    lake_index["projects"][2]["resources"] = {"manifest": "invoices-9abcdef0/manifest.json"}
+    index_path.write_text(json.dumps(lake_index), encoding="utf-8")
+
+    accessor = CrossProjectAccessor(lake_root)
+
+    assert accessor.get_project_resources("invoices-9abcdef0") == {
+        "manifest": "uipath://proj/invoices-9abcdef0/manifest"
+    }
+    assert accessor.get_project_resources("missing") == {}
+    assert accessor.get_project_entry_points("missing") is None
+
+
+def test_lake_index_strings_are_interned(lake_root):
+    projects = CrossProjectAccessor(lake_root)._load_lake_index()["projects"]
+
+    assert projects[0]["project_type"] is projects[2]["project_type"]
+    assert projects[1]["project_slug"] is sys.intern("frozen-helper-5678abcd")
+
+
+def test_resolve_does_not_repeat_slugs(lake_root):
+    index_path = lake_root / "lake_index.json"
+    lake_index = json.loads(index_path.read_text(encoding="utf-8"))
+    lake_index["search_indices"]["by_partial_name"]["invoices"] = ["invoices-9abcdef0"]
+    index_path.write_text(json.dumps(lake_index), encoding="utf-8")
+
+    matches = CrossProjectAccessor(lake_root).resolve_project("invoices")
+
+    assert [m.slug for m in matches] == ["invoices-9abcdef0"]
+
+
+def test_project_match_is_slotted_and_frozen(lake_root):
+    match = CrossProjectAccessor(lake_root).resolve_project("invoices")[0]
+
+    assert not hasattr(match, "__dict__")
+    with pytest.raises(AttributeError):
+        match.confidence = 0.0
+
+
+def test_resolve_breaks_confidence_ties_by_slug(lake_root):
+    index_path = lake_root / "lake_index.json"
+    lake_index = json.loads(index_path.read_text(encoding="utf-8"))
+    lake_index["projects"][0]["name"] = "Shared"
+    lake_index["projects"][1]["name"] = "Shared"
+    index_path.write_text(json.dumps(lake_index), encoding="utf-8")
+
+    matches = CrossProjectAccessor(lake_root).resolve_project("shared")
+
+    assert [m.slug for m in matches] == ["frozen-helper-5678abcd", "frozenchlorine-1234abcd"]
+
+
+@pytest.mark.parametrize("has_rapidfuzz", [False, True])
+def test_resolve_typo_ignores_lake_trigram_index(lake_root, monkeypatch, has_rapidfuzz):
+    if has_rapidfuzz and not cross_project_access.HAS_RAPIDFUZZ:
+        pytest.skip("rapidfuzz not installed")
+    monkeypatch.setattr(cross_project_access, "HAS_RAPIDFUZZ", has_rapidfuzz)
+    index_path = lake_root / "lake_index.json"
+    lake_index = json.loads(index_path.read_text(encoding="utf-8"))
+    lake_index["projects"] = [
+        {"project_slug": "invoices", "name": "invoices", "project_type": "process"},
+        {"project_slug": "invoicer-tools-and-more", "name": "invoicer-tools-and-more", "project_type": "library"},
+    ]
+    index_path.write_text(json.dumps(lake_index), encoding="utf-8")
+    without_index = CrossProjectAccessor(lake_root).resolve_project("invoicer")
+
+    # Projects sharing every trigram of the query are not the only fuzzy candidates
+    lake_index["search_indices"]["trigrams"] = {
+        gram: ["invoicer-tools-and-more"] for gram in ("inv", "nvo", "voi", "oic", "ice", "cer")
+    }
+    index_path.write_text(json.dumps(lake_index), encoding="utf-8")
+    with_index = CrossProjectAccessor(lake_root).resolve_project("invoicer")
+
+    assert with_index == without_index
+    assert [m.slug for m in with_index] == ["invoices", "invoicer-tools-and-more"]
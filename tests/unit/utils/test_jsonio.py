@@ -0,0 +1,118 @@
+"""Unit tests for rpax.utils.jsonio."""
+
+import json
+
+import pytest
+
+from rpax.utils import jsonio
+
+
+def test_loads_accepts_bytes_and_str():
+    assert jsonio.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert jsonio.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_loads_invalid_raises_value_error():
+    with pytest.raises(ValueError):
+        jsonio.loads(b"{not json")
+
+
+@pytest.mark.parametrize("has_orjson", [False, True])
+def test_loads_accepts_bytes_like_objects(monkeypatch, has_orjson):
+    if has_orjson and not jsonio.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonio, "HAS_ORJSON", has_orjson)
+
+    assert jsonio.loads(bytearray(b'{"a": 1}')) == {"a": 1}
+    assert jsonio.loads(memoryview(b'{"a": 1}')) == {"a": 1}
+
+
+def test_load_json_file(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"name": "Ünïcode"}), encoding="utf-8")
+    assert jsonio.load_json_file(path) == {"name": "Ünïcode"}
+
+
+@pytest.mark.parametrize("has_orjson", [False, True])
+def test_load_json_file_memory_maps_large_files(tmp_path, monkeypatch, has_orjson):
+    if has_orjson and not jsonio.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonio, "HAS_ORJSON", has_orjson)
+    monkeypatch.setattr(jsonio, "_MMAP_THRESHOLD", 1)
+    path = tmp_path / "large.json"
+    path.write_text(json.dumps({"items": list(range(100))}), encoding="utf-8")
+    broken = tmp_path / "broken.json"
+    broken.write_bytes(b'{"items": [1, 2')
+
+    assert jsonio.load_json_file(path) == {"items": list(range(100))}
+    with pytest.raises(ValueError):
+        jsonio.load_json_file(broken)
+
+
+def test_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(jsonio, "HAS_ORJSON", False)
+    assert jsonio.loads(b"[1, 2, 3]") == [1, 2, 3]
+
+
+@pytest.mark.parametrize("has_orjson", [False, True])
+def test_dumps_round_trips(monkeypatch, has_orjson):
+    if has_orjson and not jsonio.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonio, "HAS_ORJSON", has_orjson)
+    data = {"name": "Ünïcode", "items": [1, None]}
+
+    assert json.loads(jsonio.dumps(data)) == data
+    assert jsonio.dumps(data, indent=True).decode("utf-8").startswith('{\n  "name": "Ünïcode"')
+    assert jsonio.dumps(object(), default=lambda o: "x") == b'"x"'
+
+
+def test_load_json_file_cached_reuses_until_changed(tmp_path):
+    path = tmp_path / "index.json"
+    path.write_text('{"v": 1}', encoding="utf-8")
+
+    first = jsonio.load_json_file_cached(path)
+    assert jsonio.load_json_file_cached(path) is first
+
+    path.write_text('{"v": 22}', encoding="utf-8")
+    assert jsonio.load_json_file_cached(path) == {"v": 22}
+
+
+def test_cached_load_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(jsonio, "_FILE_CACHE_SIZE", 2)
+    monkeypatch.setattr(jsonio, "_file_cache", jsonio.OrderedDict())
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.json"
+        path.write_text(str(i), encoding="utf-8")
+        paths.append(path)
+        jsonio.load_json_file_cached(path)
+
+    assert [key[0] for key in jsonio._file_cache] == [str(p) for p in paths[1:]]
+
+
+@pytest.mark.parametrize("has_ijson", [False, True])
+def test_verify_json_file(tmp_path, monkeypatch, has_ijson):
+    if has_ijson and not jsonio.HAS_IJSON:
+        pytest.skip("ijson not installed")
+    monkeypatch.setattr(jsonio, "HAS_IJSON", has_ijson)
+    valid = tmp_path / "valid.json"
+    valid.write_text('{"workflows": [{"id": "a"}]}', encoding="utf-8")
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text('{"workflows": [', encoding="utf-8")
+
+    assert jsonio.verify_json_file(valid) is None
+    error = jsonio.verify_json_file(truncated)
+    assert error
+    assert "\n" not in error
+
+
+def test_is_cached(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("[1]", encoding="utf-8")
+
+    assert not jsonio.is_cached(path)
+    jsonio.load_json_file_cached(path)
+    assert jsonio.is_cached(path)
+    path.write_text("[1, 2]", encoding="utf-8")
+    assert not jsonio.is_cached(path)
+    assert not jsonio.is_cached(tmp_path / "missing.json")
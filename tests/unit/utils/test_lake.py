@@ -0,0 +1,82 @@
+"""Unit tests for rpax.utils.lake discovery helpers."""
+
+import json
+
+import pytest
+
+from rpax.utils.lake import (
+    MultipleProjectsFoundError,
+    find_lake_directory,
+    find_workflow_in_project,
+    is_lake_directory,
+    list_project_slugs,
+    resolve_project_slug,
+)
+
+
+def _single_project_lake(root):
+    (root / "manifest.json").write_text("{}", encoding="utf-8")
+    (root / "workflows.index.json").write_text("{}", encoding="utf-8")
+    return root
+
+
+def test_is_lake_directory(tmp_path):
+    assert not is_lake_directory(tmp_path)
+    assert not is_lake_directory(tmp_path / "missing")
+
+    (tmp_path / "projects.json").write_text("{}", encoding="utf-8")
+    assert is_lake_directory(tmp_path)
+
+
+def test_find_lake_directory_checks_candidates(tmp_path):
+    lake = tmp_path / ".rpax-lake"
+    lake.mkdir()
+    _single_project_lake(lake)
+    project = tmp_path / "project"
+    project.mkdir()
+
+    assert find_lake_directory(tmp_path) == lake.resolve()
+    assert find_lake_directory(project) == lake.resolve()
+    assert find_lake_directory(lake) == lake.resolve()
+
+
+def test_find_lake_directory_none(tmp_path):
+    (tmp_path / "empty").mkdir()
+    assert find_lake_directory(tmp_path / "empty") is None
+
+
+def test_list_project_slugs_single_project(tmp_path):
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+    (tmp_path / "other").mkdir()
+    project = tmp_path / "my-project-1234abcd"
+    project.mkdir()
+    (project / "manifest.json").write_text("{}", encoding="utf-8")
+
+    assert list_project_slugs(tmp_path) == ["my-project-1234abcd"]
+
+
+def test_resolve_project_slug_reports_ambiguous_hint(tmp_path, capsys):
+    projects = {"projects": [{"slug": "alpha-1"}, {"slug": "alpha-2"}, {"slug": "beta-3"}]}
+    (tmp_path / "projects.json").write_text(json.dumps(projects), encoding="utf-8")
+
+    assert resolve_project_slug(tmp_path, "beta") == "beta-3"
+    with pytest.raises(MultipleProjectsFoundError):
+        resolve_project_slug(tmp_path, "alpha")
+    assert "alpha-2" in capsys.readouterr().out
+
+
+def test_find_workflow_in_project_lookup_order(tmp_path):
+    workflows = [
+        {"id": "p#Main.xaml#1", "fileName": "Main.xaml", "relativePath": "Main.xaml", "displayName": "Main"},
+        {"id": "p#Sub/Login.xaml#2", "fileName": "Login.xaml", "relativePath": "Sub/Login.xaml",
+         "displayName": "Log In"},
+        {"id": "p#Main.xaml#3", "fileName": "Main.xaml", "relativePath": "Other/Main.xaml"},
+    ]
+    (tmp_path / "workflows.index.json").write_text(json.dumps({"workflows": workflows}), encoding="utf-8")
+
+    assert find_workflow_in_project(tmp_path, "p#Main.xaml#3")["relativePath"] == "Other/Main.xaml"
+    assert find_workflow_in_project(tmp_path, "Main.xaml")["id"] == "p#Main.xaml#1"
+    assert find_workflow_in_project(tmp_path, "sub/")["fileName"] == "Login.xaml"
+    assert find_workflow_in_project(tmp_path, "LOG IN")["fileName"] == "Login.xaml"
+    assert find_workflow_in_project(tmp_path, "missing") is None
+    assert find_workflow_in_project(tmp_path / "nowhere", "Main.xaml") is None
@@ -0,0 +1,37 @@
+"""Unit tests for rpax.utils.xmlio."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+from defusedxml import EntitiesForbidden
+
+from rpax.utils import xmlio
+
+WORKFLOW = '<?xml version="1.0" encoding="utf-8"?><Activity xmlns="urn:a"><Sequence DisplayName="Ü" /></Activity>'
+
+ENTITY_BOMB = '<?xml version="1.0"?><!DOCTYPE r [<!ENTITY a "aaaa"><!ENTITY b "&a;&a;">]><r>&b;</r>'
+
+
+def test_parse_xml_accepts_bytes_and_str():
+    for data in (WORKFLOW.encode("utf-8"), WORKFLOW.replace(' encoding="utf-8"', "")):
+        root = xmlio.parse_xml(data)
+        assert root.tag == "{urn:a}Activity"
+        assert root[0].get("DisplayName") == "Ü"
+
+
+@pytest.mark.parametrize("data", [ENTITY_BOMB, ENTITY_BOMB.encode("utf-8"), ENTITY_BOMB.encode("utf-16")])
+def test_parse_xml_rejects_entity_declarations(data):
+    with pytest.raises(EntitiesForbidden):
+        xmlio.parse_xml(data)
+
+
+def test_parse_xml_file(tmp_path):
+    path = tmp_path / "Main.xaml"
+    path.write_text(WORKFLOW.replace("utf-8", "utf-16"), encoding="utf-16")
+
+    assert xmlio.parse_xml_file(path)[0].get("DisplayName") == "Ü"
+
+
+def test_parse_xml_invalid_raises_parse_error():
+    with pytest.raises(ET.ParseError):
+        xmlio.parse_xml(b"<Activity>")
@@ -1,6 +1,7 @@
 """Tests for validation framework core functionality."""
 
 import json
+import sys
 
 import pytest
 
@@ -109,6 +110,13 @@ class TestValidationIssue:
         expected = "[FAIL] test_rule: Test error in test.json"
         assert str(issue) == expected
 
+    def test_issue_is_slotted_and_frozen(self):
+        issue = ValidationIssue("test_rule", ValidationStatus.WARN, "Test warning")
+
+        assert not hasattr(issue, "__dict__")
+        with pytest.raises(AttributeError):
+            issue.message = "changed"
+
 
 class TestValidationResult:
     """Test ValidationResult class."""
@@ -165,6 +173,20 @@ class TestValidationResult:
         assert issue["artifact"] == "test.json"
         assert issue["path"] == "$.path"
 
+    @pytest.mark.parametrize("has_orjson", [False, True])
+    def test_to_json_bytes_matches_to_dict(self, monkeypatch, has_orjson):
+        from rpax.utils import jsonio
+
+        if has_orjson and not jsonio.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(jsonio, "HAS_ORJSON", has_orjson)
+        result = ValidationResult(status=ValidationStatus.PASS)
+        result.add_issue("test", ValidationStatus.FAIL, "Tést message", path="$.path")
+        result.increment_counter("test_count")
+
+        assert json.loads(result.to_json_bytes()) == result.to_dict()
+        assert json.loads(result.to_json_bytes(indent=True)) == result.to_dict()
+
 
 class TestArtifactSet:
     """Test ArtifactSet class."""
@@ -188,6 +210,63 @@ class TestArtifactSet:
         # Check invocations
         assert artifacts.invocations[0]["kind"] == "invoke"
 
+    @pytest.mark.parametrize("mmap_threshold", [16 * 1024 * 1024, 0])
+    def test_load_invocations_skips_comments_and_malformed(
+        self, tmp_path, monkeypatch, mmap_threshold
+    ):
+        monkeypatch.setattr(
+            "rpax.validation.framework._MMAP_THRESHOLD", mmap_threshold
+        )
+        (tmp_path / "invocations.jsonl").write_bytes(
+            b'# header\n'
+            b'{"kind": "invoke", "from": "a", "to": "b"}\r\n'
+            b'\n'
+            b'{broken\n'
+            b'  {"kind": "invoke-missing", "from": "a", "to": "c"}'
+        )
+
+        artifacts = ArtifactSet.load(tmp_path)
+
+        assert [i["kind"] for i in artifacts.invocations] == ["invoke", "invoke-missing"]
+
+    def test_load_clean_invocations(self, tmp_path):
+        (tmp_path / "invocations.jsonl").write_bytes(
+            b'{"kind": "invoke", "from": "a", "to": "b"}\r\n'
+            b'{"kind": "invoke-dynamic", "from": "a", "to": "c"}'
+        )
+
+        artifacts = ArtifactSet.load(tmp_path)
+
+        assert [i["kind"] for i in artifacts.invocations] == ["invoke", "invoke-dynamic"]
+
+    def test_empty_invocations_file_is_not_read(self, tmp_path, monkeypatch):
+        (tmp_path / "invocations.jsonl").write_bytes(b"")
+        monkeypatch.setattr(
+            "rpax.validation.framework._load_invocations",
+            lambda path: pytest.fail("empty invocations.jsonl was read"),
+        )
+
+        assert ArtifactSet.load(tmp_path).invocations == []
+
+    def test_invocation_fields_are_interned(self, artifacts_dir):
+        (artifacts_dir / "invocations.jsonl").write_bytes(
+            b'{"kind": "invoke", "from": "proj#Main.xaml#1", "to": "proj#Helper.xaml#2"}\n'
+            b'{"kind": "invoke", "from": "proj#Main.xaml#1", "to": "proj#Other.xaml#3"}\n'
+        )
+
+        first, second = ArtifactSet.load(artifacts_dir).invocations
+
+        assert first["from"] is second["from"]
+        assert first["to"] is sys.intern("proj#Helper.xaml#2")
+        assert first["kind"] is second["kind"] is sys.intern("invoke")
+
+    def test_known_workflow_ids(self, artifacts_dir, tmp_path):
+        artifacts = ArtifactSet.load(artifacts_dir)
+
+        assert artifacts.known_workflow_ids == frozenset({"test-project-abc123#Main.xaml#def456"})
+        assert artifacts.known_workflow_ids is artifacts.known_workflow_ids
+        assert ArtifactSet(tmp_path / "empty").known_workflow_ids == frozenset()
+
     def test_load_missing_files(self, tmp_path):
         # Load from empty directory
         artifacts = ArtifactSet.load(tmp_path)
@@ -283,3 +362,193 @@ class TestValidationFramework:
 
         for expected in expected_rules:
             assert expected in rule_names
+
+    def test_parallel_rules_merge_in_rule_order(self, sample_config, artifacts_dir):
+        import threading
+
+        framework = ValidationFramework(sample_config)
+        thread_names = {}
+
+        class OrderedRule:
+            def __init__(self, name, thread_safe=True):
+                self._name = name
+                self.thread_safe = thread_safe
+
+            @property
+            def name(self):
+                return self._name
+
+            def validate(self, artifacts_dir, config, result):
+                thread_names[self._name] = threading.current_thread().name
+                result.add_issue(self._name, ValidationStatus.WARN, "Ordered warning")
+                result.increment_counter("rules_executed")
+
+        for index in range(4):
+            framework.add_rule(OrderedRule(f"rule_{index}", thread_safe=index != 2))
+        result = framework.validate(artifacts_dir)
+
+        assert [issue.rule for issue in result.issues] == ["rule_0", "rule_1", "rule_2", "rule_3"]
+        assert result.counters["rules_executed"] == 4
+        assert result.status == ValidationStatus.WARN
+        assert thread_names["rule_2"] == threading.current_thread().name
+
+    def test_rules_run_concurrently_regardless_of_cpu_count(self, sample_config, artifacts_dir,
+                                                            monkeypatch):
+        import threading
+
+        from rpax.validation.framework import ValidationRule
+
+        monkeypatch.setattr("os.cpu_count", lambda: 1)
+        framework = ValidationFramework(sample_config)
+        barrier = threading.Barrier(2, timeout=5)
+
+        class WaitingRule(ValidationRule):
+            def __init__(self, name):
+                self._name = name
+
+            @property
+            def name(self):
+                return self._name
+
+            def validate(self, artifacts_dir, config, result):
+                barrier.wait()
+                result.increment_counter("rules_executed")
+
+        framework.add_rule(WaitingRule("first"))
+        framework.add_rule(WaitingRule("second"))
+
+        result = framework.validate(artifacts_dir)
+
+        assert result.counters == {"rules_executed": 2}
+
+    def test_rule_without_entry_point_is_rejected_at_definition(self):
+        from rpax.validation.framework import ValidationRule
+
+        with pytest.raises(TypeError, match="validate_artifacts"):
+            class IncompleteRule(ValidationRule):
+                @property
+                def name(self):
+                    return "incomplete"
+
+    def test_merge_promotes_status(self):
+        result = ValidationResult(status=ValidationStatus.WARN)
+        other = ValidationResult(status=ValidationStatus.FAIL, counters={"checked": 2})
+        result.increment_counter("checked")
+
+        result.merge(other)
+
+        assert result.status == ValidationStatus.FAIL
+        assert result.counters == {"checked": 3}
+
+    def test_rules_share_one_artifact_set(self, sample_config, artifacts_dir):
+        from rpax.validation.framework import ValidationRule
+
+        framework = ValidationFramework(sample_config)
+        seen = []
+
+        class SharedRule(ValidationRule):
+            def __init__(self, name):
+                self._name = name
+
+            @property
+            def name(self):
+                return self._name
+
+            def validate_artifacts(self, artifacts, config, result):
+                seen.append(artifacts)
+
+        framework.add_rule(SharedRule("first"))
+        framework.add_rule(SharedRule("second"))
+        result = framework.validate(artifacts_dir)
+
+        assert result.status == ValidationStatus.PASS
+        assert len(seen) == 2
+        assert seen[0] is seen[1]
+        assert seen[0].artifacts_dir == artifacts_dir
+
+    def test_default_rules_parse_each_artifact_once(self, sample_config, artifacts_dir, monkeypatch):
+        from rpax.utils import jsonio
+
+        parsed = []
+        load_json_file = jsonio.load_json_file
+
+        def counting_load(path):
+            parsed.append(path.name)
+            return load_json_file(path)
+
+        monkeypatch.setattr(jsonio, "load_json_file", counting_load)
+        framework = ValidationFramework(sample_config)
+        framework.create_default_rules()
+        framework.validate(artifacts_dir)
+
+        assert sorted(parsed) == ["manifest.json", "workflows.index.json"]
+
+    def test_default_rules_report_invalid_manifest(self, sample_config, artifacts_dir):
+        (artifacts_dir / "manifest.json").write_text("{not json", encoding="utf-8")
+        framework = ValidationFramework(sample_config)
+        framework.create_default_rules()
+
+        result = framework.validate(artifacts_dir)
+
+        assert result.status == ValidationStatus.FAIL
+        assert any(
+            issue.rule == "artifacts_presence" and "Invalid JSON" in issue.message
+            for issue in result.issues
+        )
+
+    def test_invocation_rules_share_one_pass(self, sample_config, artifacts_dir):
+        from rpax.validation import InvocationRule, InvocationVisitor
+
+        seen = []
+
+        class CountingRule(InvocationRule):
+            def __init__(self, name, fail=False):
+                self._name = name
+                self._fail = fail
+
+            @property
+            def name(self):
+                return self._name
+
+            def invocation_visitor(self, artifacts, config, result):
+                def on_invocation(i, invocation):
+                    if self._fail:
+                        raise ValueError("boom")
+                    seen.append((self._name, i))
+                    result.increment_counter(f"{self._name}_seen")
+
+                return InvocationVisitor(on_invocation, lambda: result.increment_counter("finished"))
+
+        framework = ValidationFramework(sample_config)
+        framework.add_rule(CountingRule("first"))
+        framework.add_rule(CountingRule("broken", fail=True))
+        framework.add_rule(CountingRule("second"))
+        result = framework.validate(artifacts_dir)
+
+        assert seen == [("first", 0), ("second", 0)]
+        assert result.counters == {"first_seen": 1, "second_seen": 1, "finished": 2}
+        assert [issue.rule for issue in result.issues] == ["broken"]
+        assert "Rule execution failed: boom" in result.issues[0].message
+
+    def test_default_rules_without_invocations(self, sample_config, artifacts_dir):
+        (artifacts_dir / "invocations.jsonl").write_bytes(b"")
+        framework = ValidationFramework(sample_config)
+        framework.create_default_rules()
+
+        result = framework.validate(artifacts_dir)
+
+        assert result.counters["known_workflows"] == 1
+        assert result.counters["cycles_detected"] == 0
+        assert not any(name.startswith(("kind_", "invocations_")) for name in result.counters)
+
+    def test_invocation_walker_feeds_default_rules(self, sample_config, artifacts_dir):
+        from rpax.validation import InvocationWalker
+        from rpax.validation.rules import ArgumentsPresenceRule, KindsBoundedRule
+
+        walker = InvocationWalker(ArtifactSet.load(artifacts_dir), sample_config)
+        kinds = walker.add(KindsBoundedRule())
+        arguments = walker.add(ArgumentsPresenceRule())
+        walker.run()
+
+        assert kinds.counters == {"kind_invoke": 1}
+        assert arguments.counters == {"invocations_without_arguments": 1}
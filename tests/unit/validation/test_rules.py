@@ -123,6 +123,21 @@ class TestArtifactsPresenceRule:
         assert "Invalid JSON" in result.issues[0].message
 
 
+    def test_large_artifacts_are_streamed(self, sample_config, artifacts_dir, monkeypatch):
+        monkeypatch.setattr("rpax.validation.rules._STREAM_VERIFY_THRESHOLD", 0)
+        (artifacts_dir / "workflows.index.json").write_text('{"workflows": [', encoding="utf-8")
+
+        rule = ArtifactsPresenceRule()
+        result = ValidationResult(status=ValidationStatus.PASS)
+
+        rule.validate(artifacts_dir, sample_config, result)
+
+        assert result.counters["artifacts_valid"] == 1
+        assert len(result.issues) == 1
+        assert result.issues[0].artifact == "workflows.index.json"
+        assert "Invalid JSON" in result.issues[0].message
+
+
 class TestProvenanceRule:
     """Test ProvenanceRule."""
 
@@ -182,6 +197,68 @@ class TestRootsResolvableRule:
         assert len(result.issues) == 2  # main workflow missing twice (main + entry point)
 
 
+    def test_entry_points_share_directory_listing(self, sample_config, artifacts_dir, monkeypatch):
+        import os
+
+        project_dir = artifacts_dir / "project"
+        (project_dir / "Sub").mkdir()
+        (project_dir / "Sub" / "A.xaml").write_text("<Activity/>", encoding="utf-8")
+        (project_dir / "Sub" / "B.xaml").write_text("<Activity/>", encoding="utf-8")
+        manifest = json.loads((artifacts_dir / "manifest.json").read_text(encoding="utf-8"))
+        manifest["entryPoints"] = [
+            {"filePath": "Main.xaml"},
+            {"filePath": "Sub/A.xaml"},
+            {"filePath": "Sub/B.xaml"},
+            {"filePath": "Sub/Missing.xaml"},
+            {"filePath": "Gone/C.xaml"},
+        ]
+        (artifacts_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+        scanned = []
+        scandir = os.scandir
+
+        def counting_scandir(path):
+            scanned.append(path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        rule = RootsResolvableRule()
+        result = ValidationResult(status=ValidationStatus.PASS)
+
+        rule.validate(artifacts_dir, sample_config, result)
+
+        assert result.counters["roots_resolved"] == 4  # main + three entry points
+        assert [issue.path for issue in result.issues] == [
+            "$.entryPoints[3].filePath",
+            "$.entryPoints[4].filePath",
+        ]
+        assert len(scanned) == 3  # project root, Sub, Gone
+
+    def test_directory_spellings_share_listing(self, tmp_path, monkeypatch):
+        import os
+
+        from rpax.validation.rules import _DirectoryListings
+
+        (tmp_path / "Sub").mkdir()
+        (tmp_path / "Sub" / "a.xaml").write_text("<Activity/>", encoding="utf-8")
+        (tmp_path / "Sub" / "b.xaml").write_text("<Activity/>", encoding="utf-8")
+        scanned = []
+        scandir = os.scandir
+
+        def counting_scandir(path):
+            scanned.append(path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        # Simulate Windows path semantics
+        monkeypatch.setattr(os.path, "normcase", str.lower)
+        listings = _DirectoryListings()
+
+        assert listings.exists(os.path.join(str(tmp_path), "Sub", "A.xaml"))
+        assert listings.exists(os.path.join(str(tmp_path), "SUB", "B.xaml"))
+        assert len(scanned) == 1
+
+
 class TestReferentialIntegrityRule:
     """Test ReferentialIntegrityRule."""
 
@@ -352,3 +429,69 @@ class TestCycleDetectionRule:
         assert result.status == ValidationStatus.WARN
         assert len(result.issues) == 1
         assert result.counters["cycles_detected"] == 1
+
+    def test_reports_every_cycle(self, sample_config, artifacts_dir):
+        # Two separate cycles plus a self-invocation; all share a DFS root
+        invocations = [
+            {"kind": "invoke", "from": "A", "to": "B"},
+            {"kind": "invoke", "from": "B", "to": "A"},
+            {"kind": "invoke", "from": "A", "to": "C"},
+            {"kind": "invoke", "from": "C", "to": "D"},
+            {"kind": "invoke", "from": "D", "to": "C"},
+            {"kind": "invoke", "from": "D", "to": "D"},
+            {"kind": "invoke", "from": "E", "to": "E"},
+        ]
+
+        with open(artifacts_dir / "invocations.jsonl", "w") as f:
+            for invocation in invocations:
+                f.write(json.dumps(invocation) + "\n")
+
+        rule = CycleDetectionRule()
+        result = ValidationResult(status=ValidationStatus.PASS)
+
+        rule.validate(artifacts_dir, sample_config, result)
+
+        assert result.counters["cycles_detected"] == 3
+        assert [issue.message for issue in result.issues] == [
+            "Cycle detected: A -> B -> A",
+            "Cycle detected: C -> D -> C",
+            "Cycle detected: E -> E",
+        ]
+
+    def test_deep_chain_without_recursion_limit(self, sample_config, artifacts_dir):
+        depth = 5000
+        with open(artifacts_dir / "invocations.jsonl", "w") as f:
+            for i in range(depth):
+                f.write(json.dumps({"kind": "invoke", "from": f"W{i}", "to": f"W{i + 1}"}) + "\n")
+            f.write(json.dumps({"kind": "invoke", "from": f"W{depth}", "to": "W0"}) + "\n")
+
+        rule = CycleDetectionRule()
+        result = ValidationResult(status=ValidationStatus.PASS)
+
+        rule.validate(artifacts_dir, sample_config, result)
+
+        assert result.counters["cycles_detected"] == 1
+        assert result.issues[0].message.startswith("Cycle detected: W0 -> W1 -> W2")
+        assert result.issues[0].message.endswith("-> W0")
+
+    def test_component_larger_than_reported_cycle(self, sample_config, artifacts_dir):
+        invocations = [
+            {"kind": "invoke", "from": "A", "to": "B"},
+            {"kind": "invoke", "from": "B", "to": "A"},
+            {"kind": "invoke", "from": "B", "to": "C"},
+            {"kind": "invoke", "from": "C", "to": "B"},
+        ]
+
+        with open(artifacts_dir / "invocations.jsonl", "w") as f:
+            for invocation in invocations:
+                f.write(json.dumps(invocation) + "\n")
+
+        rule = CycleDetectionRule()
+        result = ValidationResult(status=ValidationStatus.PASS)
+
+        rule.validate(artifacts_dir, sample_config, result)
+
+        assert result.counters["cycles_detected"] == 1
+        assert result.issues[0].message == (
+            "Cycle detected: A -> B -> A (3 workflows mutually reachable)"
+        )